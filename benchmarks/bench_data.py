@@ -0,0 +1,85 @@
+"""Time the parsing of a large ~A section.
+
+Builds whitespace-delimited data lines in memory and times
+:func:`lascheck.reader.read_data_section` on them, then times the
+:class:`lascheck.data.DataSummary` used by the data rules on an array of
+``--summary-rows`` rows, added ``--summary-block`` rows at a time as
+:func:`lascheck.reader.iter_data_chunks` does.
+
+Usage::
+
+    python benchmarks/bench_data.py [--rows 500000] [--curves 10] [--repeat 3]
+                                    [--summary-rows 10000000]
+                                    [--summary-block 65536]
+
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from lascheck import reader
+from lascheck.data import DataSummary
+
+
+def make_data_lines(n_rows, n_curves):
+    """Return **n_rows** data lines with **n_curves** values on each."""
+    rng = np.random.default_rng(0)
+    data = rng.normal(loc=100, scale=50, size=(n_rows, n_curves))
+    data[:, 0] = 1000 + np.arange(n_rows) * 0.125
+    data[::97, 1:] = -999.25
+    return [" ".join("%10.4f" % value for value in row) for row in data]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=500000)
+    parser.add_argument("--curves", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--summary-rows", type=int, default=10000000)
+    parser.add_argument("--summary-block", type=int, default=65536)
+    args = parser.parse_args()
+
+    lines = make_data_lines(args.rows, args.curves)
+    megabytes = sum(len(line) + 1 for line in lines) / 1e6
+    regexp_subs, value_null_subs, version_NULL = reader.get_substitutions(
+        "default", "strict"
+    )
+    value_null_subs.append(-999.25)
+
+    best = min(
+        timeit.repeat(
+            lambda: reader.read_data_section(
+                lines, args.curves, regexp_subs, value_null_subs
+            ),
+            number=1,
+            repeat=args.repeat,
+        )
+    )
+    print(
+        "read_data_section: {:.1f} MB in {:.3f} s, {:.1f} MB/s".format(
+            megabytes, best, megabytes / best
+        )
+    )
+
+    data = np.empty((args.summary_rows, 2))
+    data[:, 0] = 1000 + np.arange(args.summary_rows) * 0.125
+    data[:, 1] = 1.0
+
+    def summarize():
+        summary = DataSummary(2)
+        for start in range(0, len(data), args.summary_block):
+            summary.add_rows(data[start : start + args.summary_block])
+
+    best = min(timeit.repeat(summarize, number=1, repeat=args.repeat))
+    print(
+        "DataSummary: {} rows in {:.1f} ms".format(args.summary_rows, best * 1e3)
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""Time the parsing of very long header sections.
+
+Some service companies write ~P sections with tens of thousands of
+parameters. This builds such a section in memory and times
+:func:`lascheck.reader.read_header_line` on each line, alone and together
+with the creation of the header items, along with the old regular
+expression tokenizer for comparison.
+
+It also times :func:`lascheck.reader.parse_header_section` on sections of
+``--items`` items, and appending as many items to a SectionItems one at a
+time (both items made beforehand, and curves made in the same loop), with
+unique mnemonics and with array curves which repeat each mnemonic
+``--group`` times (RES:1 to RES:500, etc.).
+
+Usage::
+
+    python benchmarks/bench_header.py [--lines 20000] [--items 10000]
+                                      [--group 500] [--repeat 5]
+
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lascheck import reader
+from lascheck.las_items import CurveItem, HeaderItem, SectionItems
+
+
+def make_parameter_section(n_lines):
+    """Return a raw ~P section dict with **n_lines** parameter lines."""
+    lines = []
+    for i in range(n_lines):
+        if i % 3 == 0:
+            line = "PAR{0:05d}.M          {1:.4f} : Parameter number {0}".format(i, i * 0.5)
+        elif i % 3 == 1:
+            line = "PAR{0:05d}.         {0}      : Integer parameter".format(i)
+        else:
+            line = "PAR{0:05d}.     SOME TEXT,VALUE : Text parameter {0}".format(i)
+        lines.append(line)
+    return {
+        "section_type": "header",
+        "title": "~Parameter Information Block",
+        "lines": lines,
+        "line_nos": list(range(1, n_lines + 1)),
+    }
+
+
+def make_curve_section(n_items, group=1):
+    """Return a raw ~C section dict with **n_items** curves, each mnemonic
+    repeated **group** times."""
+    lines = [
+        "C{:05d}.OHMM            : Array channel {}".format(i // group, i)
+        for i in range(n_items)
+    ]
+    return {
+        "section_type": "header",
+        "title": "~Curve Information",
+        "lines": lines,
+        "line_nos": list(range(1, n_items + 1)),
+    }
+
+
+def append_items(items):
+    section = SectionItems()
+    for item in items:
+        section.append(item)
+    return section
+
+
+def create_and_append_curves(mnemonics):
+    section = SectionItems()
+    for mnemonic in mnemonics:
+        section.append(CurveItem(mnemonic, "OHMM"))
+    return section
+
+
+def read_header_line_regex(line):
+    if not ":" in line:
+        return reader.read_header_line(line, pattern=reader.HEADER_LINE_RE)
+    else:
+        return reader.read_header_line(line, pattern=reader.HEADER_LINE_DESCR_RE)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=20000)
+    parser.add_argument("--items", type=int, default=10000)
+    parser.add_argument("--group", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    sectdict = make_parameter_section(args.lines)
+    lines = sectdict["lines"]
+    item_parser = reader.SectionParser(sectdict["title"], version=2.0)
+    timings = [
+        ("read_header_line", lambda: [reader.read_header_line(l) for l in lines]),
+        (
+            "read_header_line (regex)",
+            lambda: [read_header_line_regex(l) for l in lines],
+        ),
+        (
+            "read_header_line + items",
+            lambda: [item_parser(**reader.read_header_line(l)) for l in lines],
+        ),
+    ]
+    for name, func in timings:
+        best = min(timeit.repeat(func, number=1, repeat=args.repeat))
+        print(
+            "{:<28} {:>8.1f} ms  {:>8.2f} us/line".format(
+                name, best * 1e3, best * 1e6 / args.lines
+            )
+        )
+
+    for group in (1, args.group):
+        curves = make_curve_section(args.items, group)
+        mnemonics = ["C{:05d}".format(i // group) for i in range(args.items)]
+        items = [HeaderItem(mnemonic) for mnemonic in mnemonics]
+        timings = [
+            (
+                "parse_header_section",
+                lambda: reader.parse_header_section(curves, version=2.0),
+            ),
+            ("SectionItems.append", lambda: append_items(items)),
+            ("CurveItem + append", lambda: create_and_append_curves(mnemonics)),
+        ]
+        for name, func in timings:
+            best = min(timeit.repeat(func, number=1, repeat=args.repeat))
+            print(
+                "{:<28} {:>8.1f} ms  {:>8.2f} us/item  ({} items, {} per mnemonic)".format(
+                    name, best * 1e3, best * 1e6 / args.items, args.items, group
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Time ``import lascheck`` in a new interpreter.
+
+Runs ``python -X importtime -c "import lascheck"`` ``--repeat`` times, with
+compiled bytecode as for an installed package, and reports the best and
+median time spent importing lascheck and the modules it imports. The first
+run, which compiles the bytecode, is not counted.
+
+Usage::
+
+    python benchmarks/bench_import.py [--repeat 10]
+
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_time(env):
+    """Return the milliseconds spent importing lascheck in a new process."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import lascheck"],
+        cwd=package_dir,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    ).stderr
+    line = [line for line in stderr.splitlines() if line.endswith("| lascheck")][0]
+    return int(line.split("|")[1]) / 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as pycache:
+        env = dict(os.environ)
+        env.pop("PYTHONDONTWRITEBYTECODE", None)
+        env["PYTHONPYCACHEPREFIX"] = pycache
+        import_time(env)
+        times = [import_time(env) for i in range(args.repeat)]
+    print(
+        "import lascheck: best {:.1f} ms, median {:.1f} ms".format(
+            min(times), statistics.median(times)
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Measure the memory used by header items and curves.
+
+This creates many items of each class with :func:`tracemalloc` running, and
+reports the memory and time taken per item by HeaderItem and CurveItem, and
+by the slotted CompactHeaderItem and CompactCurveItem which a file read with
+``compact_items=True`` is made of. The strings the items hold are created
+beforehand, so only the items themselves are counted.
+
+Usage::
+
+    python benchmarks/bench_items.py [--items 100000] [--repeat 3]
+
+"""
+import argparse
+import gc
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lascheck.las_items import CompactCurveItem, CompactHeaderItem, CurveItem, HeaderItem
+
+
+def make_fields(n_items):
+    """Return the (mnemonic, unit, value, descr) of **n_items** items."""
+    return [
+        ("PAR{:06d}".format(i), "M", i * 0.5, "Parameter number {}".format(i))
+        for i in range(n_items)
+    ]
+
+
+def measure(item_class, fields):
+    """Return the bytes allocated for the items, and the items."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        items = [item_class(*f) for f in fields]
+        return tracemalloc.get_traced_memory()[0], items
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    fields = make_fields(args.items)
+    results = {}
+    for item_class in (HeaderItem, CompactHeaderItem, CurveItem, CompactCurveItem):
+        nbytes, items = measure(item_class, fields)
+        del items
+        best = min(
+            timeit.repeat(
+                lambda: [item_class(*f) for f in fields], number=1, repeat=args.repeat
+            )
+        )
+        results[item_class] = nbytes
+        print(
+            "{:<20} {:>8.1f} bytes/item  {:>8.2f} us/item".format(
+                item_class.__name__, nbytes / args.items, best * 1e6 / args.items
+            )
+        )
+    for item_class, compact_class in (
+        (HeaderItem, CompactHeaderItem),
+        (CurveItem, CompactCurveItem),
+    ):
+        print(
+            "{} saves {:.1f} bytes/item ({:.0%})".format(
+                compact_class.__name__,
+                (results[item_class] - results[compact_class]) / args.items,
+                1 - results[compact_class] / results[item_class],
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
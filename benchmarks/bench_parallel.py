@@ -0,0 +1,79 @@
+"""Time the parsing of the ~A section of a large file on several cores.
+
+Writes a synthetic file of ``--rows`` rows (see :mod:`synthetic`) and times
+``lascheck.read(path, check_data=True, data_workers=n)``, with the data and
+the conformity checks which parse it, for each ``n`` of ``--workers``. It
+reports the rate and the speed-up over one worker, which parses the section
+in this process as a file read without ``data_workers`` is. The speed-up can
+only be seen on a machine with as many cores as workers, so the number of
+CPUs is printed first.
+
+Usage::
+
+    python benchmarks/bench_parallel.py [--rows 2000000] [--curves 10]
+                                        [--workers 1 2 4 8] [--repeat 3]
+                                        [--chunk-bytes 8388608] [--keep PATH]
+
+"""
+import argparse
+import os
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import lascheck
+from lascheck import parallel
+
+from synthetic import write_las
+
+
+def read(path, workers):
+    las = lascheck.read(path, check_data=True, data_workers=workers)
+    las.get_non_conformities()
+    return las.data
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2000000)
+    parser.add_argument("--curves", type=int, default=10)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--chunk-bytes", type=int, default=parallel.CHUNK_BYTES)
+    parser.add_argument("--keep", help="write the file here and keep it")
+    args = parser.parse_args()
+
+    parallel.CHUNK_BYTES = args.chunk_bytes
+    if args.keep:
+        path = args.keep
+    else:
+        fd, path = tempfile.mkstemp(suffix=".las")
+        os.close(fd)
+    try:
+        megabytes = write_las(path, rows=args.rows, curves=args.curves) / 1e6
+        print("{} CPUs, {:.1f} MB file".format(os.cpu_count(), megabytes))
+        first = None
+        for workers in args.workers:
+            best = min(
+                timeit.repeat(
+                    lambda: read(path, workers),
+                    number=1,
+                    repeat=args.repeat,
+                )
+            )
+            if first is None:
+                first = best
+            print(
+                "{:3d} workers: {:.3f} s, {:.1f} MB/s, {:.2f}x".format(
+                    workers, best, megabytes / best, first / best
+                )
+            )
+    finally:
+        if not args.keep:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+"""Time lascheck and measure its peak memory on synthetic LAS files.
+
+Each case in :data:`CASES` is a file generated by ``synthetic.py``. For each
+file this times (the best of ``--repeat`` runs) and measures the peak memory
+allocated by (with :mod:`tracemalloc`, in a separate run):
+
+* ``open_file`` - :func:`lascheck.reader.open_file`, i.e. finding the encoding
+* ``read_file_contents`` - splitting the decoded file into raw sections
+* ``parse_header_section`` - parsing the ~V, ~W, ~C and ~P sections
+* ``rules`` - running :data:`lascheck.spec.RULES` and
+  :data:`lascheck.spec.DATA_RULES` on a file which has already been read
+* ``read`` - ``lascheck.read(path).get_non_conformities()``
+* ``validate`` - ``lascheck.validate(path, check_data=True)``
+
+The results can be saved with ``--output`` and compared with a saved run
+with ``--compare``, which exits with status 1 if any time or peak memory has
+grown by more than ``--tolerance``.
+
+Usage::
+
+    python benchmarks/bench_suite.py [--scale 1.0] [--repeat 3]
+                                     [--cases long,wide] [--dir DIR]
+                                     [--output results.json]
+                                     [--compare baseline.json]
+                                     [--tolerance 0.25] [--min-seconds 0.001]
+
+"""
+import argparse
+import collections
+import json
+import logging
+import os
+import platform
+import sys
+import tempfile
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import lascheck
+from lascheck import reader, report, spec
+
+import synthetic
+
+CASES = collections.OrderedDict(
+    [
+        ("small", dict(curves=8, rows=2000)),
+        ("long", dict(curves=10, rows=200000)),
+        ("wide", dict(curves=250, rows=4000)),
+        (
+            "big-header",
+            dict(curves=200, rows=2000, params=3000, well_lines=500, other_lines=2000),
+        ),
+        ("wrapped", dict(curves=40, rows=20000, wrap=True)),
+        ("utf-8", dict(curves=10, rows=50000, params=200, encoding="utf-8")),
+        ("latin-1", dict(curves=10, rows=50000, params=200, encoding="latin-1")),
+        ("crlf", dict(curves=10, rows=50000, newline="\r\n")),
+        ("defects", dict(curves=10, rows=100000, defects=sorted(synthetic.DEFECTS))),
+    ]
+)
+
+# Arguments of synthetic.make_las which are scaled by --scale.
+SCALED = ("rows", "params", "well_lines", "other_lines")
+
+
+def scale_case(kwargs, scale):
+    kwargs = dict(kwargs)
+    for key in SCALED:
+        if key in kwargs:
+            kwargs[key] = max(1, int(kwargs[key] * scale))
+    return kwargs
+
+
+def get_benchmarks(path):
+    """Return (name, function) for each benchmark of the file at ``path``."""
+    regexp_subs, value_null_subs, version_NULL = reader.get_substitutions(
+        "default", "strict"
+    )
+
+    def open_file():
+        file_obj, encoding = reader.open_file(path)
+        file_obj.close()
+
+    def read_file_contents():
+        file_obj, encoding = reader.open_file(path)
+        try:
+            return reader.read_file_contents(file_obj, regexp_subs, value_null_subs)
+        finally:
+            file_obj.close()
+
+    raw_sections = read_file_contents()[0]
+    header_sections = [
+        raw_section
+        for title, raw_section in raw_sections.items()
+        if title[:2].upper() in ("~V", "~W", "~C", "~P")
+    ]
+
+    def parse_header_section():
+        for raw_section in header_sections:
+            reader.parse_header_section(raw_section, version=2.0)
+
+    las = lascheck.read(path, check_data=True)
+    las.get_non_conformities()
+    rules = spec.RULES + spec.DATA_RULES
+
+    return [
+        ("open_file", open_file),
+        ("read_file_contents", read_file_contents),
+        ("parse_header_section", parse_header_section),
+        ("rules", lambda: report.run_rules(las, rules)),
+        ("read", lambda: lascheck.read(path).get_non_conformities()),
+        ("validate", lambda: lascheck.validate(path, check_data=True)),
+    ]
+
+
+def peak_memory(function):
+    """Peak memory allocated while running ``function``, in bytes."""
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run(cases, directory, repeat, scale):
+    """Run the benchmarks for each case.
+
+    Returns:
+        dict of {"case/benchmark": {"bytes": file size, "seconds": best
+        time, "peak_bytes": peak memory}}
+
+    """
+    results = collections.OrderedDict()
+    for case in cases:
+        path = os.path.join(directory, case + ".las")
+        size = synthetic.write_las(path, **scale_case(CASES[case], scale))
+        for name, function in get_benchmarks(path):
+            seconds = min(timeit.repeat(function, number=1, repeat=repeat))
+            results[case + "/" + name] = {
+                "bytes": size,
+                "seconds": seconds,
+                "peak_bytes": peak_memory(function),
+            }
+            print(
+                "{:<34} {:8.1f} MB {:10.2f} ms {:8.1f} MB/s {:10.2f} MB peak".format(
+                    case + "/" + name,
+                    size / 1e6,
+                    seconds * 1e3,
+                    size / 1e6 / seconds,
+                    results[case + "/" + name]["peak_bytes"] / 1e6,
+                )
+            )
+            sys.stdout.flush()
+    return results
+
+
+def compare(results, baseline, tolerance, min_seconds=0.001):
+    """Find the benchmarks which have got slower, or use more memory, than
+    in ``baseline`` by more than ``tolerance`` (a fraction). Times which
+    differ by less than ``min_seconds`` are too noisy to count.
+
+    Returns:
+        list of descriptions of the regressions
+
+    """
+    regressions = []
+    for key, result in results.items():
+        if key not in baseline:
+            continue
+        for measure in ("seconds", "peak_bytes"):
+            before = baseline[key][measure]
+            after = result[measure]
+            if measure == "seconds" and after - before < min_seconds:
+                continue
+            if before > 0 and after > before * (1 + tolerance):
+                regressions.append(
+                    "{} {}: {:.4g} -> {:.4g} ({:+.0%})".format(
+                        key, measure, before, after, after / before - 1
+                    )
+                )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="multiply the number of rows and header lines of each case",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--cases",
+        default=",".join(CASES),
+        help="comma-separated cases to run (default all: {})".format(", ".join(CASES)),
+    )
+    parser.add_argument(
+        "--dir", help="directory to write the synthetic files to (default temporary)"
+    )
+    parser.add_argument("--output", help="save the results to this JSON file")
+    parser.add_argument("--compare", help="compare with results saved by --output")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="fraction by which a time or peak memory may grow (default 0.25)",
+    )
+    parser.add_argument(
+        "--min-seconds",
+        type=float,
+        default=0.001,
+        help="ignore differences in time smaller than this (default 0.001)",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    cases = [case for case in args.cases.split(",") if case]
+    unknown = [case for case in cases if case not in CASES]
+    if unknown:
+        parser.error("unknown cases: {}".format(", ".join(unknown)))
+
+    if args.dir:
+        os.makedirs(args.dir, exist_ok=True)
+        results = run(cases, args.dir, args.repeat, args.scale)
+    else:
+        with tempfile.TemporaryDirectory() as directory:
+            results = run(cases, directory, args.repeat, args.scale)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(
+                {
+                    "lascheck": lascheck.__version__,
+                    "python": platform.python_version(),
+                    "scale": args.scale,
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if baseline.get("scale") != args.scale:
+            print("Warning: the baseline was run with --scale {}".format(baseline.get("scale")))
+        regressions = compare(
+            results, baseline["results"], args.tolerance, args.min_seconds
+        )
+        for regression in regressions:
+            print("Regression: " + regression)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
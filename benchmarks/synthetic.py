@@ -0,0 +1,237 @@
+"""Generate synthetic LAS 2.0 files for the benchmarks.
+
+The files are deterministic: the same arguments always give the same bytes,
+so timings from different runs (and different versions of lascheck) can be
+compared. Without defects, a file conforms to LAS 2.0 including the rules
+about the ~A section checked with ``check_data=True``.
+
+Example::
+
+    >>> from synthetic import write_las
+    >>> write_las("big.las", curves=20, rows=1000000, defects=["bad_step"])
+
+"""
+
+# Non-conformities which can be injected into a file, with a description
+# of each.
+DEFECTS = {
+    "missing_vers": "the VERS line is left out of the ~V section",
+    "missing_null": "the NULL line is left out of the ~W section",
+    "invalid_index_mnemonic": "the index curve is called IDX rather than DEPT",
+    "invalid_depth_unit": "the index curve has units of YD",
+    "blank_line": "a blank line in the ~P section",
+    "duplicate_section": "a second ~P section",
+    "v_section_second": "the ~W section comes before the ~V section",
+    "sections_after_a": "a ~O section after the ~A section",
+    "stop_mismatch": "STOP is one step beyond the last index value",
+    "non_monotonic": "two rows in the middle of ~A are swapped",
+    "bad_step": "a row in the middle of ~A is left out",
+    "short_row": "the last row of ~A is missing its last value",
+    "non_ascii": "a row in the middle of ~A has a non-ASCII character",
+}
+
+# Characters used in descriptions when the encoding is not ASCII (all of
+# them can be encoded as latin-1).
+NON_ASCII_TEXT = "Température ±0,5 °C · Øst"
+
+STRT = 1000.0
+STEP = 0.125
+NULL = -999.25
+
+
+def _curve_mnemonics(curves, defects):
+    index = "IDX" if "invalid_index_mnemonic" in defects else "DEPT"
+    return [index] + ["C{:04d}".format(i) for i in range(1, curves)]
+
+
+def _values(row, curves):
+    """Deterministic values for the curves after the index on a row."""
+    return [((row * 7919 + col * 104729) % 200000) / 100.0 for col in range(1, curves)]
+
+
+def make_las_lines(
+    curves=10,
+    rows=10000,
+    params=10,
+    other_lines=5,
+    well_lines=0,
+    wrap=False,
+    values_per_line=5,
+    text=False,
+    defects=(),
+):
+    """Generate the lines of a synthetic LAS file.
+
+    Keyword Arguments:
+        curves (int): number of curves, including the index
+        rows (int): number of depths in the ~A section
+        params (int): number of lines in the ~P section
+        other_lines (int): number of lines in the ~O section
+        well_lines (int): number of extra lines in the ~W section, after the
+            mandatory ones
+        wrap (bool): if True, the data is wrapped (WRAP = YES), with the
+            index alone on the first line of each record
+        values_per_line (int): number of values on each line after the
+            first of a wrapped record
+        text (bool): if True, descriptions include non-ASCII characters
+        defects (iterable): names of non-conformities to inject, from
+            :data:`DEFECTS`
+
+    Returns:
+        generator of lines (str), without line endings
+
+    """
+    defects = set(defects)
+    unknown = defects - set(DEFECTS)
+    if unknown:
+        raise ValueError("Unknown defects: {}".format(", ".join(sorted(unknown))))
+    descr = NON_ASCII_TEXT if text else "Synthetic"
+    last_row = rows - 1
+    if "bad_step" in defects and rows > 2:
+        last_row += 1
+    stop = STRT + last_row * STEP
+    if "stop_mismatch" in defects:
+        stop += STEP
+    unit = "YD" if "invalid_depth_unit" in defects else "M"
+
+    version = ["~Version Information"]
+    if "missing_vers" not in defects:
+        version.append(" VERS.                 2.0 :   CWLS LOG ASCII STANDARD - VERSION 2.0")
+    version.append(
+        " WRAP.                 {} :   {}".format(
+            "YES" if wrap else "NO",
+            "Multiple lines per depth step" if wrap else "One line per depth step",
+        )
+    )
+
+    well = [
+        "~Well Information",
+        "#MNEM.UNIT              DATA                 DESCRIPTION",
+        " STRT.{}        {:.4f} : START DEPTH".format(unit, STRT),
+        " STOP.{}        {:.4f} : STOP DEPTH".format(unit, stop),
+        " STEP.{}        {:.4f} : STEP".format(unit, STEP),
+    ]
+    if "missing_null" not in defects:
+        well.append(" NULL.           {:.2f} : NULL VALUE".format(NULL))
+    well += [
+        " COMP.    SYNTHETIC LOGGING CO : COMPANY",
+        " WELL.           SYNTHETIC #{} : WELL".format(curves),
+        " FLD .                   FIELD : FIELD",
+        " LOC .         A1-2-3-4W5 {} : LOCATION".format(descr),
+        " PROV.                PROVINCE : PROVINCE",
+        " SRVC.    SYNTHETIC SERVICE CO : SERVICE COMPANY",
+        " DATE.             01-JAN-2000 : LOG DATE",
+        " UWI .        100010200304W500 : UNIQUE WELL ID",
+    ]
+    well += [
+        " W{:05d}.             {} : {} well item {}".format(i, i, descr, i)
+        for i in range(well_lines)
+    ]
+
+    mnemonics = _curve_mnemonics(curves, defects)
+    curve_section = ["~Curve Information"]
+    curve_section.append(" {}.{}       : {} index".format(mnemonics[0], unit, descr))
+    curve_section += [
+        " {}.UNIT    : {} curve {}".format(mnemonic, descr, i)
+        for i, mnemonic in enumerate(mnemonics[1:], 1)
+    ]
+
+    parameter = ["~Parameter Information"]
+    parameter += [
+        " P{:05d}.M        {:.3f} : {} parameter {}".format(i, i * 0.5, descr, i)
+        for i in range(params)
+    ]
+    if "blank_line" in defects:
+        parameter.insert(min(2, len(parameter)), "")
+
+    other = ["~Other Information"]
+    other += ["{} note {}".format(descr, i) for i in range(other_lines)]
+
+    if "v_section_second" in defects:
+        sections = [well, version]
+    else:
+        sections = [version, well]
+    sections += [curve_section, parameter]
+    if "duplicate_section" in defects:
+        # Titles are distinguished, as sections with the same title are
+        # merged when the file is read.
+        sections.append(["~Parameter Information 2", " EXTRA.  1 : Duplicate section"])
+    if "sections_after_a" not in defects:
+        sections.append(other)
+    for section in sections:
+        for line in section:
+            yield line
+
+    yield "~A  " + " ".join(mnemonics[:8])
+    # The defects of single rows are applied by the position of the row
+    # written, whichever depth step it is after the other defects. The short
+    # row is the last, so that it cannot take the index of the next row.
+    middle = rows // 2
+    for position, row in enumerate(_data_row_numbers(rows, defects)):
+        index = STRT + row * STEP
+        values = _values(row, curves)
+        if position == rows - 1 and "short_row" in defects and values:
+            values = values[:-1]
+        formatted = ["{:.3f}".format(value) for value in values]
+        if position == middle and "non_ascii" in defects and formatted:
+            formatted[0] += "°"
+        if wrap:
+            yield "{:.4f}".format(index)
+            for start in range(0, len(formatted), values_per_line):
+                yield " " + " ".join(formatted[start:start + values_per_line])
+        else:
+            yield " ".join(["{:.4f}".format(index)] + formatted)
+
+    if "sections_after_a" in defects:
+        for line in other:
+            yield line
+
+
+def _data_row_numbers(rows, defects):
+    """The row (depth step) numbers of the rows in the ~A section."""
+    middle = rows // 2
+    for row in range(rows):
+        if "non_monotonic" in defects and 0 < middle < rows - 1:
+            if row == middle:
+                row = middle + 1
+            elif row == middle + 1:
+                row = middle
+        if "bad_step" in defects and rows > 2 and row >= middle:
+            row += 1
+        yield row
+
+
+def make_las(encoding="ascii", newline="\n", **kwargs):
+    """Generate the contents of a synthetic LAS file.
+
+    Keyword Arguments:
+        encoding (str): character encoding of the file, e.g. "ascii",
+            "utf-8", "utf-8-sig", "latin-1" or "utf-16". Descriptions include
+            non-ASCII characters unless it is "ascii". (With the
+            ``non_ascii`` defect an "ascii" file is written as latin-1.)
+        newline (str): line ending
+
+    Other keyword arguments are passed to :func:`make_las_lines`.
+
+    Returns:
+        bytes
+
+    """
+    kwargs.setdefault("text", encoding.lower() not in ("ascii", "us-ascii"))
+    text = newline.join(make_las_lines(**kwargs)) + newline
+    if encoding.lower() in ("ascii", "us-ascii") and not text.isascii():
+        encoding = "latin-1"
+    return text.encode(encoding)
+
+
+def write_las(path, **kwargs):
+    """Write a synthetic LAS file generated by :func:`make_las`.
+
+    Returns:
+        the size of the file in bytes
+
+    """
+    contents = make_las(**kwargs)
+    with open(path, "wb") as f:
+        f.write(contents)
+    return len(contents)
@@ -1,18 +1,25 @@
 import os
 
-from .las import LASFile, JSONEncoder
+from .las import LASFile
 from .las_items import CurveItem, HeaderItem, SectionItems
+from .las_items import CompactCurveItem, CompactHeaderItem
+from .summary import LASSummary
 from .reader import open_file
-
-try:
-    import openpyxl
-except ImportError:
-    pass
+from .batch import validate_many, ValidationResult
 
 
 __version__ = '0.24.1'
 
 
+def __getattr__(name):
+    # Imported when first used, to keep "import lascheck" fast.
+    if name == "JSONEncoder":
+        from .encoder import JSONEncoder
+
+        return JSONEncoder
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 def read(file_ref, **kwargs):
     '''Read a LAS file.
 
@@ -37,3 +44,26 @@ def read(file_ref, **kwargs):
 
     '''
     return LASFile(file_ref, **kwargs)
+
+
+def validate(file_ref, **kwargs):
+    '''Check the conformity of a LAS file without keeping its data in memory.
+
+    The file is read with ``ignore_data=True``: every rule in
+    :data:`lascheck.spec.RULES` is still run, but the lines of the ~A section
+    are only counted, so the memory used does not grow with the size of the
+    file. With ``check_data=True`` the ~A section is also read a block at a
+    time, to check the rules in :data:`lascheck.spec.DATA_RULES`.
+
+    Arguments:
+        file_ref (file-like object, str): either a filename, an open file
+            object, or a string containing the contents of a file.
+
+    Returns:
+        list of non-conformities (empty if the file conforms)
+
+    Any of the keyword arguments of :func:`lascheck.read` can be used here.
+
+    '''
+    kwargs["ignore_data"] = True
+    return LASFile(file_ref, **kwargs).get_non_conformities()
@@ -0,0 +1,219 @@
+"""Check the conformity of LAS files from asyncio code.
+
+Reading and checking a file runs in an executor, so the event loop is not
+blocked while a large file is parsed::
+
+    >>> from lascheck import aio
+    >>> non_conformities = await aio.validate("a.las")
+    >>> async for result in aio.validate_many(["logs/"], max_concurrency=8):
+    ...     print(result.path, result.conforming)
+
+By default the loop's default executor (a pool of threads) is used. For
+CPU-bound work on many files a :class:`concurrent.futures.ProcessPoolExecutor`
+can be passed instead.
+
+Cancelling the task awaiting :func:`validate`, or closing the generator
+returned by :func:`validate_many`, stops the work for the files which are no
+longer wanted: files which have not been started are dropped, and with a
+thread executor a file being checked with ``check_data=True`` stops at the
+next block of its ~A section. (A file being checked in another process runs
+to the end.)
+
+"""
+import asyncio
+import concurrent.futures
+import functools
+import inspect
+import logging
+import os
+import threading
+
+from . import batch
+from . import reader
+from .las import LASFile
+
+logger = logging.getLogger(__name__)
+
+
+def _check(file_ref, path, cancelled=None, **read_kwargs):
+    """Check a file, stopping if ``cancelled`` (a threading.Event) is set.
+
+    Returns:
+        :class:`lascheck.batch.ValidationResult`
+
+    """
+
+    def check_cancelled():
+        if cancelled is not None and cancelled.is_set():
+            raise concurrent.futures.CancelledError()
+
+    check_cancelled()
+    encoding = None
+    if isinstance(file_ref, bytes):
+        file_ref, encoding = _decode(file_ref, **read_kwargs)
+    read_kwargs.setdefault("ignore_data", True)
+    # The ~A section of a file on disk is streamed here rather than while it
+    # is read, so that the work can be stopped between blocks.
+    stream_data = (
+        cancelled is not None
+        and read_kwargs["ignore_data"]
+        and read_kwargs.get("check_data")
+        and "cache" not in read_kwargs
+        and isinstance(file_ref, str)
+        and os.path.isfile(file_ref)
+    )
+    if stream_data:
+        read_kwargs["check_data"] = False
+    las = LASFile(file_ref, **read_kwargs)
+    if stream_data:
+        for line_no, block in las.iter_data_chunks():
+            check_cancelled()
+        las.check_data = True
+    check_cancelled()
+    non_conformities = list(las.get_non_conformities())
+    return batch.ValidationResult(
+        path,
+        las.encoding or encoding,
+        las.check_conformity(),
+        non_conformities,
+        None,
+    )
+
+
+def _decode(
+    raw,
+    encoding=None,
+    encoding_errors="replace",
+    autodetect_encoding=True,
+    autodetect_encoding_chars=4000,
+    **read_kwargs
+):
+    """Decode the contents of a LAS file read from a stream, in the same way
+    as :func:`lascheck.reader.open_with_codecs`."""
+    nbytes = int(autodetect_encoding_chars) if autodetect_encoding_chars else None
+    encoding = reader.detect_encoding(
+        raw[:nbytes], encoding=encoding, autodetect_encoding=autodetect_encoding
+    )
+    return raw.decode(encoding or "utf-8", encoding_errors), encoding
+
+
+async def _read_stream(stream):
+    """Read the whole of a stream with an async or a blocking ``read``
+    method, without blocking the event loop."""
+    if inspect.iscoroutinefunction(stream.read):
+        return await stream.read()
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, stream.read)
+
+
+async def _run(executor, file_ref, path, read_kwargs):
+    """Run :func:`_check` in ``executor``, and stop it if cancelled."""
+    if hasattr(file_ref, "read"):
+        file_ref = await _read_stream(file_ref)
+    cancelled = None
+    if not isinstance(executor, concurrent.futures.ProcessPoolExecutor):
+        cancelled = threading.Event()
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(
+        executor,
+        functools.partial(_check, file_ref, path, cancelled=cancelled, **read_kwargs),
+    )
+    try:
+        return await future
+    except asyncio.CancelledError:
+        if cancelled is not None:
+            cancelled.set()
+        raise
+
+
+async def validate(file_ref, executor=None, **read_kwargs):
+    """Check the conformity of a LAS file without blocking the event loop.
+
+    Arguments:
+        file_ref (str or stream): a filename, a string containing the
+            contents of a file, or a stream to read it from. The stream's
+            ``read`` method may be a coroutine (as for
+            :class:`asyncio.StreamReader`) or blocking, in which case it is
+            run in the loop's default executor. Bytes read from it are decoded
+            in the same way as a file on disk.
+
+    Keyword Arguments:
+        executor (:class:`concurrent.futures.Executor`): executor to read and
+            check the file in. Defaults to the loop's default executor.
+
+    Other keyword arguments are the same as for :func:`lascheck.validate`.
+
+    Returns:
+        list of non-conformities (empty if the file conforms)
+
+    """
+    result = await _run(executor, file_ref, None, read_kwargs)
+    return result.non_conformities
+
+
+async def _validate_path(executor, path, read_kwargs):
+    try:
+        return await _run(executor, path, path, read_kwargs)
+    except asyncio.CancelledError:
+        raise
+    except Exception as exc:
+        logger.debug("Unable to check {}".format(path), exc_info=True)
+        return batch.ValidationResult(
+            path, None, False, [], "{}: {}".format(exc.__class__.__name__, exc)
+        )
+
+
+async def validate_many(paths, executor=None, max_concurrency=None, **read_kwargs):
+    """Check the conformity of many LAS files without blocking the event loop.
+
+    Arguments:
+        paths (iterable of str): filenames, glob patterns and/or
+            directories (which are searched recursively for ``*.las`` files).
+
+    Keyword Arguments:
+        executor (:class:`concurrent.futures.Executor`): executor to read and
+            check the files in. Defaults to the loop's default executor.
+        max_concurrency (int): most files to check at once. Defaults to the
+            number of CPUs.
+
+    Other keyword arguments are passed to
+    :func:`lascheck.batch.validate_path`.
+
+    Returns:
+        asynchronous generator of :class:`lascheck.batch.ValidationResult`,
+        in the order in which the files finish. The largest files are started
+        first. Closing the generator early, or cancelling the task iterating
+        over it, cancels the files which are still being checked.
+
+    """
+    if max_concurrency is None:
+        max_concurrency = os.cpu_count() or 1
+    loop = asyncio.get_running_loop()
+    # Walking directories and finding file sizes is blocking I/O too.
+    found = await loop.run_in_executor(
+        None,
+        lambda: sorted(batch.expand_paths(paths), key=batch._file_size, reverse=True),
+    )
+
+    todo = iter(found)
+    pending = set()
+    try:
+        while True:
+            for path in todo:
+                pending.add(
+                    asyncio.ensure_future(_validate_path(executor, path, read_kwargs))
+                )
+                if len(pending) >= max_concurrency:
+                    break
+            if not pending:
+                break
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.wait(pending)
@@ -0,0 +1,160 @@
+"""Check the conformity of many LAS files in parallel.
+
+Example::
+
+    >>> import lascheck
+    >>> for result in lascheck.validate_many(["a.las", "logs/"], workers=8):
+    ...     if not result.conforming:
+    ...         print(result.path, result.non_conformities)
+
+"""
+import collections
+import glob
+import logging
+import os
+
+from .las import LASFile
+
+logger = logging.getLogger(__name__)
+
+
+ValidationResult = collections.namedtuple(
+    "ValidationResult", ["path", "encoding", "conforming", "non_conformities", "error"]
+)
+ValidationResult.__doc__ = """Outcome of checking one LAS file.
+
+    Attributes:
+        path (str): the file that was checked
+        encoding (str or None): character encoding used to read the file
+        conforming (bool): the result of
+            :meth:`lascheck.las.LASFile.check_conformity`
+        non_conformities (list): the result of
+            :meth:`lascheck.las.LASFile.get_non_conformities`
+        error (str or None): if the file could not be read at all, the
+            exception that was raised (``conforming`` is then False)
+
+    """
+
+
+def expand_paths(paths, extensions=(".las",)):
+    """Expand directories and glob patterns into the LAS files they contain.
+
+    Arguments:
+        paths (iterable of str): filenames, directories and/or glob patterns
+            such as ``logs/**/*.las``
+
+    Keyword Arguments:
+        extensions (tuple): file extensions (compared ignoring case) of the
+            files to pick up when walking a directory.
+
+    Returns:
+        generator of filenames. Directories are walked recursively, glob
+        patterns are expanded and files are passed through unchanged.
+
+    """
+    for path in paths:
+        if not os.path.exists(path) and any(c in path for c in "*?["):
+            for match in expand_paths(sorted(glob.glob(path, recursive=True)), extensions):
+                yield match
+        elif os.path.isdir(path):
+            for dirpath, dirnames, filenames in os.walk(path):
+                dirnames.sort()
+                for filename in sorted(filenames):
+                    if filename.lower().endswith(extensions):
+                        yield os.path.join(dirpath, filename)
+        else:
+            yield path
+
+
+def validate_path(path, **read_kwargs):
+    """Check the conformity of one LAS file.
+
+    Arguments:
+        path (str): filename
+
+    Keyword arguments are passed to :class:`lascheck.las.LASFile`. Unless
+    ``ignore_data`` is given, the file is read with ``ignore_data=True``
+    (with ``check_data=True`` the data is still checked, a block at a time).
+    With ``cache`` (a :class:`lascheck.cache.ResultCache` or its directory),
+    the result for a file which has not changed is taken from the cache.
+
+    Returns:
+        :class:`lascheck.batch.ValidationResult`
+
+    """
+    read_kwargs.setdefault("ignore_data", True)
+    try:
+        las = LASFile(path, **read_kwargs)
+        non_conformities = list(las.get_non_conformities())
+        conforming = las.check_conformity()
+    except Exception as exc:
+        logger.debug("Unable to check {}".format(path), exc_info=True)
+        return ValidationResult(
+            path, None, False, [], "{}: {}".format(exc.__class__.__name__, exc)
+        )
+    return ValidationResult(path, las.encoding, conforming, non_conformities, None)
+
+
+def _file_size(path):
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def validate_many(paths, workers=None, **read_kwargs):
+    """Check the conformity of many LAS files using a pool of processes.
+
+    Arguments:
+        paths (iterable of str): filenames, glob patterns and/or
+            directories (which are searched recursively for ``*.las`` files).
+
+    Keyword Arguments:
+        workers (int): number of worker processes. None (the default) uses
+            one per CPU. With ``workers=1`` the files are checked in this
+            process.
+
+    Other keyword arguments are passed to
+    :func:`lascheck.batch.validate_path`.
+
+    Returns:
+        generator of :class:`lascheck.batch.ValidationResult`, in the order
+        in which the files finish.
+
+    The largest files are started first, so that a few huge files do not
+    hold up the end of the run. Only a few tasks per worker are queued at
+    any time, and closing the generator early cancels the files which have
+    not yet been started.
+
+    """
+    paths = sorted(expand_paths(paths), key=_file_size, reverse=True)
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1 or len(paths) <= 1:
+        for path in paths:
+            yield validate_path(path, **read_kwargs)
+        return
+
+    import concurrent.futures
+
+    max_pending = workers * 4
+    todo = iter(paths)
+    pending = set()
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        try:
+            while True:
+                for path in todo:
+                    pending.add(executor.submit(validate_path, path, **read_kwargs))
+                    if len(pending) >= max_pending:
+                        break
+                if not pending:
+                    break
+                done, pending = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    yield future.result()
+        finally:
+            for future in pending:
+                future.cancel()
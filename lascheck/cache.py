@@ -0,0 +1,257 @@
+"""Cache of conformity results, kept in a SQLite database on disk.
+
+Checking a file which has not changed since it was last checked returns the
+stored result without reading the file::
+
+    >>> import lascheck
+    >>> las = lascheck.read("a.las", cache="~/.cache/lascheck")
+    >>> las.get_non_conformities()
+
+A file is taken to be unchanged if its size and modification time are the
+same and a hash of its first and last :data:`HASH_BYTES` bytes matches.
+Results are also stored with a hash of the lascheck source code (see
+:func:`lascheck.cache.ruleset_hash`) and the keyword arguments used to read
+the file, so upgrading lascheck or changing a rule invalidates them.
+
+"""
+import collections
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+# Number of bytes hashed at each end of a file to fingerprint it. The header
+# sections of most files fit in the first block.
+HASH_BYTES = 16384
+
+# Name of the database file in the cache directory.
+DATABASE_NAME = "results.sqlite"
+
+
+CachedResult = collections.namedtuple(
+    "CachedResult", ["conforming", "non_conformities", "encoding", "sections", "flags"]
+)
+CachedResult.__doc__ = """Stored outcome of checking one LAS file.
+
+    Attributes:
+        conforming (bool): the result of
+            :meth:`lascheck.las.LASFile.check_conformity`
+        non_conformities (list): the result of
+            :meth:`lascheck.las.LASFile.get_non_conformities`
+        encoding (str or None): character encoding used to read the file
+        sections (list): names of the sections in
+            :attr:`lascheck.las.LASFile.sections`
+        flags (dict): the attributes of the file set while splitting it
+            into sections, from :func:`lascheck.cache.file_flags`
+
+    """
+
+
+_ruleset_hash = None
+
+
+def ruleset_hash():
+    """Hash of the version and source code of lascheck.
+
+    Any change to the rules, or to how files are read, changes the hash and
+    so invalidates the results stored by earlier versions.
+
+    """
+    global _ruleset_hash
+    if _ruleset_hash is None:
+        from . import __version__
+
+        digest = hashlib.blake2b(__version__.encode(), digest_size=16)
+        package_dir = os.path.dirname(os.path.abspath(__file__))
+        for filename in sorted(os.listdir(package_dir)):
+            if filename.endswith(".py"):
+                with open(os.path.join(package_dir, filename), mode="rb") as f:
+                    digest.update(filename.encode() + b"\0" + f.read())
+        _ruleset_hash = digest.hexdigest()
+    return _ruleset_hash
+
+
+def content_hash(path, size):
+    """Hash the size and the first and last :data:`HASH_BYTES` bytes of a
+    file."""
+    digest = hashlib.blake2b(str(size).encode(), digest_size=16)
+    with open(path, mode="rb") as f:
+        digest.update(f.read(HASH_BYTES))
+        if size > HASH_BYTES:
+            f.seek(max(HASH_BYTES, size - HASH_BYTES))
+            digest.update(f.read(HASH_BYTES))
+    return digest.hexdigest()
+
+
+def file_flags(las_file):
+    """Return the attributes of a LAS file which are set while it is split
+    into sections (see :data:`lascheck.summary.FLAGS`), and its
+    ``index_unit``, by name.
+
+    These are restored on a LASFile whose results come from the cache, so
+    they are right without reading the file.
+
+    """
+    from .summary import FLAGS
+
+    flags = dict((name, getattr(las_file, name)) for name in FLAGS)
+    flags["index_unit"] = las_file.index_unit
+    return flags
+
+
+# Read arguments which do not change the results.
+_IGNORED_OPTIONS = ("data_workers",)
+
+
+def _options_key(read_kwargs):
+    read_kwargs = dict(
+        (key, value) for key, value in read_kwargs.items() if key not in _IGNORED_OPTIONS
+    )
+    return json.dumps(read_kwargs, sort_keys=True, default=repr)
+
+
+class ResultCache(object):
+
+    """Conformity results stored in a SQLite database.
+
+    Arguments:
+        directory (str): directory to keep the database in. It is created if
+            it does not exist.
+
+    The database can be shared by several processes. A ``ResultCache`` can
+    be pickled (e.g. to send it to worker processes), and then opens its own
+    connection.
+
+    """
+
+    def __init__(self, directory):
+        self.directory = os.path.abspath(os.path.expanduser(directory))
+        self._local = threading.local()
+
+    def __getstate__(self):
+        return {"directory": self.directory}
+
+    def __setstate__(self, state):
+        self.__init__(state["directory"])
+
+    def __repr__(self):
+        return "%s(%r)" % (self.__class__.__name__, self.directory)
+
+    @property
+    def connection(self):
+        """The SQLite connection used by this thread."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            os.makedirs(self.directory, exist_ok=True)
+            connection = sqlite3.connect(
+                os.path.join(self.directory, DATABASE_NAME), timeout=60
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                " path TEXT NOT NULL,"
+                " options TEXT NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " mtime_ns INTEGER NOT NULL,"
+                " content_hash TEXT NOT NULL,"
+                " ruleset TEXT NOT NULL,"
+                " result TEXT NOT NULL,"
+                " PRIMARY KEY (path, options))"
+            )
+            self._local.connection = connection
+        return connection
+
+    def get(self, path, **read_kwargs):
+        """Look up the stored result for a file.
+
+        Arguments:
+            path (str): filename
+
+        Keyword arguments are those used to read the file (see
+        :meth:`lascheck.las.LASFile.read`).
+
+        Returns:
+            :class:`lascheck.cache.CachedResult`, or None if there is no
+            result for the file as it is now.
+
+        """
+        path = os.path.abspath(path)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        row = self.connection.execute(
+            "SELECT size, mtime_ns, content_hash, ruleset, result FROM results"
+            " WHERE path = ? AND options = ?",
+            (path, _options_key(read_kwargs)),
+        ).fetchone()
+        if row is None:
+            return None
+        size, mtime_ns, stored_hash, ruleset, result = row
+        if size != stat.st_size or mtime_ns != stat.st_mtime_ns or ruleset != ruleset_hash():
+            return None
+        if stored_hash != content_hash(path, stat.st_size):
+            return None
+        return CachedResult(**json.loads(result))
+
+    def put(self, path, result, stat=None, **read_kwargs):
+        """Store the result for a file.
+
+        Arguments:
+            path (str): filename
+            result (:class:`lascheck.cache.CachedResult`): the result
+
+        Keyword Arguments:
+            stat (os.stat_result): the size and modification time of the file
+                when it was read. Defaults to those it has now.
+
+        Other keyword arguments are those used to read the file.
+
+        """
+        path = os.path.abspath(path)
+        if stat is None:
+            stat = os.stat(path)
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    path,
+                    _options_key(read_kwargs),
+                    stat.st_size,
+                    stat.st_mtime_ns,
+                    content_hash(path, stat.st_size),
+                    ruleset_hash(),
+                    json.dumps(result._asdict()),
+                ),
+            )
+
+    def clear(self):
+        """Remove every stored result."""
+        with self.connection:
+            self.connection.execute("DELETE FROM results")
+
+
+_caches = {}
+
+
+def get_cache(cache):
+    """Return a :class:`lascheck.cache.ResultCache`.
+
+    Arguments:
+        cache (str or :class:`lascheck.cache.ResultCache`): the cache, or
+            the directory of one. The same object is returned for each
+            directory, so its connection is reused.
+
+    """
+    if isinstance(cache, ResultCache):
+        return cache
+    directory = os.path.abspath(os.path.expanduser(cache))
+    if directory not in _caches:
+        _caches[directory] = ResultCache(directory)
+    return _caches[directory]
@@ -0,0 +1,194 @@
+"""Command-line interface: ``lascheck [options] PATH [PATH ...]``.
+
+Exit codes:
+
+* 0 - every file conforms
+* 1 - at least one file does not conform
+* 2 - at least one file could not be read, or no files were found
+
+"""
+import argparse
+import csv
+import logging
+import sys
+import time
+
+from . import batch
+
+EXIT_CONFORMING = 0
+EXIT_NON_CONFORMING = 1
+EXIT_ERROR = 2
+
+
+def get_parser():
+    from . import __version__
+
+    parser = argparse.ArgumentParser(
+        prog="lascheck",
+        description="Check the conformity of LAS files to the LAS 2.0 standard.",
+    )
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        metavar="PATH",
+        help="LAS files, directories (searched recursively for *.las files) "
+        "or glob patterns",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of files to check in parallel (0 for one per CPU, "
+        "default 1)",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=("text", "ndjson", "csv"),
+        default="text",
+        help="output format (default text)",
+    )
+    parser.add_argument(
+        "--check-data",
+        action="store_true",
+        help="also check the contents of the ~A section (needs numpy)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        metavar="DIR",
+        help="keep the results in a cache in DIR, and reuse them for files "
+        "which have not changed",
+    )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="stop at the first file which does not conform",
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="print a throughput summary to stderr when finished",
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="show warnings logged while reading the files",
+    )
+    parser.add_argument(
+        "--version", action="version", version="%(prog)s " + __version__
+    )
+    return parser
+
+
+class TextWriter(object):
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, result):
+        if result.error:
+            self.stream.write("{}: ERROR {}\n".format(result.path, result.error))
+        elif result.conforming:
+            self.stream.write("{}: OK\n".format(result.path))
+        else:
+            self.stream.write("{}: FAIL\n".format(result.path))
+        for non_conformity in result.non_conformities:
+            self.stream.write("    {}\n".format(non_conformity))
+
+
+class NDJSONWriter(object):
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, result):
+        import json
+
+        self.stream.write(json.dumps(result._asdict()) + "\n")
+
+
+class CSVWriter(object):
+    def __init__(self, stream):
+        self.stream = stream
+        self.writer = csv.writer(stream)
+        self.writer.writerow(batch.ValidationResult._fields)
+
+    def write(self, result):
+        self.writer.writerow(
+            [
+                result.path,
+                result.encoding or "",
+                result.conforming,
+                "; ".join(result.non_conformities),
+                result.error or "",
+            ]
+        )
+
+
+WRITERS = {"text": TextWriter, "ndjson": NDJSONWriter, "csv": CSVWriter}
+
+
+def main(argv=None):
+    """Run the ``lascheck`` command.
+
+    Arguments:
+        argv (list, optional): command-line arguments, excluding the program
+            name. Defaults to ``sys.argv[1:]``.
+
+    Returns:
+        the exit code (int)
+
+    """
+    args = get_parser().parse_args(argv)
+    logging.basicConfig(
+        format="%(levelname)s %(name)s: %(message)s",
+        level=logging.WARNING if args.verbose else logging.ERROR,
+    )
+
+    writer = WRITERS[args.format](sys.stdout)
+    n_files = 0
+    n_bytes = 0
+    exit_code = EXIT_CONFORMING
+    start = time.perf_counter()
+
+    read_kwargs = {"check_data": args.check_data}
+    if args.cache_dir:
+        read_kwargs["cache"] = args.cache_dir
+    results = batch.validate_many(args.paths, workers=args.jobs or None, **read_kwargs)
+    try:
+        for result in results:
+            writer.write(result)
+            sys.stdout.flush()
+            n_files += 1
+            n_bytes += batch._file_size(result.path)
+            if result.error:
+                exit_code = EXIT_ERROR
+            elif not result.conforming and exit_code == EXIT_CONFORMING:
+                exit_code = EXIT_NON_CONFORMING
+            if args.fail_fast and exit_code != EXIT_CONFORMING:
+                break
+    finally:
+        results.close()
+    elapsed = time.perf_counter() - start
+
+    if n_files == 0:
+        sys.stderr.write("lascheck: no files found\n")
+        exit_code = EXIT_ERROR
+
+    if args.stats:
+        seconds = elapsed if elapsed > 0 else float("inf")
+        sys.stderr.write(
+            "Checked {} files ({:.1f} MB) in {:.2f} s: "
+            "{:.1f} files/s, {:.1f} MB/s\n".format(
+                n_files,
+                n_bytes / 1e6,
+                elapsed,
+                n_files / seconds,
+                n_bytes / 1e6 / seconds,
+            )
+        )
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
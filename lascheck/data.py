@@ -0,0 +1,193 @@
+"""Summary of the ~A section used by the data rules in :mod:`lascheck.spec`.
+
+A :class:`lascheck.data.DataSummary` is built up one block of rows at a
+time, so the rules can be checked without holding the whole data section in
+memory, and each block is handled with vectorized NumPy operations rather
+than a loop over its rows.
+
+"""
+
+
+class DataSummary(object):
+
+    """Running summary of the ~A section.
+
+    Arguments:
+        ncurves (int): number of curves in the ~C section
+
+    Keyword Arguments:
+        wrapped (bool): True if the data is wrapped (WRAP = YES), in which
+            case the values are counted for each record rather than each line.
+
+    Attributes:
+        nrows (int): number of rows added so far
+        nlines (int): number of data lines (or wrapped records) whose values
+            have been counted
+        bad_column_lines (int): number of data lines (or wrapped records)
+            which do not have ``ncurves`` values
+        first_bad_column_line (int or None): line number of the first of them
+        bad_index_lines (int): number of wrapped records whose first line
+            does not hold the index alone
+        first_bad_index_line (int or None): line number of the first of them
+        non_ascii_lines (int): number of data lines with non-ASCII characters
+        first_non_ascii_line (int or None): line number of the first of them
+        first_index (float or None): index (first column) of the first row
+        last_index (float or None): index of the last row
+        direction (int): 1 if the index is increasing, -1 if it is
+            decreasing, 0 if not yet known
+        first_non_monotonic_line (int or None): line number of the first row
+            whose index does not continue in ``direction``, or which repeats
+            the previous index. None if the index is strictly monotonic.
+        min_step (float or None): smallest difference between consecutive
+            index values
+        min_step_line (int or None): line number of the row ending that step
+        max_step (float or None): largest difference between consecutive
+            index values
+        max_step_line (int or None): line number of the row ending that step
+
+    Line numbers are those in the file where they are known, and otherwise
+    row numbers in the ~A section (starting at 1).
+
+    """
+
+    def __init__(self, ncurves, wrapped=False):
+        self.ncurves = ncurves
+        self.wrapped = wrapped
+        self.nrows = 0
+        self.nlines = 0
+        self.bad_column_lines = 0
+        self.first_bad_column_line = None
+        self.bad_index_lines = 0
+        self.first_bad_index_line = None
+        self.non_ascii_lines = 0
+        self.first_non_ascii_line = None
+        self.first_index = None
+        self.last_index = None
+        self.direction = 0
+        self.first_non_monotonic_line = None
+        self.min_step = None
+        self.min_step_line = None
+        self.max_step = None
+        self.max_step_line = None
+
+    def __repr__(self):
+        return "%s(ncurves=%d, nrows=%d)" % (
+            self.__class__.__name__,
+            self.ncurves,
+            self.nrows,
+        )
+
+    @property
+    def monotonic(self):
+        """True if the index is strictly increasing or decreasing."""
+        return self.first_non_monotonic_line is None
+
+    def add_column_counts(self, counts, line_nos=None):
+        """Add the number of values on each of a block of data lines.
+
+        Arguments:
+            counts (numpy.ndarray): number of values on each line
+
+        Keyword Arguments:
+            line_nos (numpy.ndarray): line number of each line
+
+        """
+        import numpy as np
+
+        bad = np.flatnonzero(counts != self.ncurves)
+        if len(bad) and self.first_bad_column_line is None:
+            if line_nos is None:
+                self.first_bad_column_line = self.nlines + int(bad[0]) + 1
+            else:
+                self.first_bad_column_line = int(line_nos[bad[0]])
+        self.bad_column_lines += len(bad)
+        self.nlines += len(counts)
+
+    def add_index_lines(self, counts, line_nos):
+        """Add the number of values on the first line of each of a block of
+        wrapped records, which should only hold the index.
+
+        Arguments:
+            counts (numpy.ndarray): number of values on each first line
+            line_nos (numpy.ndarray): line number of each first line
+
+        """
+        import numpy as np
+
+        bad = np.flatnonzero(counts != 1)
+        if len(bad) and self.first_bad_index_line is None:
+            self.first_bad_index_line = int(line_nos[bad[0]])
+        self.bad_index_lines += len(bad)
+
+    def add_non_ascii_lines(self, line_nos):
+        """Add the line numbers of data lines with non-ASCII characters.
+
+        Arguments:
+            line_nos (numpy.ndarray): line number of each line
+
+        """
+        if len(line_nos) and self.first_non_ascii_line is None:
+            self.first_non_ascii_line = int(line_nos[0])
+        self.non_ascii_lines += len(line_nos)
+
+    def add_rows(self, block, line_nos=None):
+        """Add a block of rows.
+
+        Arguments:
+            block (numpy.ndarray): 2-D array of rows, with the index in the
+                first column
+
+        Keyword Arguments:
+            line_nos (numpy.ndarray): line number of each row
+
+        """
+        import numpy as np
+
+        if len(block) == 0 or block.shape[1] == 0:
+            return
+        index = block[:, 0]
+        # Position in the block of the row ending each step.
+        if self.last_index is None:
+            self.first_index = float(index[0])
+            steps = np.diff(index)
+            offset = 1
+        else:
+            steps = np.diff(index, prepend=self.last_index)
+            offset = 0
+        first_row = self.nrows + 1
+        self.last_index = float(index[-1])
+        self.nrows += len(block)
+        if not len(steps):
+            return
+
+        def line_no(i):
+            if line_nos is None:
+                return first_row + i + offset
+            return int(line_nos[i + offset])
+
+        if not self.direction and steps[0] != 0 and not np.isnan(steps[0]):
+            self.direction = 1 if steps[0] > 0 else -1
+
+        # argmin and argmax return the position of the first NaN, if any.
+        lo = int(steps.argmin())
+        hi = int(steps.argmax())
+        if self.first_non_monotonic_line is None:
+            if self.direction == -1:
+                monotonic = steps[hi] < 0
+            else:
+                monotonic = steps[lo] > 0
+            if not monotonic:
+                wrong = np.flatnonzero(~(steps * (self.direction or 1) > 0))
+                self.first_non_monotonic_line = line_no(int(wrong[0]))
+
+        if np.isnan(steps[lo]) or np.isnan(steps[hi]):
+            if np.isnan(steps).all():
+                return
+            lo = int(np.nanargmin(steps))
+            hi = int(np.nanargmax(steps))
+        if self.min_step is None or steps[lo] < self.min_step:
+            self.min_step = float(steps[lo])
+            self.min_step_line = line_no(lo)
+        if self.max_step is None or steps[hi] > self.max_step:
+            self.max_step = float(steps[hi])
+            self.max_step_line = line_no(hi)
@@ -0,0 +1,32 @@
+"""Encode LAS files as JSON with :mod:`json`.
+
+This is imported the first time :class:`lascheck.JSONEncoder` is used,
+rather than with lascheck.
+
+"""
+import json
+
+from .las import LASFile
+
+
+class JSONEncoder(json.JSONEncoder):
+    def default(self, obj):
+        if isinstance(obj, LASFile):
+            d = {"metadata": {}, "data": {}}
+            for name, section in obj.sections.items():
+                if isinstance(section, str):
+                    d["metadata"][name] = section
+                else:
+                    d["metadata"][name] = []
+                    for item in section:
+                        d["metadata"][name].append(
+                            {
+                                "mnemonic": item.original_mnemonic,
+                                "unit": item.unit,
+                                "value": item.value,
+                                "descr": item.descr,
+                            }
+                        )
+            for curve in obj.curves:
+                d["data"][curve.mnemonic] = list(curve.data)
+            return d
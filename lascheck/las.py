@@ -1,8 +1,13 @@
 from __future__ import print_function
 
 # Standard library packages
-import json
+try:
+    from collections.abc import MutableMapping
+except ImportError:
+    from collections import MutableMapping
+import copy
 import logging
+import os
 import re
 
 # get basestring in py3
@@ -23,13 +28,108 @@ else:
 
 from . import exceptions
 from .las_items import HeaderItem, CurveItem, SectionItems, OrderedDict
+from .las_items import CompactCurveItem, CURVE_ITEM_TYPES
 from . import defaults
+from .data import DataSummary
 from . import reader
+from . import report
 from . import spec
+from . import timing
 
 logger = logging.getLogger(__name__)
 
 
+class LazySections(MutableMapping):
+
+    """Ordered mapping of LAS sections which parses each one on first access.
+
+    A section can be added either as a value, as for a dict, or as a loader
+    function through :meth:`lascheck.las.LazySections.set_loader`. A loader
+    is only called the first time its section is looked up, and the result
+    then replaces it. Checking whether a section exists never calls the
+    loader.
+
+    ``modifications`` counts the sections added, replaced and removed. Changes
+    to the items of a section are counted by the section itself (see
+    :attr:`lascheck.las_items.SectionItems.modifications`).
+
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._sections = OrderedDict()
+        self._loaders = {}
+        # The modifications of each section when it was added or parsed.
+        self._baselines = {}
+        self.modifications = 0
+        self.update(*args, **kwargs)
+
+    def set_loader(self, key, loader):
+        """Add a section which is created by calling ``loader()`` when needed."""
+        self._sections[key] = None
+        self._loaders[key] = loader
+        self._baselines.pop(key, None)
+        self.modifications += 1
+
+    def section_modifications(self):
+        """Return (name, count) for each section whose items have been
+        modified since it was added or parsed. Sections which have not been
+        parsed are not looked at."""
+        result = []
+        for key, baseline in self._baselines.items():
+            count = getattr(self._sections[key], "modifications", 0) - baseline
+            if count:
+                result.append((key, count))
+        return tuple(result)
+
+    def is_loaded(self, key):
+        """Return True if the section has already been parsed."""
+        return key in self._sections and key not in self._loaders
+
+    def __getitem__(self, key):
+        value = self._sections[key]
+        if key in self._loaders:
+            with timing.deferred():
+                value = self._loaders[key]()
+            self._sections[key] = value
+            self._baselines[key] = getattr(value, "modifications", 0)
+            del self._loaders[key]
+        return value
+
+    def __setitem__(self, key, value):
+        self._loaders.pop(key, None)
+        self._sections[key] = value
+        self._baselines[key] = getattr(value, "modifications", 0)
+        self.modifications += 1
+
+    def __delitem__(self, key):
+        del self._sections[key]
+        self._loaders.pop(key, None)
+        self._baselines.pop(key, None)
+        self.modifications += 1
+
+    def __contains__(self, key):
+        return key in self._sections
+
+    def __iter__(self):
+        return iter(self._sections)
+
+    def __len__(self):
+        return len(self._sections)
+
+    def __reduce__(self):
+        # Loaders are not picklable, so every section is parsed first.
+        return self.__class__, (list(self.items()),)
+
+    def __repr__(self):
+        return "%s({%s})" % (
+            self.__class__.__name__,
+            ", ".join(
+                "%r: %s" % (key, "<not parsed>" if key in self._loaders else repr(value))
+                for key, value in self._sections.items()
+            ),
+        )
+
+
 class LASFile(object):
 
     """LAS file object.
@@ -49,14 +149,31 @@ class LASFile(object):
     Attributes:
         encoding (str or None): the character encoding used when reading the
             file in from disk
+        timings (OrderedDict or None): if the file was read with
+            ``timings=True``, the total time in seconds of each phase of
+            reading and checking it (see :mod:`lascheck.timing`)
 
     """
 
     def __init__(self, file_ref=None, **read_kwargs):
         super(LASFile, self).__init__()
         self._text = ""
-        self.index_unit = None
-        self.non_conformities = []
+        self._index_unit = None
+        self._find_index_unit = False
+        self._report = None
+        self._report_state = None
+        self._data_summary = None
+        self._data_section = None
+        self._read_subs = ([], [], False)
+        self._cached_result = None
+        self._deferred_read = None
+        self._read_args = None
+        self._header_bytes = None
+        self._data_chunk_state = None
+        self._data_buffer = None
+        self._data_workers = None
+        self.timings = None
+        self.check_data = False
         self.duplicate_v_section = False
         self.duplicate_w_section = False
         self.duplicate_p_section = False
@@ -67,18 +184,18 @@ class LASFile(object):
         self.blank_line_in_section = False
         self.sections_with_blank_line = []
         self.non_conforming_depth = []
-        default_items = defaults.get_default_items()
         if not (file_ref is None):
-            self.sections = {}
+            self.sections = LazySections()
             self.read(file_ref, **read_kwargs)
         else:
-            self.sections = {
-                "Version": default_items["Version"],
-                "Well": default_items["Well"],
-                "Curves": default_items["Curves"],
-                "Parameter": default_items["Parameter"],
-                "Other": str(default_items["Other"]),
-            }
+            default_items = defaults.get_default_items()
+            self.sections = LazySections([
+                ("Version", default_items["Version"]),
+                ("Well", default_items["Well"]),
+                ("Curves", default_items["Curves"]),
+                ("Parameter", default_items["Parameter"]),
+                ("Other", str(default_items["Other"])),
+            ])
 
     def read(
         self,
@@ -89,6 +206,11 @@ class LASFile(object):
         ignore_header_errors=False,
         mnemonic_case="upper",
         index_unit=None,
+        check_data=False,
+        cache=None,
+        timings=False,
+        compact_items=False,
+        data_workers=None,
         **kwargs
     ):
         """Read a LAS file.
@@ -101,19 +223,108 @@ class LASFile(object):
             null_policy (str or list): see
                 http://lascheck.readthedocs.io/en/latest/data-section.html#handling-invalid-data-indicators-automatically
             ignore_data (bool): if True, do not read in any of the actual data,
-                just the header metadata. False by default.
+                just the header metadata. The ~A section is still checked for
+                blank lines and following sections, but its lines are only
+                counted, so memory use stays flat whatever the file size.
+                False by default.
             ignore_header_errors (bool): ignore LASHeaderErrors (False by
                 default)
             mnemonic_case (str): 'preserve': keep the case of HeaderItem mnemonics
                                  'upper': convert all HeaderItem mnemonics to uppercase
                                  'lower': convert all HeaderItem mnemonics to lowercase
             index_unit (str): Optionally force-set the index curve's unit to "m" or "ft"
+            check_data (bool): if True, the conformity checks include the
+                rules about the contents of the ~A section in
+                :data:`lascheck.spec.DATA_RULES`. False by default. With
+                ``ignore_data=True`` as well, the ~A section is summarized
+                with :meth:`lascheck.las.LASFile.iter_data_chunks` without
+                keeping its data.
+            cache (str or :class:`lascheck.cache.ResultCache`): a cache of
+                conformity results, or the directory to keep one in. If the
+                file is on disk and has not changed since it was last read
+                with the same arguments, its conformity results are taken
+                from the cache and the file is only read when a section is
+                looked up. Otherwise the file is checked and the results
+                stored.
+            compact_items (bool): if True, the header sections are made of
+                :class:`lascheck.las_items.CompactHeaderItem` and
+                :class:`lascheck.las_items.CompactCurveItem`, which use much
+                less memory than HeaderItem and CurveItem. False by default.
+            data_workers (int): number of processes to parse the ~A section
+                of a large file on disk with (see :mod:`lascheck.parallel`).
+                The results are the same as with one. None (the default)
+                parses it in this process.
+            timings (bool): if True, time each phase of reading and checking
+                the file in :attr:`lascheck.las.LASFile.timings`. False by
+                default.
 
         See :func:`lascheck.reader.open_with_codecs` for additional keyword
         arguments which help to manage issues relate to character encodings.
 
-        """
+        Files on disk are indexed with :func:`lascheck.reader.read_file_index`
+        and the lines of a section are only read when they are needed. Each
+        section in :attr:`lascheck.las.LASFile.sections` is parsed the first
+        time it is accessed, so header errors are raised at that point.
 
+        """
+        self.timings = OrderedDict() if timings else None
+        with timing.collect(self.timings):
+            self._read(
+                file_ref,
+                ignore_data=ignore_data,
+                read_policy=read_policy,
+                null_policy=null_policy,
+                ignore_header_errors=ignore_header_errors,
+                mnemonic_case=mnemonic_case,
+                index_unit=index_unit,
+                check_data=check_data,
+                cache=cache,
+                compact_items=compact_items,
+                data_workers=data_workers,
+                **kwargs
+            )
+
+    def _read(
+        self,
+        file_ref,
+        ignore_data,
+        read_policy,
+        null_policy,
+        ignore_header_errors,
+        mnemonic_case,
+        index_unit,
+        check_data,
+        cache,
+        compact_items,
+        data_workers,
+        **kwargs
+    ):
+        on_disk = isinstance(file_ref, str) and os.path.isfile(file_ref)
+        options = dict(
+            kwargs,
+            ignore_data=ignore_data,
+            read_policy=read_policy,
+            null_policy=null_policy,
+            ignore_header_errors=ignore_header_errors,
+            mnemonic_case=mnemonic_case,
+            index_unit=index_unit,
+            check_data=check_data,
+            compact_items=compact_items,
+            data_workers=data_workers,
+        )
+        if cache is not None and on_disk:
+            from . import cache as cache_module
+
+            return self._read_with_cache(file_ref, cache_module.get_cache(cache), options)
+
+        self._cached_result = None
+        self._deferred_read = None
+        self._read_args = (file_ref, options) if on_disk else None
+        self._header_bytes = None
+        self._data_chunk_state = None
+        self._data_buffer = None
+        self._data_workers = data_workers if on_disk else None
+        self.check_data = check_data
         file_obj, self.encoding = reader.open_file(file_ref, **kwargs)
 
         regexp_subs, value_null_subs, version_NULL = reader.get_substitutions(
@@ -121,9 +332,27 @@ class LASFile(object):
         )
 
         try:
+            contents = None
+            head = getattr(file_obj, "head", None)
+            if head is not None and on_disk:
+                # Opened by reader.open_with_codecs: index the same handle.
+                contents = reader.read_file_index(
+                    file_ref,
+                    self.encoding,
+                    encoding_errors=kwargs.get("encoding_errors", "replace"),
+                    ignore_data=ignore_data,
+                    file_obj=file_obj.stream,
+                    head=head,
+                )
+            if contents is None:
+                contents = reader.read_file_contents(
+                    file_obj,
+                    regexp_subs,
+                    value_null_subs,
+                    ignore_data=ignore_data and not check_data,
+                )
             self.raw_sections, self.sections_after_a_section, self.v_section_first, self.blank_line_in_section, \
-            self.sections_with_blank_line = \
-                reader.read_file_contents(file_obj, regexp_subs, value_null_subs, ignore_data=ignore_data)
+            self.sections_with_blank_line = contents
         finally:
             if hasattr(file_obj, "close"):
                 file_obj.close()
@@ -131,13 +360,40 @@ class LASFile(object):
         if len(self.raw_sections) == 0:
             raise KeyError("No ~ sections found. Is this a LAS file?")
 
+        # Sections are only parsed the first time they are accessed, so
+        # checking the structure of a file does not pay for parsing every
+        # section in it.
+        self.sections = LazySections()
+        self._data_summary = None
+        self._data_section = data_section = self.match_raw_section("~A")
+        self._read_subs = (regexp_subs, value_null_subs, version_NULL)
+        if data_section and "ranges" in data_section:
+            # Kept so that refresh() can tell whether the header has changed.
+            header_end = data_section["start"]
+            if header_end <= len(head):
+                self._header_bytes = head[:header_end]
+            else:
+                with open(file_ref, mode="rb") as f:
+                    self._header_bytes = f.read(header_end)
+
         def add_section(pattern, name, **sect_kws):
             raw_section = self.match_raw_section(pattern)
             drop = []
             if raw_section:
-                self.sections[name] = reader.parse_header_section(
-                    raw_section, **sect_kws
-                )
+
+                def parse_section():
+                    with timing.collect(self.timings):
+                        started = timing.start()
+                        kws = dict(sect_kws)
+                        if "version" not in kws:
+                            kws["version"] = get_version()
+                        section = reader.parse_header_section(raw_section, **kws)
+                        if name == "Curves":
+                            read_data(section)
+                        timing.stop("parse_section:" + name, started)
+                    return section
+
+                self.sections.set_loader(name, parse_section)
                 drop.append(raw_section["title"])
             else:
                 logger.warning(
@@ -151,7 +407,7 @@ class LASFile(object):
             raw_section = self.match_raw_section(pattern)
             drop = []
             if raw_section:
-                self.sections[name] = "\n".join(raw_section["lines"])
+                self.sections.set_loader(name, lambda: "\n".join(raw_section["lines"]))
                 drop.append(raw_section["title"])
             else:
                 logger.warning(
@@ -161,95 +417,128 @@ class LASFile(object):
             for key in drop:
                 self.raw_sections.pop(key)
 
+        def read_data(curves):
+            # The ~A section is parsed along with the ~C section, because
+            # the number of curves is needed to arrange it into columns.
+            if not data_section or (ignore_data and not check_data):
+                return
+            try:
+                import numpy
+            except ImportError:
+                logger.warning("numpy is not installed: the ~A section was not parsed")
+                return
+            started = timing.start()
+            if ignore_data:
+                # Only the summary is needed for the data rules.
+                for line_no, block in self._iter_data_chunks(len(curves)):
+                    pass
+                timing.stop("read_data", started)
+                return
+            if self._parse_in_parallel() and not self._wrapped():
+                data = self._read_data_in_parallel(len(curves))
+            else:
+                blocks = [
+                    block
+                    for line_no, block in self._iter_data_chunks(
+                        len(curves), reader.DATA_CHUNK_ROWS
+                    )
+                ]
+                if blocks:
+                    data = numpy.concatenate(blocks)
+                else:
+                    data = numpy.empty((0, len(curves)))
+            while data.shape[1] > len(curves):
+                curves.append(CompactCurveItem("") if compact_items else CurveItem(""))
+            for i, curve in enumerate(curves):
+                curve.data = data[:, i]
+            timing.stop("read_data", started)
+
+        versions = []
+
+        def get_version():
+            if versions:
+                return versions[0]
+
+            # Establish version and wrap values if possible.
+
+            try:
+                version = self.version["VERS"].value
+            except KeyError:
+                logger.warning("VERS item not found in the ~V section.")
+                version = None
+
+            try:
+                wrap = self.version["WRAP"].value
+            except KeyError:
+                logger.warning("WRAP item not found in the ~V section")
+                wrap = None
+
+            # Validate version.
+            #
+            # If VERS was missing and version = None, then the file will be read in
+            # as if version were 2.0. But there will be no VERS HeaderItem, meaning
+            # that las.write(..., version=None) will fail with a KeyError. But
+            # las.write(..., version=1.2) will work because a new VERS HeaderItem
+            # will be created.
+
+            try:
+                assert version in (1.2, 2, None)
+            except AssertionError:
+                if version < 2:
+                    version = 1.2
+                else:
+                    version = 2
+            else:
+                if version is None:
+                    logger.info("Assuming that LAS VERS is 2.0")
+                    version = 2
+            versions.append(version)
+            return version
+
         add_section(
             "~V",
             "Version",
             version=1.2,
             ignore_header_errors=ignore_header_errors,
             mnemonic_case=mnemonic_case,
+            compact=compact_items,
         )
 
         if self.match_raw_section("~V"):
             self.duplicate_v_section = True
-            self.non_conformities.append("Duplicate v section")
-
-        # Establish version and wrap values if possible.
-
-        try:
-            version = self.version["VERS"].value
-        except KeyError:
-            logger.warning("VERS item not found in the ~V section.")
-            version = None
-
-        try:
-            wrap = self.version["WRAP"].value
-        except KeyError:
-            logger.warning("WRAP item not found in the ~V section")
-            wrap = None
-
-        # Validate version.
-        #
-        # If VERS was missing and version = None, then the file will be read in
-        # as if version were 2.0. But there will be no VERS HeaderItem, meaning
-        # that las.write(..., version=None) will fail with a KeyError. But
-        # las.write(..., version=1.2) will work because a new VERS HeaderItem
-        # will be created.
-
-        try:
-            assert version in (1.2, 2, None)
-        except AssertionError:
-            if version < 2:
-                version = 1.2
-            else:
-                version = 2
-        else:
-            if version is None:
-                logger.info("Assuming that LAS VERS is 2.0")
-                version = 2
 
         add_section(
             "~W",
             "Well",
-            version=version,
             ignore_header_errors=ignore_header_errors,
             mnemonic_case=mnemonic_case,
+            compact=compact_items,
         )
 
         if self.match_raw_section("~W"):
             self.duplicate_w_section = True
-            self.non_conformities.append("Duplicate w section")
-
-        # Establish NULL value if possible.
-
-        try:
-            null = self.well["NULL"].value
-        except KeyError:
-            logger.warning("NULL item not found in the ~W section")
-            null = None
 
         add_section(
             "~C",
             "Curves",
-            version=version,
             ignore_header_errors=ignore_header_errors,
             mnemonic_case=mnemonic_case,
+            compact=compact_items,
         )
 
         if self.match_raw_section("~C"):
             self.duplicate_c_section = True
-            self.non_conformities.append("Duplicate c section")
 
         add_section(
             "~P",
             "Parameter",
-            version=version,
             ignore_header_errors=ignore_header_errors,
             mnemonic_case=mnemonic_case,
+            compact=compact_items,
         )
 
         if self.match_raw_section("~P"):
             self.duplicate_p_section = True
-            self.non_conformities.append("Duplicate p section")
 
 
         add_special_section("~A", "Ascii")
@@ -257,7 +546,6 @@ class LASFile(object):
         add_special_section("~O", "Other")
         if self.match_raw_section("~O"):
             self.duplicate_o_section = True
-            self.non_conformities.append("Duplicate o section")
 
         # Deal with nonstandard sections that some operators and/or
         # service companies (eg IHS) insist on adding.
@@ -265,7 +553,9 @@ class LASFile(object):
         for s in self.raw_sections.values():
             if s["section_type"] == "header":
                 logger.warning("Found nonstandard LAS section: " + s["title"])
-                self.sections[s["title"][1:]] = "\n".join(s["lines"])
+                self.sections.set_loader(
+                    s["title"][1:], lambda s=s: "\n".join(s["lines"])
+                )
                 drop.append(s["title"])
         for key in drop:
             self.raw_sections.pop(key)
@@ -273,9 +563,59 @@ class LASFile(object):
         if "m" in str(index_unit):
             index_unit = "m"
 
-        if index_unit:
-            self.index_unit = index_unit
-        else:
+        self.index_unit = index_unit
+
+    def _read_with_cache(self, filename, result_cache, options):
+        from . import cache as cache_module
+
+        cached = result_cache.get(filename, **options)
+        if cached is None:
+            stat = os.stat(filename)
+            self._read(filename, cache=None, **options)
+            result = cache_module.CachedResult(
+                self.check_conformity(),
+                self.get_non_conformities(),
+                self.encoding,
+                list(self.sections),
+                cache_module.file_flags(self),
+            )
+            result_cache.put(filename, result, stat=stat, **options)
+            return
+
+        # The file is read when any section is first looked up.
+        self._cached_result = cached
+        self._deferred_read = (filename, options)
+        self.encoding = cached.encoding
+        self.check_data = options["check_data"]
+        flags = dict(cached.flags)
+        self._index_unit = flags.pop("index_unit")
+        self._find_index_unit = False
+        for name, value in flags.items():
+            setattr(self, name, value)
+        self.sections = LazySections()
+        for name in cached.sections:
+            self.sections.set_loader(
+                name, lambda name=name: self._complete_read()[name]
+            )
+
+    def _complete_read(self):
+        """Read a file whose conformity results came from a cache."""
+        filename, options = self._deferred_read
+        with timing.collect(self.timings):
+            self._read(filename, cache=None, **options)
+        return self.sections
+
+    @property
+    def index_unit(self):
+        """Unit of the index curve, "M" or "FT" if it can be worked out.
+
+        Unless it was set when reading the file, this is found from the
+        units of STRT, STOP and STEP in the ~W section and of the first curve
+        in the ~C section, the first time it is needed.
+
+        """
+        if self._index_unit is None and self._find_index_unit:
+            self._find_index_unit = False
             check_units_on = []
             for mnemonic in ("STRT", "STOP", "STEP"):
                 if "Well" in self.sections:
@@ -286,7 +626,13 @@ class LASFile(object):
                     check_units_on.append(self.curves[0])
             for index_unit, possibilities in defaults.DEPTH_UNITS.items():
                 if all(i.unit.upper() in possibilities for i in check_units_on):
-                    self.index_unit = index_unit
+                    self._index_unit = index_unit
+        return self._index_unit
+
+    @index_unit.setter
+    def index_unit(self, value):
+        self._index_unit = value
+        self._find_index_unit = not value
 
     def match_raw_section(self, pattern, re_func="match", flags=re.IGNORECASE):
         """Find raw section with a regular expression.
@@ -340,13 +686,12 @@ class LASFile(object):
 
         """
         # TODO: If I implement 2D arrays, need to check here for :1 :2 :3 etc.
-        curve_mnemonics = [c.mnemonic for c in self.curves]
         if isinstance(key, int):
             return self.curves[key].data
-        elif key in curve_mnemonics:
+        elif key in self.curves:
             return self.curves[key].data
         else:
-            raise KeyError("{} not found in curves ({})".format(key, curve_mnemonics))
+            raise KeyError("{} not found in curves ({})".format(key, self.keys()))
 
     def __setitem__(self, key, value):
         """Append a curve.
@@ -359,7 +704,7 @@ class LASFile(object):
         :meth:`lascheck.las.LASFile.append_curve` for more details.
 
         """
-        if isinstance(value, CurveItem):
+        if isinstance(value, CURVE_ITEM_TYPES):
             if key != value.mnemonic:
                 raise KeyError(
                     "key {} does not match value.mnemonic {}".format(
@@ -504,8 +849,262 @@ class LASFile(object):
         return self.sections
 
 
+    @property
+    def data_summary(self):
+        """Summary of the ~A section used by the data rules.
+
+        Returns:
+            :class:`lascheck.data.DataSummary`, or None if the data has not
+            been read (e.g. with ``ignore_data=True``)
+
+        """
+        if "Curves" in self.sections:
+            # The ~A section is read when the ~C section is parsed.
+            self.sections["Curves"]
+        return self._data_summary
+
+    def iter_data_chunks(self, rows=65536):
+        """Iterate over the ~A section a block of rows at a time.
+
+        Keyword Arguments:
+            rows (int): number of lines of the ~A section parsed into each
+                block
+
+        Returns:
+            generator of (line number, block), where block is a 2-D
+            ``numpy.ndarray`` with a column for each curve and line number
+            is the line of the file on which its first row starts. See
+            :func:`lascheck.reader.iter_data_chunks`.
+
+        The same null policy is applied as when the file was read, and
+        wrapped data (WRAP = YES) is unwrapped into a row per record. Once all
+        the blocks have been read, :attr:`lascheck.las.LASFile.data_summary`
+        is replaced with a summary of them, so the data rules in
+        :data:`lascheck.spec.DATA_RULES` can be checked.
+
+        For a file read from disk with ``ignore_data=True``, the ~A section
+        is read from the file as the blocks are needed, so only ``rows``
+        lines are held in memory at a time whatever the size of the file.
+        (The lines of a file read from a string or file object with
+        ``ignore_data=True`` and ``check_data=False`` are not kept, so no
+        blocks are yielded for it.)
+
+        """
+        return self._iter_data_chunks(len(self.curves), rows)
+
+    def _iter_data_chunks(self, ncurves, rows=65536):
+        if not self._data_section:
+            return
+        regexp_subs, value_null_subs, version_NULL = self._read_subs
+        wrapped = self._wrapped()
+        summary = DataSummary(ncurves, wrapped=wrapped)
+        state = reader.DataChunkState()
+        if self._parse_in_parallel():
+            from . import parallel
+
+            chunks = parallel.iter_data_chunks(
+                self._read_args[0],
+                self._data_section,
+                ncurves,
+                regexp_subs,
+                self._null_subs(),
+                workers=self._data_workers,
+                summary=summary,
+                wrapped=wrapped,
+                state=state,
+            )
+        else:
+            chunks = reader.iter_data_chunks(
+                self._data_section,
+                ncurves,
+                regexp_subs,
+                self._null_subs(),
+                rows=rows,
+                summary=summary,
+                wrapped=wrapped,
+                state=state,
+            )
+        for line_no, block in chunks:
+            yield line_no, block
+        self._data_summary = summary
+        self._data_chunk_state = state
+
+    def _read_data_in_parallel(self, ncurves):
+        """Parse the ~A section into one array with
+        :func:`lascheck.parallel.read_data_section`, which the workers write
+        into directly."""
+        from . import parallel
+
+        regexp_subs, value_null_subs, version_NULL = self._read_subs
+        summary = DataSummary(ncurves)
+        state = reader.DataChunkState()
+        data = parallel.read_data_section(
+            self._read_args[0],
+            self._data_section,
+            ncurves,
+            regexp_subs,
+            self._null_subs(),
+            workers=self._data_workers,
+            summary=summary,
+            state=state,
+        )
+        self._data_summary = summary
+        self._data_chunk_state = state
+        return data
+
+    def _parse_in_parallel(self):
+        """True if the ~A section should be parsed by
+        :func:`lascheck.parallel.iter_data_chunks`: the file was read with
+        ``data_workers`` and the section is large enough to be split."""
+        if not self._data_workers or self._data_workers == 1:
+            return False
+        ranges = self._data_section.get("ranges")
+        if not ranges or self._read_args is None:
+            return False
+        from . import parallel
+
+        size = sum(end - start for start, end, line_no in ranges)
+        return size > 2 * parallel.CHUNK_BYTES
+
+    def refresh(self):
+        """Read and check the lines added to the end of the file since it was
+        read.
+
+        Only the new lines of the ~A section are parsed. The checks of the
+        index (see :class:`lascheck.spec.MonotonicIndex` and
+        :class:`lascheck.spec.ValidIndexStep`) carry on from the last row
+        already read, and a row (or wrapped record) which was incomplete is
+        completed by the new lines. A last line without a newline is left
+        until the next refresh.
+
+        The file is read again from the start with
+        :meth:`lascheck.las.LASFile.read` if it cannot be refreshed this way:
+        if anything before the ~A section has changed, the file has got
+        shorter, a section has been added after the ~A section, or the file
+        could not be indexed with :func:`lascheck.reader.read_file_index`.
+
+        Raises:
+            ValueError: if the file was not read from a file on disk.
+
+        """
+        with timing.collect(self.timings):
+            started = timing.start()
+            self._refresh()
+            timing.stop("refresh", started)
+
+    def _refresh(self):
+        if self._deferred_read is not None:
+            self._complete_read()
+        if self._read_args is None:
+            raise ValueError("Only a LAS file read from disk can be refreshed")
+        filename, options = self._read_args
+        data_section = self._data_section
+        indexed = None
+        if self._header_bytes is not None:
+            # Parse the ~C and ~A sections, if they have not been already.
+            self.data_summary
+            indexed = reader.index_appended_lines(
+                filename,
+                data_section,
+                self._header_bytes,
+                self.encoding,
+                options.get("encoding_errors", "replace"),
+            )
+        if indexed is None:
+            logger.info("Reading %s again from the start", filename)
+            self._read(filename, cache=None, **options)
+            return
+        appended, extended = indexed
+        if appended["end"] == appended["start"]:
+            return
+        for title, raw_section in self.raw_sections.items():
+            if raw_section is data_section:
+                self.raw_sections[title] = extended
+        self._data_section = extended
+        if appended["blank_line_nos"]:
+            # As read_file_index() would have found them in the ~A section.
+            self.blank_line_in_section = True
+            self.sections_with_blank_line = self.sections_with_blank_line + [
+                extended["title"].split()[0]
+            ] * len(appended["blank_line_nos"])
+            self._report = None
+
+        state = self._data_chunk_state
+        if state is None:
+            # The ~A section is not read (ignore_data=True and
+            # check_data=False, or numpy is not installed).
+            return
+        import numpy as np
+
+        regexp_subs, value_null_subs, version_NULL = self._read_subs
+        nrows = state.nrows
+        summary = copy.copy(state.summary)
+        blocks = [
+            block
+            for line_no, block in reader.iter_data_chunks(
+                appended,
+                len(self.curves),
+                regexp_subs,
+                self._null_subs(),
+                rows=reader.DATA_CHUNK_ROWS,
+                summary=summary,
+                wrapped=self._wrapped(),
+                state=state,
+            )
+        ]
+        self._data_summary = summary
+        if not options["ignore_data"] and blocks:
+            self._append_rows(nrows, np.concatenate(blocks))
+
+    def _append_rows(self, nrows, rows):
+        """Replace the rows of curve data after the first ``nrows`` with
+        ``rows``.
+
+        The curve data are kept as columns of a buffer which grows by
+        doubling, so appending to them repeatedly does not copy all the rows
+        each time.
+
+        """
+        import numpy as np
+
+        ncols = len(self.curves)
+        buffer, views = self._data_buffer or (None, None)
+        if views is None or any(
+            curve.data is not view for curve, view in zip(self.curves, views)
+        ) or len(views) != ncols:
+            buffer = np.vstack([curve.data[:nrows] for curve in self.curves]).T
+        total = nrows + len(rows)
+        if len(buffer) < total:
+            grown = np.empty((max(total, 2 * len(buffer)), ncols))
+            grown[:nrows] = buffer[:nrows]
+            buffer = grown
+        buffer[nrows:total] = rows[:, :ncols]
+        views = []
+        for i, curve in enumerate(self.curves):
+            curve.data = buffer[:total, i]
+            views.append(curve.data)
+        self._data_buffer = (buffer, views)
+
+    def _wrapped(self):
+        """True if WRAP is YES in the ~V section."""
+        if "Version" in self.sections and "WRAP" in self.version:
+            return str(self.version["WRAP"].value).strip().upper() == "YES"
+        return False
+
+    def _null_subs(self):
+        """Values in the ~A section to replace with NaN."""
+        regexp_subs, value_null_subs, version_NULL = self._read_subs
+        null_subs = list(value_null_subs)
+        if version_NULL and "Well" in self.sections and "NULL" in self.well:
+            null = self.well["NULL"].value
+            if isinstance(null, (int, float)):
+                null_subs.append(null)
+        return null_subs
+
     @property
     def data(self):
+        import numpy as np
+
         return np.vstack([c.data for c in self.curves]).T
 
     @data.setter
@@ -559,6 +1158,11 @@ class LASFile(object):
             curve.data = data[:, i]
 
         self.curves.assign_duplicate_suffixes()
+        self._data_summary = DataSummary(len(self.curves))
+        self._data_summary.add_rows(data)
+        # The data no longer comes from the file, so refresh() cannot
+        # carry on from it.
+        self._data_chunk_state = None
 
     @property
     def index(self):
@@ -616,7 +1220,7 @@ class LASFile(object):
             curve_item (lascheck.CurveItem)
 
         """
-        assert isinstance(curve_item, CurveItem)
+        assert isinstance(curve_item, CURVE_ITEM_TYPES)
         self.curves.insert(ix, curve_item)
 
     def add_curve(self, *args, **kwargs):
@@ -672,6 +1276,8 @@ class LASFile(object):
     @property
     def json(self):
         """Return object contents as a JSON string."""
+        import json
+
         obj = OrderedDict()
         for name, section in self.sections.items():
             try:
@@ -684,45 +1290,101 @@ class LASFile(object):
     def json(self, value):
         raise Exception("Cannot set objects from JSON")
 
+    def _conformity_state(self):
+        """Values which change whenever the file is modified."""
+        sections = self.sections
+        if hasattr(sections, "section_modifications"):
+            sections_state = (sections.modifications, sections.section_modifications())
+        else:
+            sections_state = tuple(
+                (key, id(value), getattr(value, "modifications", None))
+                for key, value in sections.items()
+            )
+        return (
+            id(sections),
+            sections_state,
+            self.duplicate_v_section,
+            self.duplicate_w_section,
+            self.duplicate_p_section,
+            self.duplicate_c_section,
+            self.duplicate_o_section,
+            self.sections_after_a_section,
+            self.v_section_first,
+            self.blank_line_in_section,
+            tuple(self.sections_with_blank_line),
+            self.check_data,
+            # Replaced by iter_data_chunks().
+            self._data_summary,
+        )
+
+    def get_conformity_report(self):
+        """Check the file against the rules in :data:`lascheck.spec.RULES`,
+        and those in :data:`lascheck.spec.DATA_RULES` if ``check_data`` is
+        True.
+
+        Each rule is run once, and the report is reused until the file is
+        modified.
+
+        Returns:
+            :class:`lascheck.report.ConformityReport`
+
+        """
+        if self._deferred_read is not None:
+            self._complete_read()
+        if self._report is None or self._report_state != self._conformity_state():
+            rules = spec.RULES + spec.DATA_RULES if self.check_data else spec.RULES
+            with timing.collect(self.timings):
+                self._report = report.run_rules(self, rules)
+            self._report_state = self._conformity_state()
+        return self._report
+
     def check_conformity(self):
-        return spec.MandatorySections.check(self) and \
-               spec.MandatoryLinesInVersionSection.check(self) and \
-               spec.MandatoryLinesInWellSection.check(self) and \
-               spec.DuplicateSections.check(self) and \
-               spec.ValidIndexMnemonic.check(self) and \
-               spec.VSectionFirst.check(self) and \
-               spec.ValidDepthDividedByStep.check(self) and \
-               spec.BlankLineInSection.check(self) and \
-               spec.ValidUnitForDepth.check(self)
+        if self._cached_result is not None:
+            return self._cached_result.conforming
+        return self.get_conformity_report().conforming
 
     def get_non_conformities(self):
-        if (spec.MandatorySections.check(self)) is False:
-            self.non_conformities.append("Missing mandatory sections: {}".format(spec.MandatorySections.get_missing_mandatory_sections(self)))
-        if ("Version" in self.sections) and (spec.MandatoryLinesInVersionSection.check(self)) is False:
-            self.non_conformities.append("Missing mandatory lines in ~v Section")
-
-        if (spec.MandatoryLinesInWellSection.check(self)) is False:
-            self.non_conformities.append("Missing mandatory lines in ~w Section")
-        elif ('Well' in self.sections) and (spec.ValidDepthDividedByStep.check(self)) is False:
-            for non_conforming_depth in self.non_conforming_depth:
-                self.non_conformities.append("{Mnemonic} divided by step is not a whole number".format(Mnemonic=non_conforming_depth))
-
-        if ('Curves' in self.sections) and (spec.ValidIndexMnemonic.check(self)) is False:
-            self.non_conformities.append("Invalid index mnemonic. "
-                                         "The only valid mnemonics for the index channel are DEPT, DEPTH, TIME, or INDEX.")
-        if (spec.VSectionFirst.check(self)) is False:
-            self.non_conformities.append("~v section not first")
-
-        if (spec.BlankLineInSection.check(self)) is False:
-            for section in self.sections_with_blank_line:
-                self.non_conformities.append(
-                    "Section {} having blank line".format(section))
-        if self.sections_after_a_section:
-            self.non_conformities.append("Sections after ~a section")
-        if (spec.ValidUnitForDepth.check(self)) is False:
-            self.non_conformities.append(
-                    "If the index is depth, the units must be M (metres), F (feet) or FT (feet)")
-        return self.non_conformities
+        if self._cached_result is not None:
+            return list(self._cached_result.non_conformities)
+        return self.get_conformity_report().non_conformities
+
+    @property
+    def non_conformities(self):
+        return self.get_non_conformities()
+
+    def to_summary(self):
+        """Summarize the header sections and conformity of the file.
+
+        Returns:
+            :class:`lascheck.summary.LASSummary`, which holds no curve data
+            or lines of the file, so it is cheap to pickle and send to
+            another process.
+
+        """
+        from .summary import LASSummary
+
+        return LASSummary(self)
+
+    def __getstate__(self):
+        # Parse every section first, so no raw lines of the file are left
+        # to be pickled, and leave out the state which is only needed while
+        # reading or can be rebuilt. The text of the ~A section is left out
+        # too, as its values are in the curves.
+        if self._deferred_read is not None:
+            self._complete_read()
+        sections = self.sections.__class__(
+            (name, "" if name == "Ascii" else self.sections[name])
+            for name in self.sections
+        )
+        state = self.__dict__.copy()
+        state["sections"] = sections
+        state["_text"] = ""
+        state["_data_buffer"] = None
+        data_section = state["_data_section"]
+        if data_section is not None and "ranges" not in data_section:
+            # The lines of a ~A section which was not read from disk.
+            state["_data_section"] = None
+        return state
 
 
 class Las(LASFile):
@@ -736,17 +1398,11 @@ class Las(LASFile):
     pass
 
 
-class JSONEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, LASFile):
-            d = {"metadata": {}, "data": {}}
-            for name, section in obj.sections.items():
-                if isinstance(section, basestring):
-                    d["metadata"][name] = section
-                else:
-                    d["metadata"][name] = []
-                    for item in section:
-                        d["metadata"][name].append(dict(item))
-            for curve in obj.curves:
-                d["data"][curve.mnemonic] = list(curve.data)
-            return d
+def __getattr__(name):
+    # JSONEncoder is defined in lascheck.encoder, so that the json module is
+    # only imported when it is used.
+    if name == "JSONEncoder":
+        from .encoder import JSONEncoder
+
+        return JSONEncoder
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
@@ -1,5 +1,5 @@
-import json
 import logging
+import weakref
 
 # The standard library OrderedDict was introduced in Python 2.7 so
 # we have a third-party option to support Python 2.6
@@ -8,6 +8,57 @@ from collections import OrderedDict
 logger = logging.getLogger(__name__)
 
 
+def _add_section(item, section):
+    '''Record that ``item`` is in ``section``, which is then told whenever
+    the item is modified.
+
+    An item refers to its sections weakly. Usually there is only one, kept
+    as a weak reference; otherwise they are kept in a tuple.
+
+    '''
+    if not isinstance(item, HEADER_ITEM_TYPES):
+        return
+    ref = weakref.ref(section)
+    sections = getattr(item, '_sections', None)
+    if sections is None or sections is ref:
+        sections = ref
+    else:
+        if not isinstance(sections, tuple):
+            sections = (sections, )
+        sections = tuple(
+            r for r in sections if r() is not None and r() is not section)
+        sections = sections + (ref, ) if sections else ref
+    object.__setattr__(item, '_sections', sections)
+
+
+def _remove_section(item, section):
+    '''Record that ``item`` is no longer in ``section``.'''
+    sections = getattr(item, '_sections', None)
+    if sections is None:
+        return
+    if not isinstance(sections, tuple):
+        sections = (sections, )
+    sections = tuple(
+        r for r in sections if r() is not None and r() is not section)
+    if len(sections) < 2:
+        sections = sections[0] if sections else None
+    object.__setattr__(item, '_sections', sections)
+
+
+def _item_changed(item, renamed=False):
+    '''Tell the sections ``item`` is in that it has been modified (and, if
+    ``renamed`` is True, that its mnemonic has changed).'''
+    sections = getattr(item, '_sections', None)
+    if sections is None:
+        return
+    if not isinstance(sections, tuple):
+        sections = (sections, )
+    for ref in sections:
+        section = ref()
+        if section is not None:
+            section._item_changed(renamed)
+
+
 class HeaderItem(OrderedDict):
 
     '''Dictionary/namedtuple-style object for a LAS header line.
@@ -71,7 +122,10 @@ class HeaderItem(OrderedDict):
         for a more in-depth explanation.
 
         '''
+        renamed = self.__dict__.get('mnemonic', value) != value
         super(HeaderItem, self).__setattr__('mnemonic', value)
+        if renamed:
+            _item_changed(self, renamed=True)
 
     def __getitem__(self, key):
         '''Provide item dictionary-like access.'''
@@ -92,7 +146,6 @@ class HeaderItem(OrderedDict):
                 'CurveItem only has restricted items (not %s)' % key)
 
     def __setattr__(self, key, value):
-
         if key == 'mnemonic':
 
             # The user wants to rename the item! This means we must send their
@@ -103,6 +156,9 @@ class HeaderItem(OrderedDict):
             self.set_session_mnemonic_only(self.useful_mnemonic)
         else:
             super(HeaderItem, self).__setattr__(key, value)
+            # A new original mnemonic changes the useful mnemonic, even if
+            # the session mnemonic does not change.
+            _item_changed(self, renamed=key == 'original_mnemonic')
 
     def __repr__(self):
         result = (
@@ -124,6 +180,8 @@ class HeaderItem(OrderedDict):
 
     @property
     def json(self):
+        import json
+
         return json.dumps({
             '_type': self.__class__.__name__,
             'mnemonic': self.original_mnemonic,
@@ -168,6 +226,8 @@ class CurveItem(HeaderItem):
 
     @property
     def json(self):
+        import json
+
         return json.dumps({
             '_type': self.__class__.__name__,
             'mnemonic': self.original_mnemonic,
@@ -182,14 +242,207 @@ class CurveItem(HeaderItem):
         raise Exception('Cannot set objects from JSON')
 
 
+class CompactHeaderItem(object):
+
+    '''Header line with the same attributes and methods as
+    :class:`lascheck.las_items.HeaderItem`, stored in slots.
+
+    A HeaderItem is an (empty) ordered dict with a ``__dict__`` of
+    attributes. This class keeps only the six attributes, so it uses a
+    fraction of the memory, and is what sections are made of when a file is
+    read with ``compact_items=True``. Unlike a HeaderItem, no other
+    attributes can be set on it, and items are only equal to themselves.
+
+    See :class:`lascheck.las_items.HeaderItem` for the arguments.
+
+    '''
+    __slots__ = ('original_mnemonic', 'mnemonic', 'unit', 'value', 'descr',
+                 'data', '_sections')
+
+    def __init__(self, mnemonic='', unit='', value='', descr='', data=None):
+        # Assigned without going through __setattr__, as a new item is not
+        # yet in any section.
+        object.__setattr__(self, '_sections', None)
+        object.__setattr__(self, 'original_mnemonic', mnemonic)
+        object.__setattr__(self, 'mnemonic', self.useful_mnemonic)
+        object.__setattr__(self, 'unit', unit)
+        object.__setattr__(self, 'value', value)
+        object.__setattr__(self, 'descr', descr)
+        object.__setattr__(self, 'data', data)
+
+    useful_mnemonic = HeaderItem.useful_mnemonic
+
+    def set_session_mnemonic_only(self, value):
+        '''Set the mnemonic for session use.
+
+        See :meth:`lascheck.las_items.HeaderItem.set_session_mnemonic_only`.
+
+        '''
+        renamed = getattr(self, 'mnemonic', value) != value
+        object.__setattr__(self, 'mnemonic', value)
+        if renamed:
+            _item_changed(self, renamed=True)
+
+    def __setattr__(self, key, value):
+        if key == 'mnemonic':
+            object.__setattr__(self, 'original_mnemonic', value)
+            self.set_session_mnemonic_only(self.useful_mnemonic)
+            # See HeaderItem.__setattr__.
+            _item_changed(self, renamed=True)
+        else:
+            object.__setattr__(self, key, value)
+            _item_changed(self, renamed=key == 'original_mnemonic')
+
+    __getitem__ = HeaderItem.__getitem__
+    __repr__ = HeaderItem.__repr__
+    _repr_pretty_ = HeaderItem._repr_pretty_
+
+    def __reduce__(self):
+        return self.__class__, (self.original_mnemonic, self.unit, self.value,
+                                self.descr, self.data), self.mnemonic
+
+    def __setstate__(self, mnemonic):
+        object.__setattr__(self, 'mnemonic', mnemonic)
+
+    json = HeaderItem.json
+
+
+class CompactCurveItem(CompactHeaderItem):
+
+    '''Curve with the same attributes and methods as
+    :class:`lascheck.las_items.CurveItem`, stored in slots.
+
+    See :class:`lascheck.las_items.CompactHeaderItem`.
+
+    '''
+    __slots__ = ()
+
+    def __init__(self, mnemonic='', unit='', value='', descr='', data=None):
+        if data is None:
+            data = []
+        super(CompactCurveItem, self).__init__(mnemonic, unit, value, descr,
+                                               data)
+
+    API_code = CurveItem.API_code
+    __repr__ = CurveItem.__repr__
+    json = CurveItem.json
+
+
+# Classes of header items and curves, for isinstance().
+HEADER_ITEM_TYPES = (HeaderItem, CompactHeaderItem)
+CURVE_ITEM_TYPES = (CurveItem, CompactCurveItem)
+
+
+def _assign_suffixes(items, start=0):
+    '''Give items with the same mnemonic the suffixes ':1', ':2', etc., from
+    the item at position ``start``.'''
+    if len(items) > 1:
+        for i in range(start, len(items)):
+            item = items[i]
+            item.set_session_mnemonic_only(item.useful_mnemonic + ':%d' % (i + 1))
+
+
 class SectionItems(list):
 
     '''Variant of a ``list`` which is used to represent a LAS section.
 
+    Items are looked up by mnemonic through a dict from the (normalized)
+    session mnemonic to the position of the first item with that mnemonic.
+    The dict is rebuilt the first time it is needed after the list has been
+    changed, an item has been renamed, or ``mnemonic_transforms`` has been
+    switched. Each item tells the sections it is in when it is modified or
+    renamed, so changes to the items of one section do not affect any
+    other.
+
+    Items with the same useful mnemonic are given the suffixes ':1', ':2',
+    etc. by :meth:`lascheck.las_items.SectionItems.assign_duplicate_suffixes`.
+    To find them, the items are grouped by (normalized) useful mnemonic. The
+    groups are kept up to date as items are appended, so appending an item
+    does not look through the whole section, and are rebuilt after any other
+    change.
+
     '''
     def __init__(self, *args, **kwargs):
         super(SectionItems, self).__init__(*args, **kwargs)
         super(SectionItems, self).__setattr__('mnemonic_transforms', False)
+        for item in self:
+            _add_section(item, self)
+
+    @property
+    def modifications(self):
+        '''Number of times the section or any of its items has been
+        modified.'''
+        return self.__dict__.get('_modifications', 0)
+
+    def _item_changed(self, renamed):
+        '''Called by an item of the section when it is modified.'''
+        state = self.__dict__
+        state['_modifications'] = state.get('_modifications', 0) + 1
+        if renamed:
+            state['_mnemonic_changes'] = state.get('_mnemonic_changes', 0) + 1
+
+    def _mnemonic_state(self):
+        '''Values which change whenever the mnemonics may have changed.'''
+        return (self.__dict__.get('_mnemonic_changes', 0),
+                self.__dict__.get('mnemonic_transforms'))
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for key in ('_positions', '_positions_state', '_groups', '_groups_state',
+                    '_modifications', '_mnemonic_changes'):
+            state.pop(key, None)
+        return state
+
+    def _normalize(self, mnemonic):
+        if self.__dict__.get('mnemonic_transforms') and isinstance(mnemonic, str):
+            return mnemonic.upper()
+        return mnemonic
+
+    def _mnemonic_index(self):
+        '''Return the dict of session mnemonics to positions in the list.'''
+        state = self._mnemonic_state()
+        if self.__dict__.get('_positions_state') != state:
+            index = {}
+            for i, item in enumerate(self):
+                index.setdefault(self._normalize(item.mnemonic), i)
+            self.__dict__['_positions'] = index
+            self.__dict__['_positions_state'] = state
+        return self.__dict__['_positions']
+
+    def _invalidate_index(self):
+        self._item_changed(False)
+        self.__dict__.pop('_positions_state', None)
+        self.__dict__.pop('_groups_state', None)
+
+    def _mnemonic_groups(self):
+        '''Return a dict of (normalized) useful mnemonics to the items with
+        that mnemonic, in order, and the set of the mnemonics whose items are
+        known to have their suffixes.'''
+        state = self._mnemonic_state()
+        if self.__dict__.get('_groups_state') != state:
+            groups = {}
+            for item in self:
+                key = self._normalize(item.useful_mnemonic)
+                if key in groups:
+                    groups[key].append(item)
+                else:
+                    groups[key] = [item]
+            self.__dict__['_groups'] = (groups, set())
+            self.__dict__['_groups_state'] = state
+        return self.__dict__['_groups']
+
+    def _keep_groups(self, groups):
+        '''Mark the groups of items as up to date.'''
+        self.__dict__['_groups'] = groups
+        self.__dict__['_groups_state'] = self._mnemonic_state()
+
+    def _position(self, mnemonic):
+        '''Return the position of the first item with this mnemonic, or None.'''
+        try:
+            return self._mnemonic_index().get(self._normalize(mnemonic))
+        except TypeError:
+            # unhashable
+            return None
 
     def __str__(self):
         rstr_lines = []
@@ -229,16 +482,11 @@ class SectionItems(list):
             bool
 
         '''
-        for item in self:
-            if self.mnemonic_compare(testitem, item.mnemonic):
-                return True
-            elif hasattr(testitem, 'mnemonic'):
-                if self.mnemonic_compare(testitem.mnemonic, item.mnemonic):
-                    return True
-            elif testitem is item:
-                return True
-        else:
-            return False
+        if hasattr(testitem, 'mnemonic'):
+            return self._position(testitem.mnemonic) is not None
+        if self._position(testitem) is not None:
+            return True
+        return any(testitem is item for item in self)
 
     def keys(self):
         '''Return mnemonics of all the HeaderItems in the section.'''
@@ -277,9 +525,9 @@ class SectionItems(list):
         '''
         if isinstance(key, slice):
             return SectionItems(super(SectionItems, self).__getitem__(key))
-        for item in self:
-            if self.mnemonic_compare(item.mnemonic, key):
-                return item
+        ix = self._position(key)
+        if ix is not None:
+            return super(SectionItems, self).__getitem__(ix)
         if isinstance(key, int):
             return super(SectionItems, self).__getitem__(key)
         else:
@@ -292,12 +540,14 @@ class SectionItems(list):
             key (str, int): either a mnemonic or the index to the list.
 
         '''
-        for ix, item in enumerate(self):
-            if self.mnemonic_compare(item.mnemonic, key):
-                super(SectionItems, self).__delitem__(ix)
-                return
-        if isinstance(key, int):
-            super(SectionItems, self).__delitem__(key)
+        ix = self._position(key)
+        if ix is None and isinstance(key, int):
+            ix = key
+        if ix is not None:
+            item = super(SectionItems, self).__getitem__(ix)
+            super(SectionItems, self).__delitem__(ix)
+            _remove_section(item, self)
+            self._invalidate_index()
             return
         else:
             raise KeyError('%s not in %s' % (key, self.keys()))
@@ -309,7 +559,8 @@ class SectionItems(list):
             key (int, str): either the mnemonic or the index.
             newitem (HeaderItem or str/float/int): the thing to be set.
 
-        If ``newitem`` is a :class:`lascheck.las_items.HeaderItem` then the
+        If ``newitem`` is a :class:`lascheck.las_items.HeaderItem` (or
+        :class:`lascheck.las_items.CompactHeaderItem`) then the
         existing item will be replaced. Otherwise the existing item's ``value``
         attribute will be replaced.
 
@@ -329,7 +580,7 @@ class SectionItems(list):
         :meth:`lascheck.las_items.SectionItems.set_item_value`.
 
         '''
-        if isinstance(newitem, HeaderItem):
+        if isinstance(newitem, HEADER_ITEM_TYPES):
             self.set_item(key, newitem)
         else:
             self.set_item_value(key, newitem)
@@ -376,14 +627,16 @@ class SectionItems(list):
         If **key** is not present, it appends **newitem**.
 
         '''
-        for i, item in enumerate(self):
-            if self.mnemonic_compare(key, item.mnemonic):
-
-                # This is very important. We replace items where
-                # 'mnemonic' is equal - i.e. we do not check
-                # against useful_mnemonic or original_mnemonic.
-
-                return super(SectionItems, self).__setitem__(i, newitem)
+        # This is very important. We replace items where
+        # 'mnemonic' is equal - i.e. we do not check
+        # against useful_mnemonic or original_mnemonic.
+
+        i = self._position(key)
+        if i is not None:
+            _remove_section(super(SectionItems, self).__getitem__(i), self)
+            super(SectionItems, self).__setitem__(i, newitem)
+            _add_section(newitem, self)
+            self._invalidate_index()
         else:
             self.append(newitem)
 
@@ -400,14 +653,64 @@ class SectionItems(list):
 
     def append(self, newitem):
         '''Append a new HeaderItem to the object.'''
+        groups = self._mnemonic_groups()
         super(SectionItems, self).append(newitem)
-        self.assign_duplicate_suffixes(newitem.useful_mnemonic)
+        _add_section(newitem, self)
+        self._invalidate_index()
+        items_by_mnemonic, suffixed = groups
+        key = self._normalize(newitem.useful_mnemonic)
+        items = items_by_mnemonic.setdefault(key, [])
+        items.append(newitem)
+        if len(items) > 1:
+            if key in suffixed:
+                # Only the new item needs a suffix.
+                _assign_suffixes(items, len(items) - 1)
+            else:
+                _assign_suffixes(items)
+                suffixed.add(key)
+        self._keep_groups(groups)
 
     def insert(self, i, newitem):
         '''Insert a new HeaderItem to the object.'''
         super(SectionItems, self).insert(i, newitem)
+        _add_section(newitem, self)
+        self._invalidate_index()
         self.assign_duplicate_suffixes(newitem.useful_mnemonic)
 
+    def extend(self, newitems):
+        start = len(self)
+        super(SectionItems, self).extend(newitems)
+        for i in range(start, len(self)):
+            _add_section(super(SectionItems, self).__getitem__(i), self)
+        self._invalidate_index()
+
+    def pop(self, *args):
+        item = super(SectionItems, self).pop(*args)
+        _remove_section(item, self)
+        self._invalidate_index()
+        return item
+
+    def remove(self, item):
+        self.pop(self.index(item))
+
+    def clear(self):
+        for item in self:
+            _remove_section(item, self)
+        super(SectionItems, self).clear()
+        self._invalidate_index()
+
+    def sort(self, *args, **kwargs):
+        super(SectionItems, self).sort(*args, **kwargs)
+        self._invalidate_index()
+
+    def reverse(self):
+        super(SectionItems, self).reverse()
+        self._invalidate_index()
+
+    def __iadd__(self, newitems):
+        self.extend(newitems)
+        return self
+
     def assign_duplicate_suffixes(self, test_mnemonic=None):
         '''Check and re-assign suffixes for duplicate mnemonics.
 
@@ -417,20 +720,17 @@ class SectionItems(list):
 
         '''
         if test_mnemonic is None:
-            for test_mnemonic in {i.useful_mnemonic for i in self}:
-                self.assign_duplicate_suffixes(test_mnemonic)
+            groups = self._mnemonic_groups()
+            items_by_mnemonic, suffixed = groups
+            for key, items in items_by_mnemonic.items():
+                if len(items) > 1:
+                    _assign_suffixes(items)
+                    suffixed.add(key)
+            self._keep_groups(groups)
         else:
-            existing = [item.useful_mnemonic for item in self]
-            locations = []
-            for i, item in enumerate(self):
-                if self.mnemonic_compare(item.useful_mnemonic, test_mnemonic):
-                    locations.append(i)
-            if len(locations) > 1:
-                current_count = 1
-                for i, loc in enumerate(locations):
-                    item = self[loc]
-                    item.set_session_mnemonic_only(item.useful_mnemonic + ':%d'
-                                                % (i + 1))
+            _assign_suffixes([
+                item for item in self
+                if self.mnemonic_compare(item.useful_mnemonic, test_mnemonic)])
 
     def dictview(self):
         '''View of mnemonics and values as a dict.
@@ -443,6 +743,8 @@ class SectionItems(list):
 
     @property
     def json(self):
+        import json
+
         return json.dumps(
             [item.json for item in self.values()])
 
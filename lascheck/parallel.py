@@ -0,0 +1,534 @@
+"""Parse the ~A section of one large LAS file on several cores.
+
+The bytes of the ~A section are split at line boundaries into chunks of
+about :data:`CHUNK_BYTES`, which are parsed into arrays of values by a pool
+of processes and handed back through files mapped into memory rather than
+pickled (see :class:`SharedArray`). The values are then arranged into rows
+here, in the order of the lines, by the same code as
+:func:`lascheck.reader.iter_data_chunks`, so rows (and wrapped records)
+which run across the end of a chunk are completed by the next one, and the
+data rules such as the monotonicity of the index are checked across the
+seams between chunks exactly as they are for a file read on one core.
+To read the whole section into one array, :func:`read_data_section` has the
+workers copy the values into a single mapped file as well, so the array is
+not assembled here.
+
+Example::
+
+    >>> las = lascheck.read("huge.las", data_workers=16)
+    >>> lascheck.validate("huge.las", check_data=True, data_workers=16)
+
+"""
+import logging
+import os
+import shutil
+import tempfile
+
+from . import reader
+
+logger = logging.getLogger(__name__)
+
+# Approximate number of bytes of the ~A section parsed by each task.
+CHUNK_BYTES = 8 * 1024 * 1024
+
+# Directory in which the workers place the arrays they have parsed. None uses
+# /dev/shm where it exists (so the arrays stay in memory) and otherwise the
+# default temporary directory.
+SHARED_DIR = None
+
+
+def split_ranges(filename, ranges, chunk_bytes=None):
+    """Split byte ranges of a file into chunks which end at line ends.
+
+    Arguments:
+        filename (str): path to file
+        ranges (list): tuples of (start byte, end byte, line number of the
+            first line), as in the ``"ranges"`` of a raw section from
+            :func:`lascheck.reader.index_data_section`
+
+    Keyword Arguments:
+        chunk_bytes (int): approximate size of each chunk. Defaults to
+            :data:`CHUNK_BYTES`.
+
+    Returns:
+        list of (start byte, end byte, line number) for each chunk. The line
+        number is that of the first line for the first chunk of each range,
+        and None for the others.
+
+    """
+    if chunk_bytes is None:
+        chunk_bytes = CHUNK_BYTES
+    chunks = []
+    with open(filename, mode="rb") as f:
+        for start, end, line_no in ranges:
+            while start < end:
+                cut = start + chunk_bytes
+                if cut >= end:
+                    cut = end
+                else:
+                    f.seek(cut)
+                    while True:
+                        buf = f.read(65536)
+                        newline = buf.find(b"\n")
+                        if newline >= 0:
+                            cut = min(cut + newline + 1, end)
+                            break
+                        cut += len(buf)
+                        if not buf or cut >= end:
+                            cut = end
+                            break
+                chunks.append((start, cut, line_no))
+                start = cut
+                line_no = None
+    return chunks
+
+
+class _NonAsciiLines(object):
+
+    """Collects the line numbers of non-ASCII lines in a worker, in place of
+    a :class:`lascheck.data.DataSummary`."""
+
+    def __init__(self):
+        self.line_nos = []
+
+    def add_non_ascii_lines(self, line_nos):
+        self.line_nos.append(line_nos)
+
+
+class SharedArray(object):
+
+    """A 1-D array which a worker has written to a file, to be mapped into
+    memory by the parent rather than pickled and sent through a pipe.
+
+    Arguments:
+        path (str): the file holding the values
+        dtype (str): numpy dtype of the values
+        size (int): number of values
+
+    """
+
+    def __init__(self, path, dtype, size):
+        self.path = path
+        self.dtype = dtype
+        self.size = size
+
+    @classmethod
+    def from_array(cls, directory, array):
+        """Write a 1-D array to a new file in **directory**."""
+        fd, path = tempfile.mkstemp(suffix=".bin", dir=directory)
+        with os.fdopen(fd, "wb") as f:
+            array.tofile(f)
+        return cls(path, array.dtype.str, array.size)
+
+    def attach(self):
+        """Map the values into memory and remove the file.
+
+        Returns:
+            numpy array backed by the mapping, which lasts as long as the
+            array (and any views of it). Changes to the array are not written
+            back to the file.
+
+        """
+        import numpy as np
+
+        if self.size:
+            array = np.memmap(
+                self.path, dtype=self.dtype, mode="c", shape=(self.size,)
+            ).view(np.ndarray)
+        else:
+            array = np.empty(0, dtype=self.dtype)
+        self.release()
+        return array
+
+    def release(self):
+        """Remove the file. The values stay mapped where already attached."""
+        try:
+            os.remove(self.path)
+        except OSError:
+            # Gone already, or (on Windows) still mapped: it is removed with
+            # its directory by iter_data_chunks().
+            pass
+
+
+def _shared_dir():
+    """Make a temporary directory for the arrays of one ~A section."""
+    parent = SHARED_DIR
+    if parent is None and os.path.isdir("/dev/shm"):
+        parent = "/dev/shm"
+    return tempfile.mkdtemp(prefix="lascheck-", dir=parent)
+
+
+def _attach(array):
+    if isinstance(array, SharedArray):
+        return array.attach()
+    return array
+
+
+def parse_chunk(
+    filename, start, end, clean, regexp_subs, value_null_subs, directory=None
+):
+    """Parse a chunk of the ~A section of a file. This is run by the workers.
+
+    Arguments:
+        filename (str): path to file
+        start (int): first byte of the chunk
+        end (int): byte after the end of the chunk, at the end of a line
+        clean (bool): True if the chunk is known to have no blank lines or
+            comments
+        regexp_subs (list): from :func:`lascheck.reader.get_substitutions`
+        value_null_subs (list): values to replace with NaN
+
+    Keyword Arguments:
+        directory (str): if given, the arrays of the data lines are written
+            to files in this directory and returned as
+            :class:`lascheck.parallel.SharedArray`.
+
+    Returns:
+        tuple of the number of lines in the chunk, and arrays of the
+        line numbers, values and number of values of the data lines, and of
+        the line numbers of the lines with non-ASCII characters. Line
+        numbers count from 0 at the start of the chunk.
+
+    """
+    import numpy as np
+
+    non_ascii = _NonAsciiLines()
+    line_counts = []
+    line_blocks = reader.iter_section_line_blocks(
+        filename,
+        [(start, end, 0)],
+        None,
+        clean=clean,
+        line_counts=line_counts,
+        joined=True,
+    )
+    parsed = list(
+        reader._iter_parsed_lines(
+            np, line_blocks, reader.DATA_CHUNK_ROWS, regexp_subs, non_ascii
+        )
+    )
+    if parsed:
+        line_nos, values, counts = [np.concatenate(arrays) for arrays in zip(*parsed)]
+    else:
+        line_nos = np.empty(0, dtype=int)
+        values = np.empty(0)
+        counts = np.empty(0, dtype=int)
+    if value_null_subs:
+        values[np.isin(values, value_null_subs)] = np.nan
+    if non_ascii.line_nos:
+        non_ascii_line_nos = np.concatenate(non_ascii.line_nos)
+    else:
+        non_ascii_line_nos = np.empty(0, dtype=int)
+    nlines = sum(line_counts)
+    if directory is not None:
+        line_nos, values, counts = [
+            SharedArray.from_array(directory, array)
+            for array in (line_nos, values, counts)
+        ]
+    return nlines, line_nos, values, counts, non_ascii_line_nos
+
+
+def copy_chunk(arrays, outputs, offsets, line_no):
+    """Copy the arrays of a parsed chunk into the files of the whole section.
+    This is run by the workers.
+
+    Arguments:
+        arrays (tuple): :class:`lascheck.parallel.SharedArray` of the line
+            numbers, values and counts, from :func:`parse_chunk`
+        outputs (tuple): paths of the files of the line numbers, values and
+            counts of the whole section
+        offsets (tuple): index at which the chunk starts in the line numbers
+            and counts, and in the values
+        line_no (int): line number of the first line of the chunk, added to
+            its line numbers
+
+    """
+    line_nos, values, counts = [array.attach() for array in arrays]
+    line_offset, value_offset = offsets
+    for path, offset, array in zip(
+        outputs,
+        (line_offset, value_offset, line_offset),
+        (line_nos + line_no, values, counts),
+    ):
+        if array.size:
+            with open(path, mode="r+b") as f:
+                f.seek(offset * array.itemsize)
+                f.write(memoryview(array))
+
+
+def _iter_chunk_results(
+    executor,
+    filename,
+    chunks,
+    clean,
+    regexp_subs,
+    value_null_subs,
+    workers,
+    directory,
+):
+    """Parse chunks in ``executor``, a few per worker at a time.
+
+    Returns:
+        generator of (line number of the first line, result of
+        :func:`parse_chunk`) for each chunk, in order.
+
+    """
+    todo = iter(chunks)
+    pending = []
+    max_pending = workers * 2
+    line_no = None
+    try:
+        while True:
+            for start, end, first_line_no in todo:
+                pending.append(
+                    (
+                        first_line_no,
+                        executor.submit(
+                            parse_chunk,
+                            filename,
+                            start,
+                            end,
+                            clean,
+                            regexp_subs,
+                            value_null_subs,
+                            directory,
+                        ),
+                    )
+                )
+                if len(pending) >= max_pending:
+                    break
+            if not pending:
+                return
+            first_line_no, future = pending.pop(0)
+            if first_line_no is not None:
+                line_no = first_line_no
+            result = future.result()
+            yield line_no, result
+            line_no += result[0]
+    finally:
+        for first_line_no, future in pending:
+            future.cancel()
+
+
+def _iter_parsed_chunks(results, summary):
+    """Map the arrays of each chunk into memory.
+
+    Arguments:
+        results: from :func:`_iter_chunk_results`
+        summary (:class:`lascheck.data.DataSummary`): given the non-ASCII
+            lines
+
+    Returns:
+        generator of (line numbers, values, counts) for each chunk, in
+        order, with the line numbers of the file.
+
+    """
+    for line_no, (nlines, line_nos, values, counts, non_ascii) in results:
+        line_nos, values, counts = [
+            _attach(array) for array in (line_nos, values, counts)
+        ]
+        if summary is not None and len(non_ascii):
+            summary.add_non_ascii_lines(non_ascii + line_no)
+        if len(counts):
+            yield line_nos + line_no, values, counts
+
+
+def iter_data_chunks(
+    filename,
+    raw_section,
+    ncurves,
+    regexp_subs,
+    value_null_subs,
+    workers=None,
+    summary=None,
+    wrapped=False,
+    state=None,
+    chunk_bytes=None,
+):
+    """Parse the ~A section of a file on disk into 2-D arrays using a pool
+    of processes.
+
+    Arguments:
+        filename (str): path to file
+        raw_section (dict): the ~A section, from
+            :func:`lascheck.reader.index_data_section`
+        ncurves (int): number of curves in the ~C section
+        regexp_subs (list): regular expression substitutions, from
+            :func:`lascheck.reader.get_substitutions`
+        value_null_subs (list): values to replace with NaN
+
+    Keyword Arguments:
+        workers (int): number of processes. None (the default) uses one per
+            CPU.
+        summary, wrapped, state: as for
+            :func:`lascheck.reader.iter_data_chunks`
+        chunk_bytes (int): approximate number of bytes parsed by each task.
+            Defaults to :data:`CHUNK_BYTES`.
+
+    Returns:
+        generator of (line number, block) as from
+        :func:`lascheck.reader.iter_data_chunks`, with a block for each
+        chunk. The results are the same, but the blocks are larger.
+
+    Only a few chunks per worker are parsed ahead of the blocks which have
+    been yielded, so the memory used is bounded whatever the size of the
+    file. Closing the generator early cancels the chunks not yet started.
+
+    The workers do not send the arrays they parse back through a pipe, but
+    write them to files in a temporary directory (see :data:`SHARED_DIR`)
+    which are mapped into memory here, so the blocks of whole rows are views
+    of the pages the workers wrote. Each file is removed as soon as it is
+    mapped, and the directory, with the files of any chunks not used, when
+    the generator finishes or is closed.
+
+    """
+    import concurrent.futures
+
+    import numpy as np
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if state is None:
+        state = reader.DataChunkState()
+    chunks = split_ranges(filename, raw_section["ranges"], chunk_bytes)
+    logger.debug(
+        "Parsing the ~A section of {} in {} chunks on {} processes".format(
+            filename, len(chunks), workers
+        )
+    )
+    directory = _shared_dir()
+    try:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            results = _iter_chunk_results(
+                executor,
+                filename,
+                chunks,
+                raw_section["clean"],
+                regexp_subs,
+                value_null_subs,
+                workers,
+                directory,
+            )
+            parsed = _iter_parsed_chunks(results, summary)
+            try:
+                # The null values have been replaced by the workers.
+                for item in reader._iter_data_blocks(
+                    np, parsed, ncurves, [], summary, wrapped, state
+                ):
+                    yield item
+            finally:
+                # Cancel the chunks not yet started before waiting for the pool.
+                parsed.close()
+                results.close()
+    finally:
+        # Remove the arrays of chunks parsed but not used, once no worker
+        # can add any more.
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def read_data_section(
+    filename,
+    raw_section,
+    ncurves,
+    regexp_subs,
+    value_null_subs,
+    workers=None,
+    summary=None,
+    state=None,
+    chunk_bytes=None,
+):
+    """Parse the ~A section of a file on disk into one 2-D array using a pool
+    of processes. The data must not be wrapped.
+
+    Arguments and keyword arguments are as for
+    :func:`lascheck.parallel.iter_data_chunks`.
+
+    Returns:
+        2-D array of the rows, as :func:`numpy.concatenate` of the blocks
+        from :func:`lascheck.parallel.iter_data_chunks` would be.
+
+    Rather than hand each chunk back to be copied into the array here, the
+    workers copy the values they parsed into one file for the whole section
+    (in the same directory as the arrays of the chunks), at the index where
+    the chunks before theirs end, and the array returned is that file mapped
+    into memory, so the curve data are views of the pages the workers wrote.
+    The file is removed as soon as it is mapped.
+
+    """
+    import concurrent.futures
+
+    import numpy as np
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if state is None:
+        state = reader.DataChunkState()
+    chunks = split_ranges(filename, raw_section["ranges"], chunk_bytes)
+    logger.debug(
+        "Parsing the ~A section of {} in {} chunks on {} processes".format(
+            filename, len(chunks), workers
+        )
+    )
+    directory = _shared_dir()
+    try:
+        outputs = [
+            os.path.join(directory, name) for name in ("line_nos", "values", "counts")
+        ]
+        for path in outputs:
+            open(path, mode="wb").close()
+        nlines = nvalues = 0
+        dtypes = (np.dtype(int).str, np.dtype(float).str, np.dtype(int).str)
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            results = _iter_chunk_results(
+                executor,
+                filename,
+                chunks,
+                raw_section["clean"],
+                regexp_subs,
+                value_null_subs,
+                workers,
+                directory,
+            )
+            copies = []
+            try:
+                for line_no, result in results:
+                    chunk_nlines, line_nos, values, counts, non_ascii = result
+                    if summary is not None and len(non_ascii):
+                        summary.add_non_ascii_lines(non_ascii + line_no)
+                    copies.append(
+                        executor.submit(
+                            copy_chunk,
+                            (line_nos, values, counts),
+                            outputs,
+                            (nlines, nvalues),
+                            line_no,
+                        )
+                    )
+                    nlines += counts.size
+                    nvalues += values.size
+                    dtypes = (line_nos.dtype, values.dtype, counts.dtype)
+                for future in copies:
+                    future.result()
+            finally:
+                results.close()
+        line_nos, counts = [
+            SharedArray(path, dtype, nlines).attach()
+            for path, dtype in ((outputs[0], dtypes[0]), (outputs[2], dtypes[2]))
+        ]
+        ncols = max(ncurves, int(counts[0])) if nlines else 0
+        if not ncols:
+            return np.empty((0, ncurves))
+        # Pad the values to whole rows, as the last row is padded with NaN.
+        nrows = -(-nvalues // ncols)
+        with open(outputs[1], mode="ab") as f:
+            f.write(memoryview(np.full(nrows * ncols - nvalues, np.nan, dtypes[1])))
+        values = SharedArray(outputs[1], dtypes[1], nrows * ncols).attach()
+        # The null values have been replaced by the workers, and the blocks
+        # are views of the values, so only the summary and state are kept.
+        for item in reader._iter_data_blocks(
+            np, [(line_nos, values[:nvalues], counts)], ncurves, [], summary, False, state
+        ):
+            pass
+        return values.reshape(nrows, ncols)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
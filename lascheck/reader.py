@@ -1,4 +1,8 @@
 import codecs
+import copy
+import functools
+import io
+import itertools
 import logging
 import os
 import re
@@ -24,7 +28,10 @@ else:
 
 from . import defaults
 from . import exceptions
+from . import scanner
+from . import timing
 from .las_items import HeaderItem, CurveItem, SectionItems, OrderedDict
+from .las_items import CompactHeaderItem, CompactCurveItem
 
 
 logger = logging.getLogger(__name__)
@@ -41,6 +48,7 @@ URL_REGEXP = re.compile(
 )
 
 
+@timing.timed("open_file")
 def open_file(file_ref, **encoding_kwargs):
     """Open a file if necessary.
 
@@ -63,7 +71,9 @@ def open_file(file_ref, **encoding_kwargs):
     if isinstance(file_ref, str):  # file_ref != file-like object, so what is it?
         lines = file_ref.splitlines()
         first_line = lines[0]
-        if URL_REGEXP.match(first_line):  # it's a URL
+        if first_line[:3].lower() in ("htt", "ftp") and URL_REGEXP.match(
+            first_line
+        ):  # it's a URL
             logger.info("Loading URL {}".format(first_line))
             try:
                 import urllib2
@@ -92,6 +102,7 @@ def open_file(file_ref, **encoding_kwargs):
     return file_ref, encoding
 
 
+@timing.timed("open_with_codecs")
 def open_with_codecs(
     filename,
     encoding=None,
@@ -132,58 +143,102 @@ def open_with_codecs(
     else:
         nbytes = None
 
+    # The file is only opened once: the encoding is found from its first
+    # bytes, and the same handle is then decoded.
+    f = open(filename, mode="rb")
+    try:
+        if nbytes is None:
+            raw = f.read()
+        else:
+            raw = f.read(max(nbytes, HEAD_BYTES))
+        f.seek(0)
+    except Exception:
+        f.close()
+        raise
+    encoding = detect_encoding(
+        raw[:nbytes], encoding=encoding, autodetect_encoding=autodetect_encoding
+    )
+
+    # Now open and return the file-like object
+    logger.info(
+        'Opening {} as {} and treating errors with "{}"'.format(
+            filename, encoding, encoding_errors
+        )
+    )
+    if encoding is None:
+        return io.TextIOWrapper(f, errors=encoding_errors), encoding
+    info = codecs.lookup(encoding)
+    file_obj = codecs.StreamReaderWriter(
+        f, info.streamreader, info.streamwriter, encoding_errors
+    )
+    file_obj.encoding = encoding
+    file_obj.head = raw[:HEAD_BYTES]
+    return file_obj, encoding
+
+
+# Number of bytes read from the start of a file on disk to find its
+# encoding and check how its lines end.
+HEAD_BYTES = 65536
+
+
+def detect_encoding(raw, encoding=None, autodetect_encoding=True):
+    """Find the character encoding of a file from its first bytes.
+
+    Arguments:
+        raw (bytes): the first bytes of the file
+
+    Keyword Arguments:
+        encoding (str): the encoding to use, unless the file starts with a
+            UTF-8 BOM
+        autodetect_encoding (str or bool): see
+            :func:`lascheck.reader.open_with_codecs`
+
+    Returns:
+        the name of the encoding, or None if none could be found
+
+    """
     # Forget [c]chardet - if we can locate the BOM we just assume that's correct.
-    nbytes_test = min(32, os.path.getsize(filename))
-    with open(filename, mode="rb") as test:
-        raw = test.read(nbytes_test)
     if raw.startswith(codecs.BOM_UTF8):
-        encoding = "utf-8-sig"
-        autodetect_encoding = False
-
-    # If BOM wasn't found...
-    if (autodetect_encoding) and (not encoding):
-        with open(filename, mode="rb") as test:
-            if nbytes is None:
-                raw = test.read()
-            else:
-                raw = test.read(nbytes)
+        return "utf-8-sig"
+
+    if autodetect_encoding and not encoding:
         encoding = get_encoding(autodetect_encoding, raw)
-        autodetect_encoding = False
 
     # Or if no BOM found & chardet not installed
-    if (not autodetect_encoding) and (not encoding):
-        encoding = adhoc_test_encoding(filename)
+    if not encoding:
+        encoding = adhoc_test_encoding(raw)
         if encoding:
             logger.info(
                 "{} was found by ad hoc to work but note it might not"
                 " be the correct encoding".format(encoding)
             )
+    return encoding
 
-    # Now open and return the file-like object
-    logger.info(
-        'Opening {} as {} and treating errors with "{}"'.format(
-            filename, encoding, encoding_errors
-        )
-    )
-    file_obj = codecs.open(
-        filename, mode="r", encoding=encoding, errors=encoding_errors
-    )
-    return file_obj, encoding
 
+def adhoc_test_encoding(raw):
+    """Try some common encodings on the first line of a file.
+
+    Arguments:
+        raw (bytes or str): the first bytes of the file, or its path
+
+    Returns:
+        the first encoding which can decode the line, or None
 
-def adhoc_test_encoding(filename):
+    """
+    if not isinstance(raw, bytes):
+        with open(raw, mode="rb") as f:
+            raw = f.read(HEAD_BYTES)
+    lines = raw.splitlines()
+    first_line = lines[0] if lines else b""
     test_encodings = ["ascii", "windows-1252", "latin-1"]
-    for i in test_encodings:
-        encoding = i
-        with codecs.open(filename, mode="r", encoding=encoding) as f:
-            try:
-                f.readline()
-                break
-            except UnicodeDecodeError:
-                logger.debug("{} tested, raised UnicodeDecodeError".format(i))
-                pass
-            encoding = None
-    return encoding
+    for encoding in test_encodings:
+        try:
+            first_line.decode(encoding)
+        except UnicodeDecodeError:
+            logger.debug("{} tested, raised UnicodeDecodeError".format(encoding))
+        else:
+            return encoding
+    return None
 
 
 def get_encoding(auto, raw):
@@ -238,6 +293,7 @@ def get_encoding(auto, raw):
     return result["encoding"]
 
 
+@timing.timed("read_file_contents")
 def read_file_contents(file_obj, regexp_subs, value_null_subs, ignore_data=False):
     """Read file contents into memory.
 
@@ -247,7 +303,8 @@ def read_file_contents(file_obj, regexp_subs, value_null_subs, ignore_data=False
     Keyword Arguments:
         null_subs (bool): True will substitute ``numpy.nan`` for invalid values
         ignore_data (bool): if True, do not read in the numerical data in the
-            ~ASCII section
+            ~ASCII section. The data lines are counted but not kept, so the
+            memory used does not depend on the size of the ~A section.
 
     Returns:
         OrderedDict
@@ -259,7 +316,8 @@ def read_file_contents(file_obj, regexp_subs, value_null_subs, ignore_data=False
         {"section_type": "header",
          "title": str,               # title of section (including the ~)
          "lines": [str, ],           # a list of the lines from the lAS file
-         "line_nos": [int, ]         # line nos from the original file
+         "line_nos": [int, ],        # line nos from the original file
+         "nlines": int               # no. of non-comment lines in the section
          }
 
     or::
@@ -281,7 +339,9 @@ def read_file_contents(file_obj, regexp_subs, value_null_subs, ignore_data=False
     sections_after_a_section = False
     v_section_first = False
     blank_line_in_section = False
-    sections_with_blank_line = [] 
+    sections_with_blank_line = []
+    sect_nlines = 0
+    skip_lines = False
 
     for i, line in enumerate(file_obj):
         line = line.strip()
@@ -308,32 +368,614 @@ def read_file_contents(file_obj, regexp_subs, value_null_subs, ignore_data=False
                     "title": sect_title_line,
                     "lines": sect_lines,
                     "line_nos": sect_line_nos,
+                    "nlines": sect_nlines,
                 }
 
                 sect_lines = []
                 sect_line_nos = []
+                sect_nlines = 0
             else:
                 # We are entering into a section for the first time
                 section_exists = True
                 pass
             sect_title_line = line  # either way... this is the case.
+            # When the data is ignored the ~A lines are only counted, so
+            # that memory use does not grow with the size of the file.
+            skip_lines = ignore_data and line[:2].upper() == "~A"
 
         else:
             # We are in the middle of a section.
             if not line.startswith("#"):  # ignore commented-out lines.. for now.
-                sect_lines.append(line)
-                sect_line_nos.append(i + 1)
+                sect_nlines += 1
+                if not skip_lines:
+                    sect_lines.append(line)
+                    sect_line_nos.append(i + 1)
 
     sections[sect_title_line] = {
         "section_type": "data",
         "title": sect_title_line,
         "line_nos": sect_line_nos,
-        "lines": sect_lines
+        "lines": sect_lines,
+        "nlines": sect_nlines,
     }
 
     return sections, sections_after_a_section, v_section_first, blank_line_in_section, sections_with_blank_line
 
 
+class IndexedRawSection(dict):
+
+    """Raw section whose lines are only read from the file when needed.
+
+    This is a dict with the same keys as the raw sections returned by
+    :func:`lascheck.reader.read_file_contents`. The ``"lines"`` and
+    ``"line_nos"`` items are read and decoded from the file the first time
+    either is looked up. They are not pickled, so a pickled copy reads them
+    again.
+
+    Arguments:
+        iter_lines (callable): returns an iterator of (line number, line)
+            for each line of the section
+
+    Keyword Arguments:
+        iter_byte_blocks (callable): returns an iterator of (line numbers,
+            lines) for blocks of lines, with each line as bytes rather than
+            decoded, or with the lines as the bytes of the file if they
+            need no splitting (see
+            :func:`lascheck.reader.iter_section_line_blocks`)
+
+    """
+
+    def __init__(self, iter_lines, iter_byte_blocks=None, **kwargs):
+        super(IndexedRawSection, self).__init__(**kwargs)
+        self.iter_lines = iter_lines
+        self.iter_byte_blocks = iter_byte_blocks
+
+    def __missing__(self, key):
+        if key in ("lines", "line_nos"):
+            numbered_lines = list(self.iter_lines())
+            self["line_nos"] = [line_no for line_no, line in numbered_lines]
+            self["lines"] = [line for line_no, line in numbered_lines]
+            return self[key]
+        raise KeyError(key)
+
+    def __reduce__(self):
+        items = [(k, v) for k, v in self.items() if k not in ("lines", "line_nos")]
+        return (
+            self.__class__,
+            (self.iter_lines, self.iter_byte_blocks),
+            None,
+            None,
+            iter(items),
+        )
+
+
+def iter_raw_section_lines(raw_section):
+    """Iterate over the lines of a raw section.
+
+    Arguments:
+        raw_section (dict): from :func:`lascheck.reader.read_file_contents`
+            or :func:`lascheck.reader.read_file_index`
+
+    Returns:
+        iterator of (line number, line). Lines of an
+        :class:`lascheck.reader.IndexedRawSection` which have not been
+        looked up are read from the file a block at a time, even if the
+        section was indexed with ``ignore_data=True``.
+
+    """
+    if isinstance(raw_section, IndexedRawSection) and not raw_section.get("lines"):
+        return raw_section.iter_lines()
+    return zip(raw_section["line_nos"], raw_section["lines"])
+
+
+def iter_raw_section_blocks(raw_section, rows=65536):
+    """Iterate over the lines of a raw section a block at a time.
+
+    Arguments:
+        raw_section (dict): from :func:`lascheck.reader.read_file_contents`
+            or :func:`lascheck.reader.read_file_index`
+
+    Keyword Arguments:
+        rows (int): number of lines in each block, if they are already in
+            memory
+
+    Returns:
+        iterator of (line numbers, lines) for each block. The lines of an
+        :class:`lascheck.reader.IndexedRawSection` which have not been
+        looked up are read from the file a block at a time, as bytes if it
+        has ``iter_byte_blocks``.
+
+    """
+    if isinstance(raw_section, IndexedRawSection) and not raw_section.get("lines"):
+        if raw_section.iter_byte_blocks is not None:
+            return raw_section.iter_byte_blocks()
+        return _iter_line_blocks(raw_section.iter_lines(), rows)
+    line_nos = raw_section["line_nos"]
+    lines = raw_section["lines"]
+    return (
+        (line_nos[start:start + rows], lines[start:start + rows])
+        for start in range(0, len(lines), rows)
+    )
+
+
+def _iter_line_blocks(numbered_lines, rows):
+    """Group (line number, line) pairs into blocks of (line numbers, lines)."""
+    numbered_lines = iter(numbered_lines)
+    while True:
+        chunk = list(itertools.islice(numbered_lines, rows))
+        if not chunk:
+            return
+        yield [line_no for line_no, line in chunk], [line for line_no, line in chunk]
+
+
+# Number of bytes read at a time by iter_section_lines().
+SECTION_READ_SIZE = 1024 * 1024
+
+
+class CachedRange(object):
+
+    """Part of a file on disk, read the first time it is needed.
+
+    Arguments:
+        filename (str): path to file
+        start (int): first byte of the range
+        end (int): byte after the end of the range
+
+    Keyword Arguments:
+        data (bytes): the bytes of the range, if they have already been read
+
+    The bytes are not pickled, so a pickled copy reads the file again.
+
+    """
+
+    def __init__(self, filename, start, end, data=None):
+        self.filename = filename
+        self.start = start
+        self.end = end
+        self._bytes = data
+
+    def read(self, start, end):
+        """Return bytes ``start`` to ``end`` of the file, which must lie
+        within the range."""
+        if self._bytes is None:
+            with open(self.filename, mode="rb") as f:
+                f.seek(self.start)
+                self._bytes = f.read(self.end - self.start)
+        return self._bytes[start - self.start:end - self.start]
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state["_bytes"] = None
+        return state
+
+
+def _decode(buf, encoding, encoding_errors):
+    return buf if encoding is None else buf.decode(encoding, encoding_errors)
+
+
+def _iter_range_text(f, start, end, encoding, encoding_errors):
+    """Decode bytes ``start`` to ``end`` of an open file, a whole number of
+    lines at a time (or return them undecoded if ``encoding`` is None)."""
+    f.seek(start)
+    remaining = end - start
+    while remaining > 0:
+        buf = f.read(min(SECTION_READ_SIZE, remaining))
+        if not buf:
+            break
+        if len(buf) < remaining:
+            # Only decode whole lines, and read the rest again with the next
+            # block, rather than joining it onto the next block.
+            cut = buf.rfind(b"\n") + 1
+            if cut:
+                f.seek(cut - len(buf), os.SEEK_CUR)
+                buf = buf[:cut]
+            else:
+                # A line longer than a block.
+                rest = f.readline(remaining - len(buf))
+                buf += rest
+        remaining -= len(buf)
+        yield _decode(buf, encoding, encoding_errors)
+
+
+def iter_section_line_blocks(
+    filename,
+    ranges,
+    encoding,
+    encoding_errors="replace",
+    cache=None,
+    clean=False,
+    line_counts=None,
+    joined=False,
+):
+    """Read the lines of a section from a LAS file on disk, a block at a time.
+
+    Arguments:
+        filename (str): path to file
+        ranges (list): tuples of (start byte, end byte, line number of the
+            first line) to read
+        encoding (str): character encoding of the file, or None to return
+            the lines as bytes
+
+    Keyword Arguments:
+        encoding_errors (str): see :func:`lascheck.reader.open_with_codecs`
+        cache (:class:`lascheck.reader.CachedRange`): if given, the bytes are
+            taken from it rather than read from the file
+        clean (bool): True if the ranges are known to have no blank lines or
+            comments
+        line_counts (list): if given, the number of lines in each block,
+            including the blank lines and comments skipped, is appended to it
+        joined (bool): with ``clean=True`` and no encoding, give the lines of
+            each block as the bytes read from the file (whole lines, with
+            their line ends) rather than a list, unless they have line ends
+            other than ``\\n`` and ``\\r\\n``
+
+    Returns:
+        generator of (line numbers, lines) for each block of up to
+        :data:`SECTION_READ_SIZE` bytes, skipping blank lines and comments
+        in the same way as :func:`lascheck.reader.read_file_contents`. The
+        line numbers are a ``range`` if no lines were skipped, otherwise a
+        list. With ``clean=True``, lines returned as bytes are not stripped
+        of whitespace.
+
+    """
+    if not ranges:
+        return
+    comment = "#" if encoding else b"#"
+    if cache is not None:
+        texts = (
+            (line_no, [_decode(cache.read(start, end), encoding, encoding_errors)])
+            for start, end, line_no in ranges
+        )
+        f = None
+    else:
+        f = open(filename, mode="rb")
+        texts = (
+            (line_no, _iter_range_text(f, start, end, encoding, encoding_errors))
+            for start, end, line_no in ranges
+        )
+    try:
+        for line_no, range_texts in texts:
+            for text in range_texts:
+                if joined and clean and encoding is None and (
+                    b"\r" not in text or text.count(b"\r") == text.count(b"\r\n")
+                ):
+                    nlines = text.count(b"\n") + (not text.endswith(b"\n"))
+                    if line_counts is not None:
+                        line_counts.append(nlines)
+                    line_no += nlines
+                    yield range(line_no - nlines, line_no), text
+                    continue
+                lines = text.splitlines()
+                first_line_no = line_no
+                line_no += len(lines)
+                if line_counts is not None:
+                    line_counts.append(len(lines))
+                if clean and encoding is None:
+                    # Nothing to skip, and the data parser does not need the
+                    # lines to be stripped.
+                    yield range(first_line_no, line_no), lines
+                    continue
+                lines = [line.strip() for line in lines]
+                if comment not in text and all(lines):
+                    if lines:
+                        yield range(first_line_no, line_no), lines
+                    continue
+                keep = [
+                    i
+                    for i, line in enumerate(lines)
+                    if line and not line.startswith(comment)
+                ]
+                if keep:
+                    yield [first_line_no + i for i in keep], [lines[i] for i in keep]
+    finally:
+        if f is not None:
+            f.close()
+
+
+def iter_section_lines(
+    filename, ranges, encoding, encoding_errors="replace", cache=None
+):
+    """Read the lines of a section from a LAS file on disk.
+
+    See :func:`lascheck.reader.iter_section_line_blocks` for the arguments.
+
+    Returns:
+        generator of (line number, line), skipping blank lines and comments
+        in the same way as :func:`lascheck.reader.read_file_contents`.
+
+    """
+    for line_nos, lines in iter_section_line_blocks(
+        filename, ranges, encoding, encoding_errors, cache=cache
+    ):
+        for item in zip(line_nos, lines):
+            yield item
+
+
+def read_section_lines(filename, ranges, encoding, encoding_errors="replace"):
+    """Read the lines of a section from a LAS file on disk.
+
+    See :func:`lascheck.reader.iter_section_lines` for the arguments.
+
+    Returns:
+        the lists of lines and line numbers, skipping blank lines and comments
+        in the same way as :func:`lascheck.reader.read_file_contents`.
+
+    """
+    lines = []
+    line_nos = []
+    for line_no, line in iter_section_lines(filename, ranges, encoding, encoding_errors):
+        lines.append(line)
+        line_nos.append(line_no)
+    return lines, line_nos
+
+
+@timing.timed("read_file_index")
+def read_file_index(
+    filename,
+    encoding,
+    encoding_errors="replace",
+    ignore_data=False,
+    file_obj=None,
+    head=None,
+):
+    """Index the sections of a LAS file on disk without reading their lines.
+
+    Arguments:
+        filename (str): path to file
+        encoding (str): character encoding of the file
+
+    Keyword Arguments:
+        encoding_errors (str): see :func:`lascheck.reader.open_with_codecs`
+        ignore_data (bool): see :func:`lascheck.reader.read_file_contents`
+        file_obj (file object): the file, already open in binary mode, to
+            index rather than opening it again
+        head (bytes): the first :data:`HEAD_BYTES` bytes of the file, if
+            they have already been read
+
+    Returns:
+        the same values as :func:`lascheck.reader.read_file_contents`, or None
+        if the file cannot be read this way (the encoding is not a superset
+        of ASCII, or lines end with a carriage return alone).
+
+    The sections are found by :func:`lascheck.scanner.scan_file`. Each raw
+    section is an :class:`lascheck.reader.IndexedRawSection` which also has
+    the ``"start"`` and ``"end"`` byte offsets and ``"line_no"`` of the title
+    line of the section (and, for the ~A section, the ``"end_line_no"`` of
+    the line after it, see also
+    :func:`lascheck.reader.index_data_section`). The lines of all the sections before ~A are read
+    together, the first time any of them is needed.
+
+    """
+    try:
+        if b"~#\r\n\t ".decode(encoding) != "~#\r\n\t ":
+            return None
+    except (LookupError, UnicodeError, TypeError):
+        return None
+    if head is None:
+        with open(filename, mode="rb") as f:
+            head = f.read(HEAD_BYTES)
+    if re.search(b"\r(?!\n)", head.rstrip(b"\r")):
+        return None
+
+    index = scanner.scan_file(filename, file_obj=file_obj)
+    read, following = index.split_after_data_section()
+    header_ends = [
+        extent.end for extent in read if extent.title[:2].upper() != b"~A"
+    ]
+    cache = None
+    if header_ends:
+        cache = CachedRange(filename, index.start, max(header_ends))
+    sections = OrderedDict()
+    for i, extent in enumerate(read):
+        title = extent.title.decode(encoding, encoding_errors)
+        ranges = [(extent.start, extent.end, extent.line_no + 1)]
+        if i == 0 and extent.title_start > index.start:
+            # Lines before the first section are read as part of it.
+            ranges.insert(0, (index.start, extent.title_start, 1))
+        nlines = extent.nlines
+        is_data = extent.title[:2].upper() == b"~A"
+        lines = {}
+        if i >= 1 and read[i - 1].title[:2].upper() == b"~A":
+            # Nothing is read after the start of the section following ~A.
+            ranges = []
+            nlines = 0
+        elif ignore_data and is_data:
+            # The lines can still be read with iter_raw_section_lines().
+            lines = {"lines": [], "line_nos": []}
+        kwargs = dict(
+            section_type="data" if i + 1 == len(read) else "header",
+            title=title,
+            nlines=nlines,
+            start=extent.start,
+            end=extent.end,
+            line_no=extent.line_no,
+            **lines
+        )
+        if is_data:
+            sections[title] = index_data_section(
+                filename,
+                ranges,
+                encoding,
+                encoding_errors,
+                clean=len(ranges) == 1
+                and not extent.blank_line_nos
+                and not extent.comment_line_nos,
+                end_line_no=extent.line_no
+                + 1
+                + extent.nlines
+                + len(extent.blank_line_nos)
+                + len(extent.comment_line_nos),
+                **kwargs
+            )
+        else:
+            sections[title] = IndexedRawSection(
+                functools.partial(
+                    iter_section_lines,
+                    filename,
+                    ranges,
+                    encoding,
+                    encoding_errors,
+                    cache=cache,
+                ),
+                **kwargs
+            )
+    return (
+        sections,
+        index.sections_after_a_section,
+        index.v_section_first,
+        index.blank_line_in_section,
+        index.sections_with_blank_line,
+    )
+
+
+def index_data_section(
+    filename,
+    ranges,
+    encoding,
+    encoding_errors="replace",
+    clean=False,
+    cache=None,
+    **kwargs
+):
+    """Index the ~A section of a LAS file on disk without reading its lines.
+
+    Arguments:
+        filename (str): path to file
+        ranges (list): tuples of (start byte, end byte, line number of the
+            first line) of the section
+        encoding (str): character encoding of the file
+
+    Keyword Arguments:
+        encoding_errors (str): see :func:`lascheck.reader.open_with_codecs`
+        clean (bool): True if the ranges are known to have no blank lines or
+            comments
+        cache (:class:`lascheck.reader.CachedRange`): if given, the bytes are
+            taken from it rather than read from the file
+
+    Other keyword arguments are added to the raw section dict.
+
+    Returns:
+        :class:`lascheck.reader.IndexedRawSection`, which also has the
+        ``"ranges"`` and ``"clean"`` items.
+
+    """
+    return IndexedRawSection(
+        functools.partial(
+            iter_section_lines,
+            filename,
+            ranges,
+            encoding,
+            encoding_errors,
+            cache=cache,
+        ),
+        # The ~A section can be parsed without decoding it.
+        iter_byte_blocks=functools.partial(
+            iter_section_line_blocks,
+            filename,
+            ranges,
+            None,
+            cache=cache,
+            clean=clean,
+            joined=True,
+        ),
+        ranges=ranges,
+        clean=clean,
+        **kwargs
+    )
+
+
+def index_appended_lines(
+    filename, raw_section, header, encoding, encoding_errors="replace"
+):
+    """Index the lines added to the end of the ~A section of a LAS file on
+    disk since it was indexed.
+
+    Arguments:
+        filename (str): path to file
+        raw_section (dict): the ~A section, from
+            :func:`lascheck.reader.index_data_section`
+        header (bytes): the bytes of the file before the first line of the
+            ~A section, when it was indexed
+        encoding (str): character encoding of the file
+
+    Keyword Arguments:
+        encoding_errors (str): see :func:`lascheck.reader.open_with_codecs`
+
+    Returns:
+        tuple of two :class:`lascheck.reader.IndexedRawSection` for the
+        lines added to the file (with their bytes already read) and for the
+        whole of the ~A section now. The first also has the line numbers of
+        the blank lines added, as ``"blank_line_nos"``. Only whole lines are
+        indexed: a last line
+        without a newline is left for the next time. Returns None if the
+        lines cannot be indexed on their own, because the file has got
+        shorter, the bytes before the ~A section have changed, the section
+        did not end with a newline or a new section has been started.
+
+    """
+    if len(raw_section["ranges"]) != 1:
+        return None
+    start, end, first_line_no = raw_section["ranges"][0]
+    with open(filename, mode="rb") as f:
+        if f.read(len(header)) != header:
+            return None
+        # Include the newline ending the section.
+        f.seek(end - 1)
+        buf = f.read()
+    if buf[:1] != b"\n":
+        return None
+    new_end = end + buf.rfind(b"\n")
+    body = buf[1:new_end - end + 1]
+    if scanner.find_line_starts(body, b"~"):
+        return None
+    line_no = raw_section["end_line_no"]
+    ncomments = len(scanner.find_line_starts(body, b"#"))
+    blank_line_nos = [
+        line_no + body.count(b"\n", 0, m.start())
+        for m in scanner.BLANK_LINE_RE.finditer(b"\n" + body)
+    ]
+    nblanks = len(blank_line_nos)
+    nlines = body.count(b"\n")
+    clean = not ncomments and not nblanks
+
+    appended = index_data_section(
+        filename,
+        [(end, new_end, line_no)],
+        encoding,
+        encoding_errors,
+        clean=clean,
+        cache=CachedRange(filename, end, new_end, data=body),
+        section_type="data",
+        title=raw_section["title"],
+        nlines=nlines - ncomments - nblanks,
+        start=end,
+        end=new_end,
+        line_no=line_no - 1,
+        end_line_no=line_no + nlines,
+        blank_line_nos=blank_line_nos,
+    )
+    kwargs = dict(raw_section)
+    for key in ("lines", "line_nos", "ranges", "clean"):
+        kwargs.pop(key, None)
+    if "lines" in raw_section and not raw_section["lines"]:
+        # Indexed with ignore_data=True.
+        kwargs.update(lines=[], line_nos=[])
+    kwargs.update(
+        nlines=raw_section["nlines"] + appended["nlines"],
+        end=new_end,
+        end_line_no=appended["end_line_no"],
+    )
+    extended = index_data_section(
+        filename,
+        [(start, new_end, first_line_no)],
+        encoding,
+        encoding_errors,
+        clean=raw_section["clean"] and clean,
+        **kwargs
+    )
+    return appended, extended
+
+
 def get_substitutions(read_policy, null_policy):
     """Parse read and null policy definitions into a list of regexp and value
     substitutions.
@@ -404,8 +1046,531 @@ def get_substitutions(read_policy, null_policy):
     return regexp_subs, numerical_subs, version_NULL
 
 
+# Substitutions from defaults.READ_SUBS and defaults.NULL_SUBS which only
+# ever change text that is not already a number. Data lines which parse as
+# numbers do not need them to be applied.
+NON_NUMERIC_SUBS = set(
+    pattern
+    for key, subs in list(defaults.READ_SUBS.items()) + list(defaults.NULL_SUBS.items())
+    if key not in ("-0.0", "numbers-only")
+    for pattern, sub in [item for item in subs if isinstance(item, tuple)]
+)
+
+# Number of data lines parsed by each call to numpy.loadtxt.
+DATA_CHUNK_ROWS = 4096
+
+
+def substitute(line, regexp_subs):
+    """Apply regular expression substitutions to a line of the ~A section."""
+    for pattern, sub_str in regexp_subs:
+        line = re.sub(pattern, sub_str, line)
+    return line.replace(chr(26), "")
+
+
+def _parse_data_lines(np, lines, regexp_subs):
+    """Parse data lines into a 1-D array of the values in them, in order.
+
+    The lines can be str or bytes. Bytes are only decoded if they cannot
+    be parsed as they are.
+
+    Returns:
+        the array of values, and an array of the number of values on each
+        line.
+
+    """
+    source = lines
+    if isinstance(lines[0], bytes):
+        source = io.BytesIO(b"\n".join(lines))
+    try:
+        block = np.loadtxt(source, dtype=float, comments=None, ndmin=2)
+    except ValueError:
+        pass
+    else:
+        return block.ravel(), np.full(len(lines), block.shape[1])
+    # Some lines have unusual values or numbers of columns: fall back to
+    # converting one value at a time.
+    values = []
+    counts = []
+    for line in lines:
+        if isinstance(line, bytes):
+            line = line.decode("ascii", "replace")
+        items = substitute(line, regexp_subs).split()
+        for item in items:
+            try:
+                values.append(float(item))
+            except ValueError:
+                values.append(np.nan)
+        counts.append(len(items))
+    return np.array(values, dtype=float), np.array(counts)
+
+
+def _parse_data_text(np, text, nlines):
+    """Parse the bytes of ``nlines`` whole data lines as they are.
+
+    Returns:
+        the array of values and the number of values on each line, as from
+        :func:`lascheck.reader._parse_data_lines`, or None if the lines have
+        unusual values or numbers of columns.
+
+    """
+    try:
+        block = np.loadtxt(io.BytesIO(text), dtype=float, comments=None, ndmin=2)
+    except ValueError:
+        return None
+    if len(block) != nlines:
+        # Lines of only whitespace were skipped.
+        return None
+    return block.ravel(), np.full(nlines, block.shape[1])
+
+
+def _line_no_array(np, line_nos):
+    if isinstance(line_nos, range):
+        return np.arange(line_nos.start, line_nos.stop)
+    return np.asarray(line_nos)
+
+
+def _iter_row_blocks(np, line_blocks, rows):
+    """Regroup blocks of (line numbers, lines) into blocks of ``rows`` lines,
+    with the line numbers as an array.
+
+    The lines of a block can be the bytes of whole lines, as from
+    :func:`lascheck.reader.iter_section_line_blocks` with ``joined=True``.
+    These are cut at line ends and joined without being split into lines,
+    unless they are regrouped with a list of lines.
+
+    """
+    pending = []
+    npending = 0
+    for line_nos, lines in line_blocks:
+        joined = isinstance(lines, bytes)
+        if joined:
+            if not lines.endswith(b"\n"):
+                lines += b"\n"
+            nlines = len(line_nos)
+        else:
+            nlines = len(lines)
+        if npending + nlines < rows:
+            pending.append((line_nos, lines))
+            npending += nlines
+            continue
+        if joined:
+            ends = np.flatnonzero(np.frombuffer(lines, dtype=np.uint8) == 10) + 1
+        start = 0
+        for end in range(rows - npending, nlines + 1, rows):
+            if joined:
+                piece = lines[ends[start - 1] if start else 0:ends[end - 1]]
+            else:
+                piece = lines[start:end]
+            pending.append((line_nos[start:end], piece))
+            yield _join_row_blocks(np, pending)
+            pending = []
+            start = end
+        npending = nlines - start
+        if npending:
+            if joined:
+                piece = lines[ends[start - 1] if start else 0:]
+            else:
+                piece = lines[start:]
+            pending.append((line_nos[start:], piece))
+    if pending:
+        yield _join_row_blocks(np, pending)
+
+
+def _join_row_blocks(np, blocks):
+    """Join blocks of (line numbers, lines) from :func:`_iter_row_blocks`."""
+    line_nos = np.concatenate([_line_no_array(np, nos) for nos, lines in blocks])
+    if all(isinstance(lines, bytes) for nos, lines in blocks):
+        return line_nos, b"".join(lines for nos, lines in blocks)
+    return line_nos, list(
+        itertools.chain.from_iterable(
+            lines.splitlines() if isinstance(lines, bytes) else lines
+            for nos, lines in blocks
+        )
+    )
+
+
+def _is_ascii(text):
+    """True if a str or bytes has only ASCII characters (``isascii()`` needs
+    Python 3.7)."""
+    try:
+        if isinstance(text, bytes):
+            text.decode("ascii")
+        else:
+            text.encode("ascii")
+    except UnicodeError:
+        return False
+    return True
+
+
+def _iter_parsed_lines(np, line_blocks, rows, regexp_subs, summary=None):
+    """Parse blocks of (line numbers, lines) ``rows`` lines at a time.
+
+    The lines of non-ASCII characters are added to ``summary``, if it is
+    given.
+
+    Returns:
+        generator of (line numbers, values, counts) arrays for each block of
+        lines, as from :func:`lascheck.reader._parse_data_lines`.
+
+    """
+    substitute_all = not all(
+        pattern in NON_NUMERIC_SUBS for pattern, sub_str in regexp_subs
+    )
+    for line_nos, lines in _iter_row_blocks(np, line_blocks, rows):
+        if isinstance(lines, bytes):
+            # Whole lines of the file, which are only split into lines if
+            # they need to be looked at one by one.
+            if not substitute_all and _is_ascii(lines):
+                parsed = _parse_data_text(np, lines, len(line_nos))
+                if parsed is not None:
+                    yield (line_nos,) + parsed
+                    continue
+            lines = lines.splitlines()
+        if summary is not None:
+            separator = b"" if isinstance(lines[0], bytes) else ""
+            if not _is_ascii(separator.join(lines)):
+                summary.add_non_ascii_lines(
+                    line_nos[[i for i, line in enumerate(lines) if not _is_ascii(line)]]
+                )
+        if substitute_all:
+            if isinstance(lines[0], bytes):
+                lines = [line.decode("ascii", "replace") for line in lines]
+            lines = [substitute(line, regexp_subs) for line in lines]
+        values, counts = _parse_data_lines(
+            np, lines, [] if substitute_all else regexp_subs
+        )
+        yield line_nos, values, counts
+
+
+def _wrapped_record_ends(np, counts, ncurves):
+    """Find the last line of each wrapped record.
+
+    A record runs from its first line until it has at least ``ncurves``
+    values.
+
+    Returns:
+        array of the positions in ``counts`` of the last line of each
+        complete record.
+
+    """
+    totals = np.cumsum(counts)
+    crossed = np.diff(totals // ncurves, prepend=0) > 0
+    if not (totals[crossed] % ncurves).any():
+        # Every record ends with the line on which its values run out.
+        return np.flatnonzero(crossed)
+    ends = []
+    total = 0
+    for i, count in enumerate(counts.tolist()):
+        total += count
+        if total >= ncurves:
+            ends.append(i)
+            total = 0
+    return np.array(ends, dtype=int)
+
+
+def _wrapped_records(np, values, counts, ends, ncurves):
+    """Arrange the values of complete wrapped records into rows.
+
+    Returns:
+        2-D array with a row for each record in ``ends``, and the number of
+        values in each record. Records with too many values are truncated
+        and those with too few are padded with NaN.
+
+    """
+    totals = np.cumsum(counts)
+    record_ends = totals[ends]
+    record_starts = np.concatenate([[0], record_ends[:-1]])
+    record_counts = record_ends - record_starts
+    nvalues = record_ends[-1]
+    if (record_counts == ncurves).all():
+        return values[:nvalues].reshape(-1, ncurves), record_counts
+    block = np.full((len(ends), ncurves), np.nan)
+    records = np.repeat(np.arange(len(ends)), record_counts)
+    columns = np.arange(nvalues) - np.repeat(record_starts, record_counts)
+    keep = columns < ncurves
+    block[records[keep], columns[keep]] = values[:nvalues][keep]
+    return block, record_counts
+
+
+class DataChunkState(object):
+
+    """Where :func:`lascheck.reader.iter_data_chunks` stopped, so that lines
+    added to the end of the ~A section can be parsed without the lines
+    before them.
+
+    Attributes:
+        ncols (int or None): number of columns in each row, once known
+        carry (tuple or None): the values of an incomplete row (or the lines
+            of an incomplete record, for wrapped data) at the end of the
+            lines, which was padded with NaN
+        nvalues (int): number of values parsed
+        nrows (int): number of complete rows yielded
+        summary (:class:`lascheck.data.DataSummary` or None): copy of the
+            summary as it was before the incomplete row was added to it
+
+    """
+
+    def __init__(self):
+        self.ncols = None
+        self.carry = None
+        self.nvalues = 0
+        self.nrows = 0
+        self.summary = None
+
+    def __repr__(self):
+        return "%s(nrows=%d)" % (self.__class__.__name__, self.nrows)
+
+
+def iter_data_chunks(
+    numbered_lines,
+    ncurves,
+    regexp_subs,
+    value_null_subs,
+    rows=65536,
+    summary=None,
+    wrapped=False,
+    state=None,
+):
+    """Parse the lines of the ~A section into 2-D arrays, a block at a time.
+
+    Arguments:
+        numbered_lines (iterable or dict): (line number, line) for each line
+            of the ~A section, or its raw section dict, whose lines are then
+            read with :func:`lascheck.reader.iter_raw_section_blocks`. The
+            lines can be str, or bytes (which are only decoded if they cannot
+            otherwise be parsed).
+        ncurves (int): number of curves in the ~C section
+        regexp_subs (list): regular expression substitutions, from
+            :func:`lascheck.reader.get_substitutions`
+        value_null_subs (list): values to replace with NaN, from
+            :func:`lascheck.reader.get_substitutions` (plus the NULL value of
+            the ~W section, if the null policy uses it)
+
+    Keyword Arguments:
+        rows (int): number of lines parsed into each block
+        summary (:class:`lascheck.data.DataSummary`): if given, updated with
+            the number of values on each line (or in each record, for wrapped
+            data), the lines with non-ASCII characters and each block of
+            rows.
+        wrapped (bool): True if the data is wrapped (WRAP = YES in the ~V
+            section)
+        state (:class:`lascheck.reader.DataChunkState`): if given, parsing
+            carries on from where it stopped for the lines before these (an
+            incomplete row or record is completed by the first of these
+            lines), and it is updated once all the lines have been parsed.
+
+    Returns:
+        generator of (line number, block), where block is a 2-D
+        ``numpy.ndarray`` of floats with a row for each depth and line number
+        is the line on which its first row starts. There are ``ncurves``
+        columns, or more if the first line of unwrapped data has more values.
+        No more than ``rows`` lines are held in memory at a time.
+
+    The lines are parsed by :func:`numpy.loadtxt`. The substitutions are only
+    applied to blocks which cannot be parsed as they are, unless they include
+    some which can change a valid number (such as the ``-0.0`` and
+    ``numbers-only`` null policies). Values which still are not numbers
+    become NaN. A row which is split across lines is carried over into the
+    next block.
+
+    Wrapped data is grouped into records, each starting with a line holding
+    the index and running until it has ``ncurves`` values. A record which
+    overruns this is truncated to ``ncurves`` values, and the last record is
+    padded with NaN if it is short.
+
+    """
+    import numpy as np
+
+    if state is None:
+        state = DataChunkState()
+    if isinstance(numbered_lines, dict):
+        line_blocks = iter_raw_section_blocks(numbered_lines, rows)
+    else:
+        line_blocks = _iter_line_blocks(numbered_lines, rows)
+    parsed = _iter_parsed_lines(np, line_blocks, rows, regexp_subs, summary)
+    for item in _iter_data_blocks(
+        np, parsed, ncurves, value_null_subs, summary, wrapped, state
+    ):
+        yield item
+
+
+def _iter_data_blocks(np, parsed, ncurves, value_null_subs, summary, wrapped, state):
+    """Arrange parsed lines into rows, for
+    :func:`lascheck.reader.iter_data_chunks`.
+
+    Arguments:
+        parsed (iterable): (line numbers, values, counts) arrays for each
+            block of lines, in order, as from
+            :func:`lascheck.reader._iter_parsed_lines`
+
+    Rows (and wrapped records) which run across the end of a block are
+    completed by the next one, and ``summary`` is updated with the rows in
+    the order of the lines.
+
+    """
+
+    def finish(block, row_line_nos):
+        if value_null_subs:
+            block[np.isin(block, value_null_subs)] = np.nan
+        if summary is not None:
+            summary.add_rows(block, row_line_nos)
+        return int(row_line_nos[0]), block
+
+    def stop(carry):
+        state.carry = carry
+        state.summary = copy.copy(summary)
+
+    if wrapped:
+        if ncurves == 0:
+            return
+        # Lines of an incomplete record.
+        carry = state.carry or (
+            np.empty(0, dtype=int), np.empty(0), np.empty(0, dtype=int)
+        )
+        for line_nos, values, counts in parsed:
+            if len(carry[0]):
+                line_nos = np.concatenate([carry[0], line_nos])
+                values = np.concatenate([carry[1], values])
+                counts = np.concatenate([carry[2], counts])
+            ends = _wrapped_record_ends(np, counts, ncurves)
+            if not len(ends):
+                carry = (line_nos, values, counts)
+                continue
+            starts = np.concatenate([[0], ends[:-1] + 1])
+            block, record_counts = _wrapped_records(np, values, counts, ends, ncurves)
+            if summary is not None:
+                summary.add_column_counts(record_counts, line_nos[starts])
+                summary.add_index_lines(counts[starts], line_nos[starts])
+            rest = ends[-1] + 1
+            nvalues = counts[:rest].sum()
+            carry = (line_nos[rest:], values[nvalues:], counts[rest:])
+            state.nrows += len(block)
+            yield finish(block, line_nos[starts])
+        line_nos, values, counts = carry
+        stop(carry if len(line_nos) else None)
+        if len(line_nos):
+            logger.warning(
+                "The last record of the wrapped ~A section (line {}) has {} "
+                "values rather than {}: it is padded with NaN".format(
+                    line_nos[0], values.size, ncurves
+                )
+            )
+            if summary is not None:
+                summary.add_column_counts(np.array([values.size]), line_nos[:1])
+                summary.add_index_lines(counts[:1], line_nos[:1])
+            block = np.full((1, ncurves), np.nan)
+            block[0, :values.size] = values
+            yield finish(block, line_nos[:1])
+        return
+
+    # Values of an incomplete row, and the line on which it starts.
+    carry, carry_line_no = state.carry or (np.empty(0), None)
+    for line_nos, values, counts in parsed:
+        if state.ncols is None:
+            state.ncols = max(ncurves, int(counts[0]))
+        ncols = state.ncols
+        if ncols == 0:
+            return
+        state.nvalues += values.size
+        if summary is not None:
+            summary.add_column_counts(counts, line_nos)
+
+        uniform = not carry.size and (counts == ncols).all()
+        if carry.size:
+            values = np.concatenate([carry, values])
+        nfull = values.size // ncols
+        if uniform:
+            row_line_nos = line_nos
+        else:
+            # Find the line on which each row, and the incomplete row left
+            # over, starts.
+            starts = np.cumsum(counts) - counts
+            if carry.size:
+                starts = np.concatenate([[0], starts + carry.size])
+                line_nos = np.concatenate([[carry_line_no], line_nos])
+            positions = np.arange(nfull + 1) * ncols
+            row_line_nos = line_nos[np.searchsorted(starts, positions, "right") - 1]
+        carry = values[nfull * ncols:].copy()
+        carry_line_no = row_line_nos[nfull] if carry.size else None
+        if nfull:
+            state.nrows += nfull
+            yield finish(values[:nfull * ncols].reshape(nfull, ncols), row_line_nos[:nfull])
+
+    stop((carry, carry_line_no) if carry.size else None)
+    if carry.size:
+        ncols = state.ncols
+        logger.warning(
+            "~A section has {} values, which is not a multiple of the {} "
+            "columns: the last row is padded with NaN".format(state.nvalues, ncols)
+        )
+        block = np.append(carry, np.full(ncols - carry.size, np.nan))
+        yield finish(block.reshape(1, ncols), [carry_line_no])
+
+
+def read_data_section(
+    lines,
+    ncurves,
+    regexp_subs,
+    value_null_subs,
+    line_nos=None,
+    summary=None,
+    wrapped=False,
+):
+    """Parse the lines of the ~A section into a 2-D array.
+
+    Arguments:
+        lines (list): lines of the ~A section, as found in the raw section
+            dict returned by :func:`lascheck.reader.read_file_contents`
+        ncurves (int): number of curves in the ~C section
+        regexp_subs (list): regular expression substitutions, from
+            :func:`lascheck.reader.get_substitutions`
+        value_null_subs (list): values to replace with NaN, from
+            :func:`lascheck.reader.get_substitutions` (plus the NULL value of
+            the ~W section, if the null policy uses it)
+
+    Keyword Arguments:
+        line_nos (list): line number of each line in the file
+        summary (:class:`lascheck.data.DataSummary`): if given, updated with
+            the number of values on each line and with each block of rows.
+        wrapped (bool): True if the data is wrapped (WRAP = YES in the ~V
+            section)
+
+    Returns:
+        2-D ``numpy.ndarray`` of floats with a row for each depth. There are
+        ``ncurves`` columns, or more if the first line of unwrapped data has
+        more values.
+
+    The lines are parsed in blocks of :data:`DATA_CHUNK_ROWS` by
+    :func:`lascheck.reader.iter_data_chunks`.
+
+    """
+    import numpy as np
+
+    if line_nos is None:
+        line_nos = range(1, len(lines) + 1)
+    blocks = [
+        block
+        for line_no, block in iter_data_chunks(
+            {"line_nos": line_nos, "lines": lines},
+            ncurves,
+            regexp_subs,
+            value_null_subs,
+            rows=DATA_CHUNK_ROWS,
+            summary=summary,
+            wrapped=wrapped,
+        )
+    ]
+    if not blocks:
+        return np.empty((0, ncurves))
+    return np.concatenate(blocks)
+
+
 def parse_header_section(
-    sectdict, version, ignore_header_errors=False, mnemonic_case="preserve"
+    sectdict,
+    version,
+    ignore_header_errors=False,
+    mnemonic_case="preserve",
+    compact=False,
 ):
     """Parse a header section dict into a SectionItems containing HeaderItems.
 
@@ -421,6 +1586,9 @@ def parse_header_section(
         mnemonic_case (str): 'preserve': keep the case of HeaderItem mnemonics
                              'upper': convert all HeaderItem mnemonics to uppercase
                              'lower': convert all HeaderItem mnemonics to lowercase
+        compact (bool): if True, make the section of
+            :class:`lascheck.las_items.CompactHeaderItem` and
+            :class:`lascheck.las_items.CompactCurveItem`
 
     Returns:
         :class:`lascheck.las_items.SectionItems`
@@ -428,13 +1596,17 @@ def parse_header_section(
     """
     title = sectdict["title"]
     assert len(sectdict["lines"]) == len(sectdict["line_nos"])
-    parser = SectionParser(title, version=version)
+    parser = SectionParser(title, version=version, compact=compact)
 
     section = SectionItems()
     assert mnemonic_case in ("upper", "lower", "preserve")
     if not mnemonic_case == "preserve":
         section.mnemonic_transforms = True
 
+    # The items are added together, and duplicate mnemonics given their
+    # suffixes in one pass at the end.
+    items = []
+
     for i in range(len(sectdict["lines"])):
         line = sectdict["lines"][i]
         j = sectdict["line_nos"][i]
@@ -458,7 +1630,9 @@ def parse_header_section(
                 values["name"] = values["name"].upper()
             elif mnemonic_case == "lower":
                 values["name"] = values["name"].lower()
-            section.append(parser(**values))
+            items.append(parser(**values))
+    section.extend(items)
+    section.assign_duplicate_suffixes()
     return section
 
 
@@ -473,10 +1647,18 @@ class SectionParser(object):
 
     Keyword Arguments:
         version (float): version to parse according to. Default is 1.2.
+        compact (bool): if True, return
+            :class:`lascheck.las_items.CompactHeaderItem` and
+            :class:`lascheck.las_items.CompactCurveItem` rather than
+            HeaderItem and CurveItem.
 
     """
 
-    def __init__(self, title, version=1.2):
+    def __init__(self, title, version=1.2, compact=False):
+        if compact:
+            self.header_item, self.curve_item = CompactHeaderItem, CompactCurveItem
+        else:
+            self.header_item, self.curve_item = HeaderItem, CurveItem
         if title.upper().startswith("~C"):
             self.func = self.curves
             self.section_name2 = "Curves"
@@ -534,18 +1716,16 @@ class SectionParser(object):
             default = x
 
         # in case it is a string.
-        try:
+        if isinstance(x, str) and "," in x:
             pattern, sub = defaults.READ_SUBS["comma-decimal-mark"][0]
-            x = re.sub(pattern, sub, x)
-        except:
-            pass
+            x = pattern.sub(sub, x)
 
         try:
             return int(x)
-        except:
+        except (TypeError, ValueError):
             try:
                 x = float(x)
-            except:
+            except (TypeError, ValueError):
                 return default
         if math.isfinite(x):
             return x
@@ -585,7 +1765,7 @@ class SectionParser(object):
         if keys["name"].upper() not in number_strings:
             value = self.num(value)
 
-        item = HeaderItem(
+        item = self.header_item(
             keys["name"],  # mnemonic
             self.strip_brackets(keys["unit"]),  # unit
             value,  # value
@@ -601,7 +1781,7 @@ class SectionParser(object):
         :func:`lascheck.reader.read_header_line`.
 
         """
-        item = CurveItem(
+        item = self.curve_item(
             keys["name"],  # mnemonic
             self.strip_brackets(keys["unit"]),  # unit
             keys["value"],  # value
@@ -616,7 +1796,7 @@ class SectionParser(object):
         :func:`lascheck.reader.read_header_line`.
 
         """
-        return HeaderItem(
+        return self.header_item(
             keys["name"],  # mnemonic
             self.strip_brackets(keys["unit"]),  # unit
             self.num(keys["value"]),  # value
@@ -633,35 +1813,87 @@ def read_line(*args, **kwargs):
     return read_header_line(*args, **kwargs)
 
 
+# Patterns used by read_header_line() for lines which the fast path in
+# _split_header_line() does not handle.
+HEADER_LINE_RE = re.compile(
+    r"\.?(?P<name>[^.]*)\." + r"(?P<unit>[^\s:]*)" + r"(?P<value>[^:]*)"
+)
+HEADER_LINE_DESCR_RE = re.compile(
+    r"\.?(?P<name>[^.]*)\."
+    + r"(?P<unit>[^\s:]*)"
+    + r"(?P<value>[^:]*):"
+    + r"(?P<descr>.*)"
+)
+
+
+def _split_header_line(line):
+    """Split a well-formed header line without using a regular expression.
+
+    Returns:
+        (name, unit, value, descr) tuple of unstripped strings, or None if
+        the line is one where the partitioning could give a different result
+        to :data:`HEADER_LINE_RE` or :data:`HEADER_LINE_DESCR_RE`: a line
+        starting with a dot, with no dot at all, with its only colon before
+        the first dot, or containing a newline.
+
+    """
+    dot = line.find(".")
+    if dot <= 0 or "\n" in line:
+        return None
+    rest = line[dot + 1:]
+    before, colon, descr = rest.partition(":")
+    if not colon and ":" in line:
+        return None
+    # The unit runs from the dot up to the first whitespace or colon.
+    if before and not before[0].isspace():
+        unit = before.split(None, 1)[0]
+    else:
+        unit = ""
+    return line[:dot], unit, before[len(unit):], descr
+
+
 def read_header_line(line, pattern=None):
     """Read a line from a LAS header section.
 
-    The line is parsed with a regular expression -- see LAS file specs for
-    more details, but it should basically be in the format::
+    The line should basically be in the format (see LAS file specs for more
+    details)::
 
         name.unit       value : descr
 
+    Well-formed lines are split with ``str`` methods; any other line, or a
+    line with a custom **pattern**, is parsed with a regular expression.
+
     Arguments:
         line (str): line from a LAS header section
 
+    Keyword Arguments:
+        pattern (str): regular expression with the named groups 'name',
+            'unit', 'value' and (optionally) 'descr'.
+
     Returns:
         A dictionary with keys 'name', 'unit', 'value', and 'descr', each
         containing a string as value.
 
     """
+    parts = None if pattern is not None else _split_header_line(line)
+    if parts is not None:
+        name, unit, value, descr = parts
+        d = {
+            "name": name.strip(),
+            "unit": unit.strip(),
+            "value": value.strip(),
+            "descr": descr.strip(),
+        }
+        if d["unit"].endswith("."):
+            d["unit"] = d["unit"].strip(".")  # see issue #36
+        return d
+
     d = {"name": "", "unit": "", "value": "", "descr": ""}
     if pattern is None:
         if not ":" in line:
-            pattern = (
-                r"\.?(?P<name>[^.]*)\." + r"(?P<unit>[^\s:]*)" + r"(?P<value>[^:]*)"
-            )
+            pattern = HEADER_LINE_RE
         else:
-            pattern = (
-                r"\.?(?P<name>[^.]*)\."
-                + r"(?P<unit>[^\s:]*)"
-                + r"(?P<value>[^:]*):"
-                + r"(?P<descr>.*)"
-            )
+            pattern = HEADER_LINE_DESCR_RE
     m = re.match(pattern, line)
     if m is None:
         logger.warning("Unable to parse line as LAS header: {}".format(line))
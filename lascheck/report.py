@@ -0,0 +1,124 @@
+"""Check a LAS file against the rules in :mod:`lascheck.spec`.
+
+Each rule is run once per file and its outcome recorded in a
+:class:`lascheck.report.ConformityReport`, from which both
+:meth:`lascheck.las.LASFile.check_conformity` and
+:meth:`lascheck.las.LASFile.get_non_conformities` are answered.
+
+"""
+import collections
+import time
+
+from . import spec
+from . import timing
+
+
+RuleResult = collections.namedtuple(
+    "RuleResult", ["rule", "passed", "messages", "seconds"]
+)
+RuleResult.__doc__ = """Outcome of one rule for one file.
+
+    Attributes:
+        rule (class): the :class:`lascheck.spec.Rule` subclass
+        passed (bool or None): the result of the rule's ``check``, or None
+            if the rule was skipped because a rule it requires did not pass
+        messages (list): non-conformities reported by the rule
+        seconds (float): time taken to check the rule, not counting the
+            sections parsed the first time the rule looked them up
+
+    """
+
+
+class ConformityReport(object):
+
+    """Results of checking a LAS file against a list of rules.
+
+    Arguments:
+        results (list): :class:`lascheck.report.RuleResult` for each rule,
+            in the order in which the rules were run.
+
+    Results can be looked up by rule class or by name, e.g.
+    ``report["ValidIndexMnemonic"].passed``.
+
+    """
+
+    def __init__(self, results):
+        self.results = results
+
+    @property
+    def conforming(self):
+        """True if no rule failed."""
+        return all(result.passed is not False for result in self.results)
+
+    @property
+    def non_conformities(self):
+        """List of the messages of all the rules which failed, in order."""
+        return [message for result in self.results for message in result.messages]
+
+    @property
+    def seconds(self):
+        """Total time taken to check all the rules."""
+        return sum(result.seconds for result in self.results)
+
+    def __getitem__(self, key):
+        for result in self.results:
+            if result.rule is key or result.rule.__name__ == key:
+                return result
+        raise KeyError("No result for rule {}".format(key))
+
+    def __iter__(self):
+        return iter(self.results)
+
+    def __len__(self):
+        return len(self.results)
+
+    def __repr__(self):
+        return "%s(conforming=%s, %d non-conformities, %d rules)" % (
+            self.__class__.__name__,
+            self.conforming,
+            len(self.non_conformities),
+            len(self.results),
+        )
+
+
+def run_rules(las_file, rules=None):
+    """Check a LAS file against each rule once.
+
+    Arguments:
+        las_file (:class:`lascheck.las.LASFile`): the file to check
+
+    Keyword Arguments:
+        rules (list): :class:`lascheck.spec.Rule` subclasses to run, in
+            order. Defaults to :data:`lascheck.spec.RULES`.
+
+    Returns:
+        :class:`lascheck.report.ConformityReport`
+
+    """
+    if rules is None:
+        rules = spec.RULES
+    checked = {}
+
+    def passed(rule):
+        if rule not in checked:
+            if all(passed(required) for required in rule.requires):
+                checked[rule] = bool(rule.check(las_file))
+            else:
+                checked[rule] = None
+        return checked[rule]
+
+    results = []
+    for rule in rules:
+        start = time.perf_counter()
+        deferred = timing.deferred_seconds()
+        rule_passed = passed(rule)
+        messages = rule.messages(las_file) if rule_passed is False else []
+        # Leave out the sections parsed by the rule, which are timed as
+        # parse_section:<name>.
+        seconds = (time.perf_counter() - start) - (
+            timing.deferred_seconds() - deferred
+        )
+        if timing.enabled():
+            timing.record("rule:" + rule.__name__, seconds)
+        results.append(RuleResult(rule, rule_passed, messages, seconds))
+    return ConformityReport(results)
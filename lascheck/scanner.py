@@ -0,0 +1,281 @@
+"""Find the sections of a LAS file by searching its raw bytes.
+
+:func:`lascheck.reader.read_file_contents` decodes the file and looks at it
+one line at a time. For large files nearly all of those lines are rows of the
+~A section, which only need to be counted. The functions here instead
+memory-map the file and use bytes-level searches (``find``, ``rfind`` and a
+compiled regular expression) to locate section title lines, blank lines and
+comment lines, producing an index of the byte range of each section without
+decoding or building a ``str`` for each line.
+
+Lines may end with ``\\n`` or ``\\r\\n``, and the file may start with a UTF-8
+byte order mark.
+
+"""
+import bisect
+import codecs
+import collections
+import mmap
+import re
+
+# A line containing nothing but whitespace. The match starts at the
+# newline ending the previous line.
+BLANK_LINE_RE = re.compile(rb"\n[ \t\r\x0b\x0c]*(?=\n)")
+
+# Number of bytes handled at a time when counting lines.
+COUNT_CHUNK_SIZE = 16 * 1024 * 1024
+
+
+SectionExtent = collections.namedtuple(
+    "SectionExtent",
+    [
+        "title",
+        "line_no",
+        "title_start",
+        "start",
+        "end",
+        "nlines",
+        "blank_line_nos",
+        "comment_line_nos",
+    ],
+)
+SectionExtent.__doc__ = """Location of one section in a LAS file.
+
+    Attributes:
+        title (bytes): the title line, stripped of whitespace
+        line_no (int): line number of the title line (starting at 1)
+        title_start (int): byte offset of the start of the title line
+        start (int): byte offset of the first line after the title line
+        end (int): byte offset of the end of the section (the start of the
+            next title line, or the size of the file)
+        nlines (int): number of lines in the section which are neither blank
+            nor comments
+        blank_line_nos (list): line numbers of blank lines in the section
+        comment_line_nos (list): line numbers of comment lines in the section
+
+    """
+
+
+class SectionIndex(object):
+
+    """Index of the sections found in a LAS file by :func:`scan`.
+
+    Attributes:
+        sections (list): :class:`lascheck.scanner.SectionExtent` for each
+            title line in the file, in order.
+        size (int): size of the file in bytes.
+        start (int): byte offset of the start of the first line (after any
+            byte order mark).
+
+    The properties of this object give the same answers about the structure
+    of the file as the values returned by
+    :func:`lascheck.reader.read_file_contents`.
+
+    """
+
+    def __init__(self, sections, size, start=0):
+        self.sections = sections
+        self.size = size
+        self.start = start
+
+    def __repr__(self):
+        return "%s(%d sections, size=%d)" % (
+            self.__class__.__name__,
+            len(self.sections),
+            self.size,
+        )
+
+    def split_after_data_section(self):
+        """Split sections at the point where reading stops looking for titles.
+
+        Once the section following the ~A section has started, title lines
+        are no longer treated as the start of a section. Returns the sections
+        which are read as sections, and those that follow them.
+
+        """
+        for i, section in enumerate(self.sections):
+            if section.title[:2].upper() == b"~A" and i + 1 < len(self.sections):
+                return self.sections[: i + 2], self.sections[i + 2:]
+        return self.sections, []
+
+    @property
+    def sections_after_a_section(self):
+        """True if anything other than blank lines follows the ~A section."""
+        read, following = self.split_after_data_section()
+        if len(read) < 2 or read[-2].title[:2].upper() != b"~A":
+            return False
+        last = read[-1]
+        return bool(following or last.nlines or last.comment_line_nos)
+
+    @property
+    def v_section_first(self):
+        """True if the first section is the ~V section."""
+        read, following = self.split_after_data_section()
+        return len(read) >= 2 and read[0].title[:2].upper() == b"~V"
+
+    @property
+    def sections_with_blank_line(self):
+        """First word of the title of the section containing each blank line."""
+        read, following = self.split_after_data_section()
+        titles = []
+        for section in read:
+            title = section.title.split()[0].decode("ascii", "replace")
+            titles += [title] * len(section.blank_line_nos)
+        for section in following:
+            titles += [title] * len(section.blank_line_nos)
+        return titles
+
+    @property
+    def blank_line_in_section(self):
+        """True if any section contains a blank line."""
+        return any(section.blank_line_nos for section in self.sections)
+
+
+class _LineCounter(object):
+
+    """Convert increasing byte offsets into line numbers."""
+
+    def __init__(self, buf):
+        self.buf = buf
+        self.offset = 0
+        self.line_no = 1
+
+    def line_no_at(self, offset):
+        """Line number of the line containing the byte at ``offset``."""
+        assert offset >= self.offset
+        while self.offset < offset:
+            end = min(offset, self.offset + COUNT_CHUNK_SIZE)
+            self.line_no += self.buf[self.offset:end].count(b"\n")
+            self.offset = end
+        return self.line_no
+
+
+def find_line_starts(buf, char, start=0, end=None):
+    """Find lines whose first non-whitespace byte is ``char``.
+
+    Arguments:
+        buf (bytes-like): the contents of the file
+        char (bytes): a single byte e.g. ``b"~"``
+
+    Keyword Arguments:
+        start (int): byte offset to start searching from
+        end (int): byte offset to stop searching at
+
+    Returns:
+        list of the byte offsets of the start of those lines
+
+    """
+    if end is None:
+        end = len(buf)
+    positions = []
+    pos = buf.find(char, start, end)
+    while pos != -1:
+        line_start = max(buf.rfind(b"\n", start, pos) + 1, start)
+        if not buf[line_start:pos].strip():
+            positions.append(line_start)
+            pos = buf.find(b"\n", pos, end)
+            if pos == -1:
+                break
+        pos = buf.find(char, pos + 1, end)
+    return positions
+
+
+def scan(buf):
+    """Index the sections of a LAS file held in a bytes-like object.
+
+    Arguments:
+        buf (bytes, mmap.mmap): the contents of the file
+
+    Returns:
+        :class:`lascheck.scanner.SectionIndex`
+
+    """
+    size = len(buf)
+    first = len(codecs.BOM_UTF8) if buf[:3] == codecs.BOM_UTF8 else 0
+    title_starts = find_line_starts(buf, b"~", first)
+    comment_starts = find_line_starts(buf, b"#", first)
+    blank_starts = [m.start() + 1 for m in BLANK_LINE_RE.finditer(buf)]
+    # A last line with whitespace but no newline at the end of the file.
+    last_line = buf.rfind(b"\n") + 1
+    if 0 < last_line < size and not buf[last_line:].strip():
+        blank_starts.append(last_line)
+
+    # Line numbers are only worked out at the offsets which need them, in a
+    # single pass through the file.
+    counter = _LineCounter(buf)
+    line_nos = {}
+    for offset in sorted(set(title_starts + comment_starts + blank_starts + [size])):
+        line_nos[offset] = counter.line_no_at(offset)
+
+    sections = []
+    for i, title_start in enumerate(title_starts):
+        title_end = buf.find(b"\n", title_start)
+        start = size if title_end == -1 else title_end + 1
+        end = title_starts[i + 1] if i + 1 < len(title_starts) else size
+
+        lo = bisect.bisect_left(blank_starts, start)
+        hi = bisect.bisect_left(blank_starts, end)
+        blank_line_nos = [line_nos[p] for p in blank_starts[lo:hi]]
+        lo = bisect.bisect_left(comment_starts, start)
+        hi = bisect.bisect_left(comment_starts, end)
+        comment_line_nos = [line_nos[p] for p in comment_starts[lo:hi]]
+
+        # Lines in the body are counted from the line numbers at either end,
+        # plus a last line at the end of the file which has no newline.
+        if end > start:
+            nlines = line_nos[end] - line_nos[title_start] - 1
+            if buf[end - 1:end] != b"\n":
+                nlines += 1
+        else:
+            nlines = 0
+        nlines -= len(blank_line_nos) + len(comment_line_nos)
+
+        sections.append(
+            SectionExtent(
+                title=bytes(buf[title_start:start]).strip(),
+                line_no=line_nos[title_start],
+                title_start=title_start,
+                start=start,
+                end=end,
+                nlines=nlines,
+                blank_line_nos=blank_line_nos,
+                comment_line_nos=comment_line_nos,
+            )
+        )
+    return SectionIndex(sections, size, first)
+
+
+def scan_file(filename, file_obj=None):
+    """Index the sections of a LAS file on disk.
+
+    The file is memory-mapped, so only the pages needed by the searches are
+    read and nothing is decoded.
+
+    Arguments:
+        filename (str): path to file
+
+    Keyword Arguments:
+        file_obj (file object): the file, already open in binary mode, to
+            use rather than opening it again
+
+    Returns:
+        :class:`lascheck.scanner.SectionIndex`
+
+    """
+    if file_obj is None:
+        with open(filename, mode="rb") as f:
+            return _scan_open_file(f)
+    return _scan_open_file(file_obj)
+
+
+def _scan_open_file(f):
+    try:
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (ValueError, OSError):
+        # Empty files and some special files cannot be memory-mapped.
+        f.seek(0)
+        return scan(f.read())
+    try:
+        return scan(buf)
+    finally:
+        buf.close()
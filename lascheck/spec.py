@@ -1,5 +1,27 @@
+# Largest difference allowed between index values which should be equal, as
+# a fraction of STEP.
+INDEX_TOLERANCE = 1e-3
+
+
 class Rule:
-    pass
+
+    """A rule of the LAS 2.0 specification.
+
+    Subclasses implement ``check(las_file)``, which returns True if the file
+    follows the rule, and ``messages(las_file)``, which returns the
+    non-conformities to report when it does not. A rule is only checked if
+    the rules in ``requires`` pass.
+
+    The rules in :data:`lascheck.spec.RULES` are run by
+    :func:`lascheck.report.run_rules`.
+
+    """
+
+    requires = ()
+
+    @staticmethod
+    def messages(las_file):
+        return []
 
 
 class WellSectionExists(Rule):
@@ -54,8 +76,15 @@ class MandatorySections(Rule):
             missing_mandatory_sections.append("~A")
         return missing_mandatory_sections
 
+    @staticmethod
+    def messages(las_file):
+        return ["Missing mandatory sections: {}".format(
+            MandatorySections.get_missing_mandatory_sections(las_file))]
+
 
 class MandatoryLinesInVersionSection(Rule):
+    requires = (VersionSectionExists,)
+
     @staticmethod
     def check(las_file):
         if "Version" in las_file.sections:
@@ -63,6 +92,10 @@ class MandatoryLinesInVersionSection(Rule):
             return all(elem in las_file.version for elem in mandatory_lines)
         return False
 
+    @staticmethod
+    def messages(las_file):
+        return ["Missing mandatory lines in ~v Section"]
+
 
 class MandatoryLinesInWellSection(Rule):
     @staticmethod
@@ -83,6 +116,10 @@ class MandatoryLinesInWellSection(Rule):
             return True
         return False
 
+    @staticmethod
+    def messages(las_file):
+        return ["Missing mandatory lines in ~w Section"]
+
 
 class DuplicateSections(Rule):
     @staticmethod
@@ -97,8 +134,31 @@ class DuplicateSections(Rule):
         else:
             return True
 
+    @staticmethod
+    def messages(las_file):
+        duplicates = [
+            ("v", las_file.duplicate_v_section),
+            ("w", las_file.duplicate_w_section),
+            ("c", las_file.duplicate_c_section),
+            ("p", las_file.duplicate_p_section),
+            ("o", las_file.duplicate_o_section),
+        ]
+        return ["Duplicate {} section".format(section) for section, duplicate in duplicates if duplicate]
+
+
+class SectionsAfterASection(Rule):
+    @staticmethod
+    def check(las_file):
+        return not las_file.sections_after_a_section
+
+    @staticmethod
+    def messages(las_file):
+        return ["Sections after ~a section"]
+
 
 class ValidIndexMnemonic(Rule):
+    requires = (CurvesSectionExists,)
+
     @staticmethod
     def check(las_file):
         if "Curves" in las_file.sections:
@@ -109,6 +169,11 @@ class ValidIndexMnemonic(Rule):
                 return True
         return False
 
+    @staticmethod
+    def messages(las_file):
+        return ["Invalid index mnemonic. "
+                "The only valid mnemonics for the index channel are DEPT, DEPTH, TIME, or INDEX."]
+
 
 class ValidUnitForDepth(Rule):
     @staticmethod
@@ -124,8 +189,14 @@ class ValidUnitForDepth(Rule):
             return True
         return True
 
+    @staticmethod
+    def messages(las_file):
+        return ["If the index is depth, the units must be M (metres), F (feet) or FT (feet)"]
+
 
 class ValidDepthDividedByStep(Rule):
+    requires = (MandatoryLinesInWellSection,)
+
     def custom_float_modulo(a, b):
         # Ensure a and b are positive
         a, b = abs(a), abs(b)
@@ -163,11 +234,20 @@ class ValidDepthDividedByStep(Rule):
             return las_file.non_conforming_depth.__len__() == 0
         return False
 
+    @staticmethod
+    def messages(las_file):
+        return ["{Mnemonic} divided by step is not a whole number".format(Mnemonic=non_conforming_depth)
+                for non_conforming_depth in las_file.non_conforming_depth]
+
 class VSectionFirst(Rule):
     @staticmethod
     def check(las_file):
         return las_file.v_section_first
 
+    @staticmethod
+    def messages(las_file):
+        return ["~v section not first"]
+
 
 class BlankLineInSection(Rule):
     @staticmethod
@@ -175,3 +255,150 @@ class BlankLineInSection(Rule):
         if las_file.blank_line_in_section:
             return False
         return True
+
+    @staticmethod
+    def messages(las_file):
+        return ["Section {} having blank line".format(section) for section in las_file.sections_with_blank_line]
+
+
+def _well_number(las_file, mnemonic):
+    """Value of a ~W item if it is a number, otherwise None."""
+    value = las_file.well[mnemonic].value
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    return None
+
+
+def _index_close(a, b, step):
+    return abs(a - b) <= INDEX_TOLERANCE * (abs(step) if step else 1.0)
+
+
+class ValidColumnCount(Rule):
+    @staticmethod
+    def check(las_file):
+        summary = las_file.data_summary
+        return summary is None or summary.bad_column_lines == 0
+
+    @staticmethod
+    def messages(las_file):
+        summary = las_file.data_summary
+        return ["{} {} in ~a section do not have {} values, one per curve (first at line {})".format(
+            summary.bad_column_lines, "wrapped records" if summary.wrapped else "lines",
+            summary.ncurves, summary.first_bad_column_line)]
+
+
+class ValidWrappedRecords(Rule):
+    @staticmethod
+    def check(las_file):
+        summary = las_file.data_summary
+        return summary is None or summary.bad_index_lines == 0
+
+    @staticmethod
+    def messages(las_file):
+        summary = las_file.data_summary
+        return ["{} wrapped records in ~a section do not start with a line holding only the index "
+                "(first at line {})".format(summary.bad_index_lines, summary.first_bad_index_line)]
+
+
+class AsciiDataSection(Rule):
+    @staticmethod
+    def check(las_file):
+        summary = las_file.data_summary
+        return summary is None or summary.non_ascii_lines == 0
+
+    @staticmethod
+    def messages(las_file):
+        summary = las_file.data_summary
+        return ["{} lines in ~a section have non-ASCII characters (first at line {})".format(
+            summary.non_ascii_lines, summary.first_non_ascii_line)]
+
+
+class MonotonicIndex(Rule):
+    @staticmethod
+    def check(las_file):
+        summary = las_file.data_summary
+        return summary is None or summary.monotonic
+
+    @staticmethod
+    def messages(las_file):
+        return ["Index in ~a section is not strictly increasing or decreasing (line {})".format(
+            las_file.data_summary.first_non_monotonic_line)]
+
+
+class ValidIndexStep(Rule):
+    requires = (MandatoryLinesInWellSection,)
+
+    @staticmethod
+    def check(las_file):
+        summary = las_file.data_summary
+        step = _well_number(las_file, "STEP")
+        # A STEP of zero means that the index is not evenly spaced.
+        if summary is None or summary.min_step is None or not step:
+            return True
+        return _index_close(summary.min_step, step, step) and _index_close(summary.max_step, step, step)
+
+    @staticmethod
+    def messages(las_file):
+        summary = las_file.data_summary
+        step = _well_number(las_file, "STEP")
+        if abs(summary.min_step - step) > abs(summary.max_step - step):
+            line = summary.min_step_line
+        else:
+            line = summary.max_step_line
+        return ["Index spacing in ~a section does not match STEP (line {})".format(line)]
+
+
+class IndexMatchesStartStop(Rule):
+    requires = (MandatoryLinesInWellSection,)
+
+    @staticmethod
+    def mismatches(las_file):
+        summary = las_file.data_summary
+        if summary is None or summary.first_index is None:
+            return []
+        step = _well_number(las_file, "STEP")
+        mismatches = []
+        for mnemonic, index in (("STRT", summary.first_index), ("STOP", summary.last_index)):
+            value = _well_number(las_file, mnemonic)
+            if value is not None and not _index_close(index, value, step):
+                mismatches.append(mnemonic)
+        return mismatches
+
+    @staticmethod
+    def check(las_file):
+        return not IndexMatchesStartStop.mismatches(las_file)
+
+    @staticmethod
+    def messages(las_file):
+        summary = las_file.data_summary
+        indexes = {"STRT": ("First", summary.first_index), "STOP": ("Last", summary.last_index)}
+        return ["{} index value in ~a section ({}) does not match {}".format(
+            indexes[mnemonic][0], indexes[mnemonic][1], mnemonic)
+            for mnemonic in IndexMatchesStartStop.mismatches(las_file)]
+
+
+# The rules which a file must follow to conform, in the order in which their
+# non-conformities are reported.
+RULES = [
+    DuplicateSections,
+    MandatorySections,
+    MandatoryLinesInVersionSection,
+    MandatoryLinesInWellSection,
+    ValidDepthDividedByStep,
+    ValidIndexMnemonic,
+    VSectionFirst,
+    BlankLineInSection,
+    SectionsAfterASection,
+    ValidUnitForDepth,
+]
+
+# Rules about the contents of the ~A section, which are also run for files
+# read with check_data=True.
+DATA_RULES = [
+    ValidColumnCount,
+    ValidWrappedRecords,
+    AsciiDataSection,
+    MonotonicIndex,
+    ValidIndexStep,
+    IndexMatchesStartStop,
+]
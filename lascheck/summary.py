@@ -0,0 +1,140 @@
+"""Small, picklable summaries of checked LAS files.
+
+A :class:`lascheck.summary.LASSummary` keeps the header sections of a file,
+the flags set while splitting it into sections and its conformity report,
+but not the lines of the file or the curve data, so it can be sent to
+another process for a few kilobytes whatever the size of the file::
+
+    >>> import lascheck
+    >>> summary = lascheck.read("big.las", check_data=True).to_summary()
+    >>> summary.conforming
+    >>> summary.well["WELL"].value
+
+"""
+from collections import OrderedDict
+
+from .las_items import SectionItems
+
+# Attributes of a LASFile which are copied to its summary as they are.
+FLAGS = (
+    "duplicate_v_section",
+    "duplicate_w_section",
+    "duplicate_p_section",
+    "duplicate_c_section",
+    "duplicate_o_section",
+    "sections_after_a_section",
+    "v_section_first",
+    "blank_line_in_section",
+    "sections_with_blank_line",
+    "non_conforming_depth",
+)
+
+
+def _copy_section(section):
+    """Copy a header section, leaving out the data of any curves."""
+    if not isinstance(section, SectionItems):
+        return section
+    copied = SectionItems()
+    copied.mnemonic_transforms = section.mnemonic_transforms
+    for item in section:
+        new = item.__class__(item.original_mnemonic, item.unit, item.value, item.descr)
+        new.set_session_mnemonic_only(item.mnemonic)
+        copied.append(new)
+    return copied
+
+
+class LASSummary(object):
+
+    """Header sections and conformity results of a LAS file.
+
+    Arguments:
+        las_file (:class:`lascheck.las.LASFile`): the file to summarize. It
+            is checked first if it has not been already.
+
+    Attributes:
+        path (str or None): the file, if it was read from disk
+        encoding (str or None): character encoding used to read the file
+        sections (OrderedDict): copies of the sections of the file, with
+            curves which have no data and an empty ``"Ascii"`` section
+        report (:class:`lascheck.report.ConformityReport`): the result of
+            :meth:`lascheck.las.LASFile.get_conformity_report`
+        data_summary (:class:`lascheck.data.DataSummary` or None): summary of
+            the ~A section, if it was read
+        check_data (bool): True if the data rules were checked
+        index_unit (str or None): unit of the index curve
+        timings (OrderedDict or None): as for
+            :attr:`lascheck.las.LASFile.timings`
+
+    and each of :data:`lascheck.summary.FLAGS`, as for the LASFile.
+
+    """
+
+    def __init__(self, las_file):
+        self.report = las_file.get_conformity_report()
+        read_args = las_file._read_args
+        self.path = read_args[0] if read_args is not None else None
+        self.encoding = las_file.encoding
+        self.sections = OrderedDict()
+        for name in las_file.sections:
+            if name == "Ascii":
+                # The text of the ~A section is not kept, or even joined.
+                self.sections[name] = ""
+            else:
+                self.sections[name] = _copy_section(las_file.sections[name])
+        self.data_summary = las_file.data_summary
+        self.check_data = las_file.check_data
+        self.index_unit = las_file.index_unit
+        self.timings = las_file.timings
+        for name in FLAGS:
+            setattr(self, name, getattr(las_file, name))
+
+    @property
+    def version(self):
+        """Header information from the Version (~V) section."""
+        return self.sections["Version"]
+
+    @property
+    def well(self):
+        """Header information from the Well (~W) section."""
+        return self.sections["Well"]
+
+    @property
+    def curves(self):
+        """Curve information from the Curves (~C) section, without data."""
+        return self.sections["Curves"]
+
+    @property
+    def params(self):
+        """Header information from the Parameter (~P) section."""
+        return self.sections["Parameter"]
+
+    @property
+    def other(self):
+        """Text of the Other (~O) section."""
+        return self.sections["Other"]
+
+    @property
+    def conforming(self):
+        """True if no rule failed."""
+        return self.report.conforming
+
+    @property
+    def non_conformities(self):
+        return self.report.non_conformities
+
+    def get_conformity_report(self):
+        return self.report
+
+    def check_conformity(self):
+        return self.report.conforming
+
+    def get_non_conformities(self):
+        return self.report.non_conformities
+
+    def __repr__(self):
+        return "%s(path=%r, conforming=%s, %d non-conformities)" % (
+            self.__class__.__name__,
+            self.path,
+            self.conforming,
+            len(self.non_conformities),
+        )
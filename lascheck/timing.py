@@ -0,0 +1,166 @@
+"""Time the phases of reading and checking LAS files.
+
+The phases timed are:
+
+* ``open_file`` - :func:`lascheck.reader.open_file`, which includes
+* ``open_with_codecs`` - opening a file on disk and finding its encoding
+* ``read_file_index`` or ``read_file_contents`` - splitting the file into
+  sections
+* ``parse_section:<name>`` - parsing a header section, e.g.
+  ``parse_section:Curves``, the first time it is looked up. Parsing the ~C
+  section includes
+* ``read_data`` - reading the ~A section
+* ``refresh`` - :meth:`lascheck.las.LASFile.refresh`
+* ``rule:<name>`` - checking a rule, e.g. ``rule:ValidIndexMnemonic``. This
+  leaves out the sections parsed (see :class:`lascheck.timing.deferred`) the
+  first time the rule looks them up, which are only counted in their own
+  phases.
+
+A file read with ``timings=True`` keeps the total time of each phase, in
+seconds, in :attr:`lascheck.las.LASFile.timings`::
+
+    >>> las = lascheck.read("a.las", timings=True)
+    >>> las.get_non_conformities()
+    >>> las.timings
+    OrderedDict([('open_with_codecs', 0.0003), ('open_file', 0.0004), ...])
+
+Hooks are called with the name and time of every phase in every file, e.g.
+to add them up over a batch of files::
+
+    >>> totals = collections.Counter()
+    >>> def add(phase, seconds):
+    ...     totals[phase] += seconds
+    >>> lascheck.timing.add_hook(add)
+
+Hooks are only called in the process which registered them, so not for
+files checked in other processes by :func:`lascheck.batch.validate_many`.
+When no hook is registered and no file is being read with ``timings=True``,
+nothing is timed.
+
+"""
+import functools
+import threading
+import time
+
+_hooks = []
+
+# The timings of the file being read or checked in each thread.
+_local = threading.local()
+
+
+def add_hook(hook):
+    """Call ``hook(phase, seconds)`` each time a phase is timed."""
+    _hooks.append(hook)
+
+
+def remove_hook(hook):
+    """Stop calling a hook added with :func:`lascheck.timing.add_hook`."""
+    _hooks.remove(hook)
+
+
+def enabled():
+    """True if phases are being timed in this thread."""
+    return bool(_hooks) or getattr(_local, "timings", None) is not None
+
+
+def record(phase, seconds):
+    """Add the time of a phase to the timings being collected, and call the
+    hooks."""
+    timings = getattr(_local, "timings", None)
+    if timings is not None:
+        timings[phase] = timings.get(phase, 0.0) + seconds
+    for hook in list(_hooks):
+        hook(phase, seconds)
+
+
+def start():
+    """Start timing a phase.
+
+    Returns:
+        the start time to pass to :func:`lascheck.timing.stop`, or None if
+        phases are not being timed.
+
+    """
+    if _hooks or getattr(_local, "timings", None) is not None:
+        return time.perf_counter()
+    return None
+
+
+def stop(phase, started):
+    """Record the time of a phase started by :func:`lascheck.timing.start`."""
+    if started is not None:
+        record(phase, time.perf_counter() - started)
+
+
+def timed(phase):
+    """Decorate a function to time each call as ``phase``."""
+
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _hooks and getattr(_local, "timings", None) is None:
+                return func(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(phase, time.perf_counter() - started)
+
+        return wrapper
+
+    return decorate
+
+
+def deferred_seconds():
+    """Total time spent in :class:`lascheck.timing.deferred` work in this
+    thread. The difference between two calls is the time of the deferred
+    work done in between."""
+    return getattr(_local, "deferred_seconds", 0.0)
+
+
+class deferred(object):
+
+    """Context manager for work which is done when it is first needed, such
+    as parsing a section the first time it is looked up, and which is left
+    out of the time of the rule that needed it.
+
+    The time is measured whether or not phases are being timed, as it is
+    left out of :attr:`lascheck.report.RuleResult.seconds` too. Deferred work
+    nested in other deferred work is only counted once.
+
+    """
+
+    def __enter__(self):
+        self.depth = getattr(_local, "deferred_depth", 0)
+        _local.deferred_depth = self.depth + 1
+        self.started = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        _local.deferred_depth = self.depth
+        if not self.depth:
+            _local.deferred_seconds = (
+                deferred_seconds() + time.perf_counter() - self.started
+            )
+
+
+class collect(object):
+
+    """Context manager to collect the phases timed in this thread.
+
+    Arguments:
+        timings (dict or None): the total time of each phase is added to
+            it. With None, phases are not collected (but hooks are still
+            called).
+
+    """
+
+    def __init__(self, timings):
+        self.timings = timings
+
+    def __enter__(self):
+        self.previous = getattr(_local, "timings", None)
+        _local.timings = self.timings
+        return self.timings
+
+    def __exit__(self, *exc_info):
+        _local.timings = self.previous
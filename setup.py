@@ -33,10 +33,14 @@ setup(name='lascheck',
       license="MIT",
       classifiers=CLASSIFIERS,
       keywords="las geophysics version",
-      packages=["lascheck", ]
-      # entry_points={
-      #     'console_scripts': [
-      #         'lascheck = lascheck:version'
-      #     ],
-      # }
+      packages=["lascheck", ],
+      python_requires=">=3.7",
+      extras_require={
+          'data': ['numpy'],
+      },
+      entry_points={
+          'console_scripts': [
+              'lascheck = lascheck.cli:main'
+          ],
+      }
       )
@@ -0,0 +1,153 @@
+import os, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+import asyncio
+import concurrent.futures
+import io
+import threading
+
+import pytest
+
+import lascheck
+from lascheck import aio
+
+examples_dir = os.path.join(os.path.dirname(__file__), "examples")
+
+readfromexamples = lambda fn: os.path.join(examples_dir, fn)
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_validate_path():
+    path = readfromexamples("missing_vers.las")
+    assert run(aio.validate(path)) == lascheck.validate(path)
+
+
+def test_validate_check_data():
+    pytest.importorskip("numpy")
+    path = readfromexamples("sample_invalid_step.las")
+    assert run(aio.validate(path, check_data=True)) == lascheck.validate(
+        path, check_data=True
+    )
+
+
+def test_validate_blocking_stream():
+    path = readfromexamples("missing_vers.las")
+    with open(path, mode="rb") as f:
+        non_conformities = run(aio.validate(f))
+    assert non_conformities == lascheck.validate(path)
+
+
+def test_validate_async_stream():
+    path = readfromexamples("missing_vers.las")
+    with open(path, mode="rb") as f:
+        data = f.read()
+
+    async def validate_stream():
+        stream = asyncio.StreamReader()
+        stream.feed_data(data)
+        stream.feed_eof()
+        return await aio.validate(stream)
+
+    assert run(validate_stream()) == lascheck.validate(path)
+
+
+def test_validate_error():
+    with pytest.raises(FileNotFoundError):
+        run(aio.validate(readfromexamples("does_not_exist.las")))
+
+
+def test_validate_many_matches_batch():
+    async def collect():
+        return [result async for result in aio.validate_many([examples_dir], max_concurrency=4)]
+
+    results = run(collect())
+    expected = list(lascheck.validate_many([examples_dir], workers=1))
+    assert sorted(results) == sorted(expected)
+
+
+def test_validate_many_unreadable_file():
+    async def collect():
+        return [result async for result in aio.validate_many([readfromexamples("does_not_exist.las")])]
+
+    results = run(collect())
+    assert len(results) == 1
+    assert results[0].error.startswith("FileNotFoundError")
+
+
+def test_validate_many_process_pool():
+    paths = [readfromexamples("sample.las"), readfromexamples("missing_vers.las")]
+
+    async def collect():
+        with concurrent.futures.ProcessPoolExecutor(max_workers=2) as executor:
+            return [result async for result in aio.validate_many(paths, executor=executor)]
+
+    results = {result.path: result for result in run(collect())}
+    assert results[paths[0]].conforming
+    assert not results[paths[1]].conforming
+
+
+def test_validate_many_bounded_concurrency(monkeypatch):
+    running = []
+    peak = []
+    lock = threading.Lock()
+    check = aio._check
+
+    def counting_check(*args, **kwargs):
+        with lock:
+            running.append(1)
+            peak.append(len(running))
+        try:
+            return check(*args, **kwargs)
+        finally:
+            with lock:
+                running.pop()
+
+    monkeypatch.setattr(aio, "_check", counting_check)
+
+    async def collect():
+        return [result async for result in aio.validate_many([examples_dir], max_concurrency=2)]
+
+    assert len(run(collect())) == len(os.listdir(examples_dir))
+    assert max(peak) <= 2
+
+
+def test_cancel_stops_checking_data(tmp_path):
+    pytest.importorskip("numpy")
+    with open(readfromexamples("sample.las")) as f:
+        header = f.read().split("~A")[0]
+    rows = "".join("{} 1 2 3 4 5 6 7\n".format(1670 - i * 0.125) for i in range(200000))
+    path = tmp_path / "big.las"
+    path.write_text(header + "~A\n" + rows)
+    blocks = []
+    started = threading.Event()
+    iter_data_chunks = lascheck.las.LASFile.iter_data_chunks
+
+    def slow_iter_data_chunks(self, rows=65536):
+        for item in iter_data_chunks(self, rows=1000):
+            blocks.append(item[0])
+            started.set()
+            threading.Event().wait(0.01)
+            yield item
+
+    async def cancel():
+        task = asyncio.ensure_future(aio.validate(str(path), check_data=True))
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, started.wait)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        nblocks = len(blocks)
+        await asyncio.sleep(0.2)
+        return nblocks
+
+    lascheck.las.LASFile.iter_data_chunks = slow_iter_data_chunks
+    try:
+        nblocks = run(cancel())
+    finally:
+        lascheck.las.LASFile.iter_data_chunks = iter_data_chunks
+    # Only the block being read when the task was cancelled is finished.
+    assert len(blocks) <= nblocks + 1
+    assert len(blocks) < 200
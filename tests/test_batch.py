@@ -0,0 +1,55 @@
+import os, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+import pickle
+
+import lascheck
+from lascheck import batch
+
+examples_dir = os.path.join(os.path.dirname(__file__), "examples")
+
+readfromexamples = lambda fn: os.path.join(examples_dir, fn)
+
+
+def test_validate_many_matches_read():
+    results = list(lascheck.validate_many([examples_dir], workers=2))
+    assert len(results) == len(os.listdir(examples_dir))
+    for result in results:
+        las = lascheck.read(result.path)
+        assert result.error is None
+        assert result.encoding == las.encoding
+        assert result.non_conformities == las.get_non_conformities()
+        assert result.conforming == las.check_conformity()
+
+
+def test_validate_many_serial():
+    paths = [readfromexamples("sample.las"), readfromexamples("missing_vers.las")]
+    results = {r.path: r for r in lascheck.validate_many(paths, workers=1)}
+    assert results[paths[0]].conforming
+    assert results[paths[0]].non_conformities == []
+    assert not results[paths[1]].conforming
+    assert results[paths[1]].non_conformities == ['Missing mandatory lines in ~v Section']
+
+
+def test_validate_many_unreadable_file():
+    results = list(lascheck.validate_many([readfromexamples("does_not_exist.las")]))
+    assert len(results) == 1
+    assert not results[0].conforming
+    assert results[0].error.startswith("FileNotFoundError")
+
+
+def test_validation_result_is_picklable():
+    result = batch.validate_path(readfromexamples("sample.las"))
+    assert pickle.loads(pickle.dumps(result)) == result
+
+
+def test_expand_paths():
+    paths = list(batch.expand_paths([examples_dir, "other.txt"]))
+    assert readfromexamples("sample.las") in paths
+    assert paths[-1] == "other.txt"
+
+
+def test_expand_paths_glob():
+    paths = list(batch.expand_paths([os.path.join(examples_dir, "sample*.las")]))
+    assert readfromexamples("sample.las") in paths
+    assert readfromexamples("missing_vers.las") not in paths
@@ -0,0 +1,105 @@
+import itertools
+import os, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "benchmarks"))
+import pytest
+
+import lascheck
+from lascheck import spec
+
+import bench_suite
+import synthetic
+
+
+@pytest.mark.parametrize("encoding", ["ascii", "utf-8", "latin-1"])
+@pytest.mark.parametrize("wrap", [False, True])
+def test_synthetic_file_conforms(tmp_path, encoding, wrap):
+    path = str(tmp_path / "clean.las")
+    synthetic.write_las(path, curves=12, rows=50, encoding=encoding, wrap=wrap)
+    assert lascheck.validate(path, check_data=True) == []
+
+
+@pytest.mark.parametrize("defect", sorted(synthetic.DEFECTS))
+def test_synthetic_defect(tmp_path, defect):
+    path = str(tmp_path / "defect.las")
+    synthetic.write_las(path, curves=5, rows=50, defects=[defect])
+    assert lascheck.validate(path, check_data=True) != []
+
+
+# The rule that each defect breaks.
+DEFECT_RULES = {
+    "missing_vers": spec.MandatoryLinesInVersionSection,
+    "missing_null": spec.MandatoryLinesInWellSection,
+    "invalid_index_mnemonic": spec.ValidIndexMnemonic,
+    "invalid_depth_unit": spec.ValidUnitForDepth,
+    "blank_line": spec.BlankLineInSection,
+    "duplicate_section": spec.DuplicateSections,
+    "v_section_second": spec.VSectionFirst,
+    "sections_after_a": spec.SectionsAfterASection,
+    "stop_mismatch": spec.IndexMatchesStartStop,
+    "non_monotonic": spec.MonotonicIndex,
+    "bad_step": spec.ValidIndexStep,
+    "short_row": spec.ValidColumnCount,
+    "non_ascii": spec.AsciiDataSection,
+}
+
+
+def test_defect_rules_cover_defects():
+    assert set(DEFECT_RULES) == set(synthetic.DEFECTS)
+
+
+def defect_combinations():
+    defects = sorted(synthetic.DEFECTS)
+    return [
+        pytest.param(list(pair), id="+".join(pair))
+        for pair in itertools.combinations(defects, 2)
+    ] + [pytest.param(defects, id="all")]
+
+
+@pytest.mark.parametrize("defects", defect_combinations())
+@pytest.mark.parametrize("wrap", [False, True])
+def test_synthetic_defects_combined(tmp_path, defects, wrap):
+    path = str(tmp_path / "defects.las")
+    synthetic.write_las(path, curves=5, rows=10, wrap=wrap, defects=defects)
+    las = lascheck.read(path, check_data=True, ignore_data=True)
+    failed = {result.rule for result in las.get_conformity_report() if result.passed is False}
+    for defect in defects:
+        rule = DEFECT_RULES[defect]
+        if failed.intersection(rule.requires):
+            # The rule is not checked.
+            continue
+        if defect == "invalid_depth_unit" and "invalid_index_mnemonic" in defects:
+            # The units are only checked for a depth index.
+            continue
+        assert rule in failed, defect
+
+
+def test_synthetic_unknown_defect():
+    with pytest.raises(ValueError):
+        synthetic.make_las(defects=["no_such_defect"])
+
+
+def test_synthetic_is_deterministic():
+    assert synthetic.make_las(rows=20) == synthetic.make_las(rows=20)
+
+
+def test_bench_suite_run_and_compare(tmp_path):
+    results = bench_suite.run(["small"], str(tmp_path), repeat=1, scale=0.01)
+    assert set(results) == {
+        "small/" + name
+        for name in (
+            "open_file",
+            "read_file_contents",
+            "parse_header_section",
+            "rules",
+            "read",
+            "validate",
+        )
+    }
+    assert bench_suite.compare(results, results, 0.25) == []
+    slower = {
+        key: dict(result, seconds=result["seconds"] + 1)
+        for key, result in results.items()
+    }
+    assert len(bench_suite.compare(slower, results, 0.25)) == len(results)
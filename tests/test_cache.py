@@ -0,0 +1,116 @@
+import os, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+import pickle
+import shutil
+
+import lascheck
+from lascheck import cache, reader
+
+egfn = lambda fn: os.path.join(os.path.dirname(__file__), "examples", fn)
+
+
+def copy_example(tmp_path, fn):
+    path = str(tmp_path / fn)
+    shutil.copy(egfn(fn), path)
+    return path
+
+
+def test_cache_miss_then_hit(tmp_path, monkeypatch):
+    path = copy_example(tmp_path, "missing_vers.las")
+    cache_dir = str(tmp_path / "cache")
+    las = lascheck.read(path, cache=cache_dir)
+    expected = las.get_non_conformities()
+    assert expected == ["Missing mandatory lines in ~v Section"]
+
+    def fail(*args, **kwargs):
+        raise AssertionError("file was read")
+
+    monkeypatch.setattr(reader, "read_file_index", fail)
+    las = lascheck.read(path, cache=cache_dir)
+    assert not las.check_conformity()
+    assert las.get_non_conformities() == expected
+
+
+def test_cache_hit_restores_flags(tmp_path, monkeypatch):
+    path = copy_example(tmp_path, "sample_duplicate_sections.las")
+    cache_dir = str(tmp_path / "cache")
+    expected = lascheck.read(path, cache=cache_dir)
+    monkeypatch.setattr(reader, "read_file_index", None)
+    las = lascheck.read(path, cache=cache_dir)
+    for name in ("duplicate_v_section", "duplicate_w_section", "v_section_first",
+                 "sections_with_blank_line", "sections_after_a_section", "index_unit"):
+        assert getattr(las, name) == getattr(expected, name)
+    assert las.duplicate_v_section and las.index_unit == "M"
+    assert las._deferred_read is not None
+
+
+def test_cache_deferred_read(tmp_path):
+    path = copy_example(tmp_path, "sample.las")
+    cache_dir = str(tmp_path / "cache")
+    lascheck.read(path, cache=cache_dir)
+    las = lascheck.read(path, cache=cache_dir)
+    assert las._deferred_read is not None
+    assert las.version["VERS"].value == 2.0
+    assert las.well["STRT"].value == lascheck.read(path).well["STRT"].value
+    assert las.get_non_conformities() == []
+
+
+def test_cache_modified_file(tmp_path):
+    path = copy_example(tmp_path, "sample.las")
+    cache_dir = str(tmp_path / "cache")
+    assert lascheck.read(path, cache=cache_dir).check_conformity()
+    shutil.copy(egfn("missing_vers.las"), path)
+    las = lascheck.read(path, cache=cache_dir)
+    assert las._deferred_read is None
+    assert not las.check_conformity()
+
+
+def test_cache_content_change_with_same_stat(tmp_path):
+    path = copy_example(tmp_path, "sample.las")
+    result_cache = cache.ResultCache(str(tmp_path / "cache"))
+    lascheck.read(path, cache=result_cache)
+    stat = os.stat(path)
+    with open(path, "r+b") as f:
+        f.write(b"#")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    las = lascheck.read(path, cache=result_cache)
+    assert las._deferred_read is None
+
+
+def test_cache_keyed_by_options(tmp_path):
+    path = copy_example(tmp_path, "sample.las")
+    result_cache = cache.ResultCache(str(tmp_path / "cache"))
+    lascheck.read(path, cache=result_cache)
+    las = lascheck.read(path, cache=result_cache, ignore_header_errors=True)
+    assert las._deferred_read is None
+    las = lascheck.read(path, cache=result_cache)
+    assert las._deferred_read is not None
+
+
+def test_cache_pickle(tmp_path):
+    path = copy_example(tmp_path, "sample.las")
+    result_cache = cache.ResultCache(str(tmp_path / "cache"))
+    lascheck.read(path, cache=result_cache)
+    unpickled = pickle.loads(pickle.dumps(result_cache))
+    assert unpickled.directory == result_cache.directory
+    assert lascheck.read(path, cache=unpickled)._deferred_read is not None
+
+
+def test_cache_clear(tmp_path):
+    path = copy_example(tmp_path, "sample.las")
+    result_cache = cache.ResultCache(str(tmp_path / "cache"))
+    lascheck.read(path, cache=result_cache)
+    result_cache.clear()
+    assert lascheck.read(path, cache=result_cache)._deferred_read is None
+
+
+def test_validate_many_with_cache(tmp_path):
+    paths = [
+        copy_example(tmp_path, "sample.las"),
+        copy_example(tmp_path, "missing_vers.las"),
+    ]
+    cache_dir = str(tmp_path / "cache")
+    first = list(lascheck.validate_many(paths, workers=2, cache=cache_dir))
+    second = list(lascheck.validate_many(paths, workers=2, cache=cache_dir))
+    assert sorted(first) == sorted(second)
@@ -0,0 +1,64 @@
+import os, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+import csv
+import io
+import json
+
+from lascheck import cli
+
+examples_dir = os.path.join(os.path.dirname(__file__), "examples")
+
+readfromexamples = lambda fn: os.path.join(examples_dir, fn)
+
+
+def test_cli_conforming_file(capsys):
+    assert cli.main([readfromexamples("sample.las")]) == cli.EXIT_CONFORMING
+    out, err = capsys.readouterr()
+    assert out == "{}: OK\n".format(readfromexamples("sample.las"))
+
+
+def test_cli_non_conforming_file(capsys):
+    assert cli.main([readfromexamples("missing_vers.las")]) == cli.EXIT_NON_CONFORMING
+    out, err = capsys.readouterr()
+    assert out.splitlines()[1].strip() == "Missing mandatory lines in ~v Section"
+
+
+def test_cli_missing_file(capsys):
+    assert cli.main([readfromexamples("does_not_exist.las")]) == cli.EXIT_ERROR
+
+
+def test_cli_no_files_found(capsys):
+    assert cli.main([os.path.join(examples_dir, "*.nothing")]) == cli.EXIT_ERROR
+
+
+def test_cli_ndjson(capsys):
+    assert cli.main(["-j", "2", "-f", "ndjson", examples_dir]) == cli.EXIT_NON_CONFORMING
+    out, err = capsys.readouterr()
+    records = [json.loads(line) for line in out.splitlines()]
+    assert len(records) == len(os.listdir(examples_dir))
+    by_path = {r["path"]: r for r in records}
+    assert by_path[readfromexamples("sample.las")]["conforming"]
+    assert by_path[readfromexamples("missing_wrap.las")]["non_conformities"] == [
+        "Missing mandatory lines in ~v Section"]
+
+
+def test_cli_csv(capsys):
+    cli.main(["-f", "csv", os.path.join(examples_dir, "sample*.las")])
+    out, err = capsys.readouterr()
+    rows = list(csv.DictReader(io.StringIO(out)))
+    assert rows[0].keys() == {"path", "encoding", "conforming", "non_conformities", "error"}
+    assert {r["path"] for r in rows} >= {readfromexamples("sample.las")}
+
+
+def test_cli_fail_fast(capsys):
+    assert cli.main(["--fail-fast", examples_dir]) == cli.EXIT_NON_CONFORMING
+    out, err = capsys.readouterr()
+    assert out.count(": FAIL") == 1
+
+
+def test_cli_stats(capsys):
+    cli.main(["--stats", readfromexamples("sample.las")])
+    out, err = capsys.readouterr()
+    assert "Checked 1 files" in err
+    assert "files/s" in err
@@ -302,4 +302,23 @@ def test_check_conforming_positive():
 
     las = lascheck.read(readfromexamples("sample5_indexbaseddata.las"))
     assert las.check_conformity()
-    assert las.get_non_conformities() == []
\ No newline at end of file
+    assert las.get_non_conformities() == []
+
+def test_ignore_data_gives_same_non_conformities():
+    for fn in sorted(os.listdir(os.path.join(test_dir, "examples"))):
+        las = lascheck.read(readfromexamples(fn))
+        streamed = lascheck.read(readfromexamples(fn), ignore_data=True)
+        assert streamed.check_conformity() == las.check_conformity()
+        assert streamed.get_non_conformities() == las.get_non_conformities()
+
+
+def test_ignore_data_does_not_keep_ascii_lines():
+    las = lascheck.read(readfromexamples("sample.las"), ignore_data=True)
+    assert "Ascii" in las.sections
+    assert las.sections["Ascii"] == ""
+
+
+def test_validate():
+    assert lascheck.validate(readfromexamples("sample.las")) == []
+    assert lascheck.validate(readfromexamples("blank_line_in_ascii_section.las")) == [
+        "Section ~A having blank line"]
@@ -0,0 +1,448 @@
+import os, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import lascheck
+from lascheck import reader
+from lascheck.data import DataSummary
+
+readfromexamples = lambda fn: os.path.join(os.path.dirname(__file__), "examples", fn)
+
+HEADER = """~VERSION INFORMATION
+ VERS.                  2:   CWLS LOG ASCII STANDARD -VERSION 2.0
+ WRAP.                  NO:   ONE LINE PER DEPTH STEP
+~WELL INFORMATION BLOCK
+ STRT.M        1670.000000:
+ STOP.M        1669.750000:
+ STEP.M            -0.1250:
+ NULL.           -999.2500:
+ COMP.             COMPANY:   # ANY OIL COMPANY LTD.
+ WELL.                WELL:   ANY ET AL OIL WELL #12
+ FLD .               FIELD:   EDAM
+ LOC .            LOCATION:   A9-16-49-20W3M
+ PROV.            PROVINCE:   SASKATCHEWAN
+ SRVC.     SERVICE COMPANY:   ANY LOGGING COMPANY LTD.
+ DATE.            LOG DATE:   25-DEC-1988
+ UWI .      UNIQUE WELL ID:   100091604920W300
+~CURVE INFORMATION
+ DEPT.M                      :  1  DEPTH
+ DT  .US/M                   :  2  SONIC TRANSIT TIME
+ RHOB.K/M3                   :  3  BULK DENSITY
+~A  DEPTH     DT       RHOB
+"""
+
+
+def read_data(data_lines, **kwargs):
+    return lascheck.read(HEADER + "\n".join(data_lines), **kwargs)
+
+
+def test_read_data():
+    las = lascheck.read(readfromexamples("sample.las"))
+    assert las.data.shape == (3, 8)
+    assert las.curves["DEPT"].data.tolist() == [1670.0, 1669.875, 1669.75]
+    assert las["ILD"].tolist() == [105.6, 105.6, 105.6]
+
+
+def test_curve_data_are_views():
+    las = lascheck.read(readfromexamples("sample.las"))
+    base = las.curves[0].data.base
+    assert base is not None
+    assert all(curve.data.base is base for curve in las.curves)
+
+
+def test_same_data_from_file_and_string():
+    from_file = lascheck.read(readfromexamples("sample2.las"))
+    with open(readfromexamples("sample2.las")) as f:
+        from_string = lascheck.read(f.read())
+    np.testing.assert_array_equal(from_file.data, from_string.data)
+
+
+def test_null_values():
+    las = read_data(["1670.0 -999.25 2550", "1669.875 123.45 -999.2500"])
+    assert np.isnan(las["DT"][0])
+    assert np.isnan(las["RHOB"][1])
+    assert las["DT"][1] == 123.45
+
+
+def test_null_policy_none():
+    las = read_data(["1670.0 -999.25 2550"], null_policy="none")
+    assert las["DT"][0] == -999.25
+
+
+def test_read_substitutions():
+    las = read_data(["1670,0 1-2", "1669.875 (null) 5", "1669.75 1.2.3"], null_policy="common")
+    assert las["DEPT"].tolist() == [1670.0, 1669.875, 1669.75]
+    assert las["DT"][0] == 1
+    assert las["RHOB"][0] == -2
+    assert np.isnan(las["DT"][1])
+    assert np.isnan(las["DT"][2])
+    assert np.isnan(las["RHOB"][2])
+
+
+def test_substitutions_changing_numbers():
+    las = read_data(["1670.0 -0.0 2550"], null_policy="aggressive")
+    assert np.isnan(las["DT"][0])
+
+
+def test_non_numeric_values_become_nan():
+    las = read_data(["1670.0 ABC 2550", "1669.875 1 2" + chr(26)])
+    assert np.isnan(las["DT"][0])
+    assert las["RHOB"].tolist() == [2550, 2]
+
+
+def test_more_columns_than_curves():
+    las = read_data(["1670.0 1 2 3", "1669.875 4 5 6"])
+    assert las.data.shape == (2, 4)
+    assert las.curves[3].mnemonic == "UNKNOWN"
+    assert las.curves[3].data.tolist() == [3, 6]
+
+
+def test_incomplete_last_row():
+    las = read_data(["1670.0 1 2", "1669.875 4"])
+    assert las.data.shape == (2, 3)
+    assert np.isnan(las["RHOB"][1])
+
+
+def test_ignore_data():
+    las = lascheck.read(readfromexamples("sample.las"), ignore_data=True)
+    assert len(las.curves["DEPT"].data) == 0
+
+
+def test_read_data_section_in_blocks(monkeypatch):
+    monkeypatch.setattr(reader, "DATA_CHUNK_ROWS", 2)
+    lines = ["1 2", "3 4", "5 6,5", "7 8"]
+    data = reader.read_data_section(lines, 2, *reader.get_substitutions("default", "none")[:2])
+    assert data.tolist() == [[1, 2], [3, 4], [5, 6.5], [7, 8]]
+
+
+def test_read_data_section_no_lines():
+    assert reader.read_data_section([], 3, [], []).shape == (0, 3)
+
+
+def test_data_rules_not_run_by_default():
+    las = read_data(["1670.0 1 2", "1670.0 1 2"])
+    assert las.check_conformity() == lascheck.read(HEADER).check_conformity()
+    assert "MonotonicIndex" not in [result.rule.__name__ for result in las.get_conformity_report()]
+
+
+def test_data_rules_conforming():
+    las = lascheck.read(readfromexamples("sample.las"), check_data=True)
+    assert las.check_conformity()
+    assert las.get_non_conformities() == []
+
+
+def test_data_rules_column_count():
+    las = read_data(["1670.0 1 2", "1669.875 1", "1669.75 1 2 3"], check_data=True)
+    assert "2 lines in ~a section do not have 3 values, one per curve (first at line 23)" \
+        in las.get_non_conformities()
+
+
+def test_data_rules_monotonic_index():
+    las = read_data(["1670.0 1 2", "1669.875 1 2", "1669.875 1 2", "1669.75 1 2"], check_data=True)
+    assert not las.check_conformity()
+    assert "Index in ~a section is not strictly increasing or decreasing (line 24)" in las.get_non_conformities()
+
+
+def test_data_rules_step():
+    las = read_data(["1670.0 1 2", "1669.875 1 2", "1669.75 1 2", "1669.5 1 2"], check_data=True)
+    assert las.get_non_conformities() == [
+        "Index spacing in ~a section does not match STEP (line 25)",
+        "Last index value in ~a section (1669.5) does not match STOP",
+    ]
+
+
+def test_data_rules_start():
+    las = read_data(["1671.0 1 2", "1670.875 1 2"], check_data=True)
+    assert las.get_non_conformities() == [
+        "First index value in ~a section (1671.0) does not match STRT",
+        "Last index value in ~a section (1670.875) does not match STOP",
+    ]
+
+
+def test_data_rules_pass_without_data():
+    las = lascheck.read(readfromexamples("sample.las"), ignore_data=True)
+    assert las.data_summary is None
+    assert las.get_non_conformities() == []
+
+
+def test_check_data_streams_with_ignore_data():
+    las = lascheck.read(readfromexamples("sample.las"), check_data=True, ignore_data=True)
+    assert len(las.curves[0].data) == 0
+    assert las.data_summary.nrows == 3
+    assert las.get_non_conformities() == []
+
+
+def test_data_summary_across_blocks():
+    summary = DataSummary(2)
+    summary.add_rows(np.array([[1.0, 0], [2.0, 0]]))
+    summary.add_rows(np.array([[3.0, 0], [3.0, 0], [4.5, 0]]), line_nos=np.array([10, 11, 12]))
+    assert summary.nrows == 5
+    assert summary.first_index == 1.0 and summary.last_index == 4.5
+    assert summary.direction == 1
+    assert summary.first_non_monotonic_line == 11
+    assert (summary.min_step, summary.min_step_line) == (0.0, 11)
+    assert (summary.max_step, summary.max_step_line) == (1.5, 12)
+
+
+def test_data_summary_seam():
+    summary = DataSummary(1)
+    summary.add_rows(np.array([[3.0], [2.0]]))
+    summary.add_rows(np.array([[2.5], [1.0]]))
+    assert summary.first_non_monotonic_line == 3
+
+
+def test_cli_check_data(capsys):
+    from lascheck import cli
+
+    path = readfromexamples("sample_invalid_stop_step.las")
+    assert cli.main([path]) == cli.EXIT_NON_CONFORMING
+    assert "does not match STOP" not in capsys.readouterr()[0]
+    assert cli.main(["--check-data", path]) == cli.EXIT_NON_CONFORMING
+    assert "Last index value in ~a section (1669.75) does not match STOP" in capsys.readouterr()[0]
+
+
+def test_iter_data_chunks_line_numbers():
+    lines = list(zip([5, 6, 8, 9], ["1 2", "3 4", "5 6", "7 8"]))
+    chunks = list(reader.iter_data_chunks(lines, 2, [], [], rows=3))
+    assert [line_no for line_no, block in chunks] == [5, 9]
+    assert [block.tolist() for line_no, block in chunks] == [[[1, 2], [3, 4], [5, 6]], [[7, 8]]]
+
+
+def test_iter_data_chunks_rows_split_across_chunks():
+    lines = list(zip([1, 2, 3, 4, 5, 6], ["1 2 3", "4", "5 6", "7 8", "9", "10 11"]))
+    chunks = list(reader.iter_data_chunks(lines, 3, [], [-999.25], rows=2))
+    assert [line_no for line_no, block in chunks] == [1, 2, 4, 6]
+    assert np.concatenate([block for line_no, block in chunks]).tolist()[:3] == [
+        [1, 2, 3], [4, 5, 6], [7, 8, 9]]
+    assert np.isnan(chunks[-1][1][-1, 2])
+
+
+def test_las_iter_data_chunks():
+    las = lascheck.read(readfromexamples("sample.las"), ignore_data=True)
+    chunks = list(las.iter_data_chunks(rows=2))
+    assert [line_no for line_no, block in chunks] == [44, 46]
+    full = lascheck.read(readfromexamples("sample.las"))
+    np.testing.assert_array_equal(np.concatenate([block for line_no, block in chunks]), full.data)
+    assert las.data_summary.nrows == 3
+    assert las.data_summary.first_index == 1670.0
+
+
+def test_las_iter_data_chunks_null_policy(tmp_path):
+    path = tmp_path / "nulls.las"
+    path.write_text(HEADER + "1670.0 -999.25 2550\n1669.875 123.45 -999.2500\n")
+    las = lascheck.read(str(path), ignore_data=True)
+    block = np.concatenate([block for line_no, block in las.iter_data_chunks(rows=1)])
+    assert np.isnan(block[0, 1]) and np.isnan(block[1, 2])
+
+
+WRAPPED_HEADER = HEADER.replace(
+    "WRAP.                  NO:   ONE LINE PER DEPTH STEP", "WRAP.                  YES:  MULTIPLE LINES PER DEPTH STEP"
+)
+
+
+def read_wrapped(data_lines, **kwargs):
+    return lascheck.read(WRAPPED_HEADER + "\n".join(data_lines), **kwargs)
+
+
+def test_read_wrapped_data():
+    las = lascheck.read(readfromexamples("sample3.las"), check_data=True)
+    assert las.data.shape == (5, 36)
+    assert las["DEPT"].tolist() == [910.0, 909.875, 909.75, 909.625, 909.5]
+    assert las.data_summary.wrapped
+    assert las.get_non_conformities() == []
+
+
+def test_wrapped_records_across_chunks():
+    lines = list(zip(range(1, 9), ["10", "1", "2", "9", "3 4", "8", "5", "6"]))
+    chunks = list(reader.iter_data_chunks(lines, 3, [], [], rows=2, wrapped=True))
+    assert [line_no for line_no, block in chunks] == [1, 4, 6]
+    assert np.concatenate([block for line_no, block in chunks]).tolist() == [
+        [10, 1, 2], [9, 3, 4], [8, 5, 6]]
+
+
+def test_wrapped_record_too_long():
+    summary = DataSummary(3, wrapped=True)
+    lines = list(zip(range(1, 7), ["10", "1 2 3", "9", "4 5", "8 6", "7"]))
+    data = np.concatenate([block for line_no, block in reader.iter_data_chunks(
+        lines, 3, [], [], summary=summary, wrapped=True)])
+    assert data.tolist() == [[10, 1, 2], [9, 4, 5], [8, 6, 7]]
+    assert (summary.bad_column_lines, summary.first_bad_column_line) == (1, 1)
+    assert (summary.bad_index_lines, summary.first_bad_index_line) == (1, 5)
+
+
+def test_wrapped_data_rules():
+    las = read_wrapped(["1670.0", "1 2", "1669.875 1", "2", "1669.75", "1"], check_data=True)
+    assert las.data.shape == (3, 3)
+    assert np.isnan(las["RHOB"][2])
+    assert las.get_non_conformities() == [
+        "1 wrapped records in ~a section do not have 3 values, one per curve (first at line 26)",
+        "1 wrapped records in ~a section do not start with a line holding only the index (first at line 24)",
+    ]
+
+
+def test_non_ascii_data_lines(tmp_path):
+    path = tmp_path / "non_ascii.las"
+    data = "1670.0 1 2\n1669.875 1 °2\n1669.75 1 2\n"
+    path.write_bytes((HEADER + data).encode("latin-1"))
+    message = "1 lines in ~a section have non-ASCII characters (first at line 23)"
+    las = lascheck.read(str(path), check_data=True)
+    assert np.isnan(las["RHOB"][1])
+    assert las.get_non_conformities() == [message]
+    assert lascheck.read(HEADER + data, check_data=True).get_non_conformities() == [message]
+
+
+def test_bytes_and_str_lines_parse_alike():
+    lines = ["1670.0 1 2", "1669.875 (null) 2,5", "1669.75 1 2"]
+    subs = reader.get_substitutions("default", "common")[:2]
+    from_str = reader.read_data_section(lines, 3, *subs)
+    from_bytes = reader.read_data_section([line.encode() for line in lines], 3, *subs)
+    np.testing.assert_array_equal(from_str, from_bytes)
+
+
+def test_data_section_read_as_bytes():
+    las = lascheck.read(readfromexamples("blank_line_in_ascii_section.las"), ignore_data=True)
+    blocks = list(reader.iter_raw_section_blocks(las._data_section))
+    assert all(isinstance(line, bytes) for line_nos, lines in blocks for line in lines)
+    numbered = [(n, line.decode()) for line_nos, lines in blocks for n, line in zip(line_nos, lines)]
+    from_string = lascheck.read(open(readfromexamples("blank_line_in_ascii_section.las")).read())
+    assert numbered == list(zip(from_string._data_section["line_nos"], from_string._data_section["lines"]))
+
+
+@pytest.mark.parametrize("newline", ["\n", "\r\n"])
+@pytest.mark.parametrize("read_size", [7, 100, 10 ** 6])
+def test_data_read_as_blocks_of_bytes(tmp_path, monkeypatch, newline, read_size):
+    monkeypatch.setattr(reader, "SECTION_READ_SIZE", read_size)
+    monkeypatch.setattr(reader, "DATA_CHUNK_ROWS", 3)
+    rows = ["1670.0 1 2", "1669.875 1", "1669.75 1 2", "1669.625 1 \u00e92", "1669.5 1 2"]
+    text = (HEADER + "\n".join(rows)).replace("\n", newline)
+    path = tmp_path / "bytes.las"
+    path.write_bytes(text.encode("utf-8"))
+    las = lascheck.read(str(path), check_data=True)
+    assert las._data_section["clean"]
+    expected = lascheck.read(text, check_data=True)
+    np.testing.assert_array_equal(las.data, expected.data)
+    assert vars(las.data_summary) == vars(expected.data_summary)
+    assert las.get_non_conformities() == expected.get_non_conformities() != []
+
+
+def write_las(tmp_path, text, name="growing.las"):
+    path = tmp_path / name
+    path.write_bytes(text.encode("ascii"))
+    return str(path)
+
+
+def append(path, text):
+    with open(path, "a") as f:
+        f.write(text)
+
+
+def assert_same_as_read(las, path, **kwargs):
+    full = lascheck.read(path, **kwargs)
+    assert full.get_non_conformities() == las.get_non_conformities()
+    assert vars(full.data_summary) == vars(las.data_summary)
+    if not kwargs.get("ignore_data"):
+        assert np.array_equal(full.data, las.data, equal_nan=True)
+
+
+def test_refresh_appended_rows(tmp_path):
+    path = write_las(tmp_path, HEADER + "1670.0 1 2\n1669.875 1 2\n")
+    las = lascheck.read(path, check_data=True)
+    append(path, "1669.75 1 2\n1669.625 3 4\n")
+    las.refresh()
+    assert las.data.shape == (4, 3)
+    assert las["DT"].tolist() == [1, 1, 1, 3]
+    assert las.get_non_conformities() == [
+        "Last index value in ~a section (1669.625) does not match STOP"]
+    assert_same_as_read(las, path, check_data=True)
+
+
+def test_refresh_index_rules_at_seam(tmp_path):
+    path = write_las(tmp_path, HEADER + "1670.0 1 2\n1669.875 1 2\n")
+    las = lascheck.read(path, check_data=True, ignore_data=True)
+    append(path, "1669.875 1 2\n")
+    las.refresh()
+    assert las.data_summary.first_non_monotonic_line == 24
+    assert_same_as_read(las, path, check_data=True, ignore_data=True)
+
+
+def test_refresh_blank_line_and_comment(tmp_path):
+    path = write_las(tmp_path, HEADER + "1670.0 1 2\n1669.875 1 2\n")
+    las = lascheck.read(path, check_data=True)
+    blank_line = "Section ~A having blank line"
+    assert blank_line not in las.get_non_conformities()
+    append(path, "\n# comment\n1669.75 1 2\n")
+    las.refresh()
+    assert las.get_non_conformities().count(blank_line) == 1
+    assert las.data.shape == (3, 3)
+    assert_same_as_read(las, path, check_data=True)
+    append(path, "  \n")
+    las.refresh()
+    assert las.get_non_conformities().count(blank_line) == 2
+    assert_same_as_read(las, path, check_data=True)
+
+
+def test_refresh_only_reads_new_lines(tmp_path, monkeypatch):
+    path = write_las(tmp_path, HEADER + "1670.0 1 2\n")
+    las = lascheck.read(path, check_data=True)
+    las.get_non_conformities()
+    append(path, "1669.875 1 2\n1669.75 1 2\n")
+
+    def fail(*args, **kwargs):
+        raise AssertionError("file was read again")
+
+    monkeypatch.setattr(reader, "read_file_index", fail)
+    las.refresh()
+    assert las.check_conformity()
+    assert las.data_summary.nrows == 3
+
+
+def test_refresh_leaves_unfinished_line(tmp_path):
+    path = write_las(tmp_path, HEADER + "1670.0 1 2\n")
+    las = lascheck.read(path, check_data=True)
+    append(path, "1669.875 1 2\n1669.75 1")
+    las.refresh()
+    assert las.data.shape == (2, 3)
+    append(path, " 2\n")
+    las.refresh()
+    assert las.data.shape == (3, 3)
+    assert las.check_conformity()
+
+
+def test_refresh_completes_wrapped_record(tmp_path):
+    path = write_las(tmp_path, WRAPPED_HEADER + "1670.0\n1 2\n1669.875\n1\n")
+    las = lascheck.read(path, check_data=True)
+    assert np.isnan(las["RHOB"][1])
+    append(path, "2\n1669.75\n1 2\n")
+    las.refresh()
+    assert las.data.tolist() == [[1670.0, 1, 2], [1669.875, 1, 2], [1669.75, 1, 2]]
+    assert las.check_conformity()
+    assert_same_as_read(las, path, check_data=True)
+
+
+def test_refresh_after_header_change(tmp_path):
+    path = write_las(tmp_path, HEADER + "1670.0 1 2\n")
+    las = lascheck.read(path, check_data=True)
+    with open(path, "r+b") as f:
+        f.write(b"~V")
+    append(path, "1669.875 1 2\n")
+    las.refresh()
+    assert_same_as_read(las, path, check_data=True)
+
+
+def test_refresh_section_after_data(tmp_path):
+    path = write_las(tmp_path, HEADER + "1670.0 1 2\n")
+    las = lascheck.read(path, check_data=True)
+    append(path, "~O\nnotes\n")
+    las.refresh()
+    assert las.sections_after_a_section
+    assert_same_as_read(las, path, check_data=True)
+
+
+def test_refresh_needs_file_on_disk():
+    las = read_data(["1670.0 1 2"])
+    with pytest.raises(ValueError):
+        las.refresh()
@@ -0,0 +1,91 @@
+import os, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+import pytest
+
+from lascheck import reader
+
+examples_dir = os.path.join(os.path.dirname(__file__), "examples")
+
+readfromexamples = lambda fn: os.path.join(examples_dir, fn)
+
+ODD_LINES = [
+    "DEPT.M                      :   1  DEPTH",
+    "DEPT .M : DEPTH",
+    "DEPT.M.  : DEPTH",
+    "DEPT.  : no unit",
+    "DEPT. M : unit after a space",
+    "STRT.M    1670.000000 : START DEPTH",
+    "STRT.M 1670,5 : comma decimal mark",
+    "DATE.   13/12/1986 12:30:00 : colons in the value",
+    "TIME.S   : colons : in : the : descr",
+    "UNIT.M:no spaces",
+    "NAME.UNIT value with no descr",
+    "NAME.UNIT",
+    "NAME.",
+    "NAME.:",
+    ".NAME.UNIT value : leading dot",
+    ".UNIT value : leading dot and no name",
+    ".UNIT value",
+    ".A:B.C D",
+    "A:B.UNIT value : colon in the name",
+    "A:B.UNIT value",
+    "A.B.C.D : dots",
+    "UWI .      UNIQUE WELL ID:100123401234W500",
+    "API .     :API NUMBER",
+    "NULL.       -999.25 :NULL VALUE",
+    "\tTAB.M\t1\t:\ttabs",
+    "SPACE.M\u00a01 : non-breaking space",
+    "NAME.UNIT value : descr\nsecond line",
+]
+
+
+def read_header_line_regex(line):
+    """Parse a line the way read_header_line() did before the fast path."""
+    if not ":" in line:
+        return reader.read_header_line(line, pattern=reader.HEADER_LINE_RE)
+    else:
+        return reader.read_header_line(line, pattern=reader.HEADER_LINE_DESCR_RE)
+
+
+def assert_same_as_regex(line):
+    try:
+        expected = read_header_line_regex(line)
+    except AttributeError:
+        with pytest.raises(AttributeError):
+            reader.read_header_line(line)
+    else:
+        assert reader.read_header_line(line) == expected, repr(line)
+
+
+def test_odd_lines_match_regex():
+    for line in ODD_LINES:
+        assert_same_as_regex(line)
+
+
+def test_example_header_lines_match_regex():
+    for fn in sorted(os.listdir(examples_dir)):
+        with open(readfromexamples(fn), "r") as f:
+            contents = reader.read_file_contents(f, [], [], ignore_data=True)
+        for section in contents[0].values():
+            if section["section_type"] != "header":
+                continue
+            for line in section["lines"]:
+                assert_same_as_regex(line)
+
+
+def test_unparseable_line_raises():
+    with pytest.raises(AttributeError):
+        reader.read_header_line("NO DOT : HERE")
+
+
+def test_num():
+    parser = reader.SectionParser("~P")
+    assert parser.num("10") == 10
+    assert parser.num("1670,5") == 1670.5
+    assert parser.num("-999.25") == -999.25
+    assert parser.num("nan") == "nan"
+    assert parser.num("ABC") == "ABC"
+    assert parser.num("ABC", default=0) == 0
+    assert parser.num(None) is None
@@ -0,0 +1,59 @@
+import os, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+import json
+import subprocess
+
+import lascheck
+from lascheck import defaults, reader
+
+package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules which are only imported when the parts of lascheck using them are.
+LAZY_MODULES = [
+    "openpyxl",
+    "chardet",
+    "cchardet",
+    "numpy",
+    "pandas",
+    "json",
+    "sqlite3",
+    "hashlib",
+    "urllib.request",
+    "asyncio",
+    "concurrent.futures",
+    "lascheck.encoder",
+    "lascheck.cache",
+]
+
+
+def run_python(code):
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=package_dir,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+
+
+def test_lazy_modules_not_imported():
+    code = "import sys, lascheck; print(repr(sorted(sys.modules)))"
+    modules = eval(run_python(code).stdout)
+    assert [name for name in LAZY_MODULES if name in modules] == []
+
+
+def test_patterns_are_compiled():
+    assert reader.URL_REGEXP.match("https://example.com/a.las")
+    pattern, sub = defaults.READ_SUBS["comma-decimal-mark"][0]
+    assert pattern.sub(sub, "1,5") == "1.5"
+    pattern, sub = defaults.NULL_SUBS["(null)"][0]
+    assert pattern.sub(sub, "1 (null)") == "1 NaN"
+
+
+def test_json_encoder():
+    las = lascheck.read(os.path.join(package_dir, "tests", "examples", "sample.las"))
+    obj = json.loads(json.dumps(las, cls=lascheck.JSONEncoder))
+    assert obj["data"]["DEPT"] == list(las["DEPT"])
+    assert lascheck.las.JSONEncoder is lascheck.JSONEncoder
@@ -0,0 +1,226 @@
+import os, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+import pickle
+
+import pytest
+
+import lascheck
+from lascheck import reader
+from lascheck import CompactCurveItem, CompactHeaderItem, CurveItem, HeaderItem, SectionItems
+
+readfromexamples = lambda fn: os.path.join(os.path.dirname(__file__), "examples", fn)
+
+
+def make_section(*mnemonics, **kwargs):
+    section = SectionItems()
+    section.mnemonic_transforms = kwargs.get("transforms", False)
+    item_class = kwargs.get("item_class", HeaderItem)
+    for mnemonic in mnemonics:
+        section.append(item_class(mnemonic, value=mnemonic.lower()))
+    return section
+
+
+def test_lookup_by_mnemonic():
+    section = make_section("STRT", "STOP", "STEP")
+    assert "STOP" in section
+    assert "stop" not in section
+    assert section["STEP"].value == "step"
+    assert section[0].mnemonic == "STRT"
+    with pytest.raises(KeyError):
+        section["NULL"]
+
+
+def test_lookup_with_mnemonic_transforms():
+    section = make_section("STRT", "STOP", transforms=True)
+    assert "stop" in section
+    assert section["Stop"].mnemonic == "STOP"
+
+
+def test_contains_item():
+    section = make_section("STRT")
+    assert HeaderItem("STRT") in section
+    assert HeaderItem("STOP") not in section
+
+
+def test_lookup_after_insert_and_delete():
+    section = make_section("STRT", "STOP")
+    section.insert(0, HeaderItem("NULL", value=-999.25))
+    assert section["NULL"].value == -999.25
+    assert section["STOP"] is section[2]
+    del section["NULL"]
+    assert "NULL" not in section
+    assert section["STOP"] is section[1]
+    del section[0]
+    assert "STRT" not in section
+    section.pop()
+    assert "STOP" not in section
+
+
+def test_lookup_after_rename():
+    section = make_section("STRT", "STOP")
+    assert "STRT" in section
+    section["STRT"].mnemonic = "START"
+    assert "STRT" not in section
+    assert section["START"].value == "strt"
+
+
+def test_lookup_duplicate_mnemonics():
+    section = make_section("RES", "RES", "RES")
+    assert section.keys() == ["RES:1", "RES:2", "RES:3"]
+    assert "RES" not in section
+    assert section["RES:2"] is section[1]
+    section.set_item("RES:2", HeaderItem("GR"))
+    assert section["GR"] is section[1]
+    assert "RES:2" not in section
+
+
+def test_lookup_after_switching_transforms():
+    section = make_section("STRT")
+    assert "strt" not in section
+    section.mnemonic_transforms = True
+    assert "strt" in section
+
+
+def test_pickle_section():
+    section = make_section("STRT", "STOP", transforms=True)
+    assert "stop" in section
+    copy = pickle.loads(pickle.dumps(section))
+    assert copy.keys() == ["STRT", "STOP"]
+    assert copy["stop"].value == "stop"
+
+
+@pytest.mark.parametrize(
+    "item_class, compact_class",
+    [(HeaderItem, CompactHeaderItem), (CurveItem, CompactCurveItem)],
+)
+def test_compact_item_api(item_class, compact_class):
+    item = item_class("", "M", 1.5, "Descr", data=[1.0, 2.0])
+    compact = compact_class("", "M", 1.5, "Descr", data=[1.0, 2.0])
+    for key in ("mnemonic", "original_mnemonic", "useful_mnemonic", "unit", "value", "descr"):
+        assert compact[key] == item[key]
+        assert getattr(compact, key) == getattr(item, key)
+    assert compact.data == item.data
+    assert compact.json == item.json.replace(item_class.__name__, compact_class.__name__)
+    with pytest.raises(KeyError):
+        compact["data"]
+    with pytest.raises(ValueError):
+        compact.useful_mnemonic = "X"
+    with pytest.raises(AttributeError):
+        compact.other = 1
+    assert not hasattr(compact, "__dict__")
+
+
+def test_compact_item_rename():
+    item = CompactHeaderItem("STRT")
+    item.mnemonic = "START"
+    assert (item.mnemonic, item.original_mnemonic) == ("START", "START")
+    item.mnemonic = ""
+    assert (item.mnemonic, item.original_mnemonic) == ("UNKNOWN", "")
+
+
+def test_compact_items_in_section():
+    section = make_section("RHO", "STOP", "RHO", item_class=CompactHeaderItem)
+    assert section.keys() == ["RHO:1", "STOP", "RHO:2"]
+    section.STOP = "stop2"
+    assert section["STOP"].value == "stop2"
+    section["STOP"] = CompactHeaderItem("STOP", value=3)
+    assert section["STOP"].value == 3
+    copy = pickle.loads(pickle.dumps(section))
+    assert copy.keys() == ["RHO:1", "STOP", "RHO:2"]
+    assert [item.original_mnemonic for item in copy] == ["RHO", "STOP", "RHO"]
+
+
+def test_read_compact_items():
+    las = lascheck.read(readfromexamples("sample.las"))
+    compact = lascheck.read(readfromexamples("sample.las"), compact_items=True)
+    for name in ("Version", "Well", "Curves", "Parameter"):
+        assert [type(item) for item in compact.sections[name]] == [
+            CompactCurveItem if name == "Curves" else CompactHeaderItem
+        ] * len(las.sections[name])
+        assert compact.sections[name].json == las.sections[name].json.replace(
+            '\\"_type\\": \\"', '\\"_type\\": \\"Compact'
+        )
+    assert compact.get_non_conformities() == las.get_non_conformities()
+    compact.well.STRT.value = 1670.01
+    assert compact.get_non_conformities() != las.get_non_conformities()
+
+
+def test_duplicate_suffixes_on_append():
+    section = make_section("RHO", "DT", "RHO", "rho", "RHO")
+    assert section.keys() == ["RHO:1", "DT", "RHO:2", "rho", "RHO:3"]
+    section = make_section("RHO", "DT", "RHO", "rho", "RHO", transforms=True)
+    assert section.keys() == ["RHO:1", "DT", "RHO:2", "rho:3", "RHO:4"]
+
+
+def test_duplicate_suffixes_after_rename_and_insert():
+    section = make_section("A", "B")
+    section[1].mnemonic = "A"
+    section.append(HeaderItem("A"))
+    assert section.keys() == ["A:1", "A:2", "A:3"]
+    section.insert(1, HeaderItem("A"))
+    assert section.keys() == ["A:1", "A:2", "A:3", "A:4"]
+    assert [item.original_mnemonic for item in section] == ["A", "A", "A", "A"]
+    section.append(HeaderItem("A"))
+    assert section.keys()[-1] == "A:5"
+
+
+def test_assign_duplicate_suffixes_to_all():
+    section = SectionItems([HeaderItem("X"), HeaderItem("Y"), HeaderItem("X"), HeaderItem("")])
+    section.assign_duplicate_suffixes()
+    assert section.keys() == ["X:1", "Y", "X:2", "UNKNOWN"]
+    section.append(HeaderItem("Y"))
+    section.append(HeaderItem("X"))
+    assert section.keys() == ["X:1", "Y:1", "X:2", "UNKNOWN", "Y:2", "X:3"]
+
+
+def test_parse_section_with_duplicates():
+    mnemonics = ["DEPT"] + ["RES"] * 3 + ["GR", "res", "GR"]
+    sectdict = {
+        "title": "~Curve Information",
+        "lines": ["{}.OHMM : curve".format(mnemonic) for mnemonic in mnemonics],
+        "line_nos": list(range(2, 2 + len(mnemonics))),
+    }
+    section = reader.parse_header_section(sectdict, version=2.0, mnemonic_case="upper")
+    assert section.keys() == ["DEPT", "RES:1", "RES:2", "RES:3", "GR:1", "RES:4", "GR:2"]
+    section = reader.parse_header_section(sectdict, version=2.0)
+    assert section.keys() == ["DEPT", "RES:1", "RES:2", "RES:3", "GR:1", "res", "GR:2"]
+
+
+def test_modifications_counted_per_section():
+    section = make_section("STRT", "STOP")
+    other = make_section("NULL")
+    before = section.modifications, other.modifications
+    HeaderItem("STRT")
+    other.append(HeaderItem("STEP"))
+    assert section.modifications == before[0]
+    section["STOP"].value = 10
+    assert section.modifications > before[0]
+    item = section.pop()
+    modifications = section.modifications
+    item.value = 20
+    assert section.modifications == modifications
+
+
+def test_lookup_after_rename_in_two_sections():
+    section = make_section("STRT", "STOP")
+    view = section[0:2]
+    assert "STRT" in view
+    section["STRT"].mnemonic = "START"
+    assert "START" in view and "STRT" not in view
+    assert "START" in section
+
+
+def test_create_and_append_linear_time():
+    import time
+
+    def append_curves(n):
+        start = time.perf_counter()
+        section = SectionItems()
+        for i in range(n):
+            section.append(CurveItem("RES"))
+        assert section[-1].mnemonic == "RES:%d" % n
+        return time.perf_counter() - start
+
+    append_curves(1000)
+    assert append_curves(8000) < 8 * 4 * append_curves(1000) + 0.1
@@ -0,0 +1,150 @@
+import os, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "benchmarks"))
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import lascheck
+from lascheck import parallel, reader
+from lascheck.data import DataSummary
+
+import synthetic
+
+readfromexamples = lambda fn: os.path.join(os.path.dirname(__file__), "examples", fn)
+
+
+def parse_both(path, chunk_bytes):
+    """Parse the ~A section of **path** on one core and on two, and return
+    the data, summary and state of each."""
+    las = lascheck.read(path, ignore_data=True)
+    ncurves = len(las.curves)
+    regexp_subs = las._read_subs[0]
+    wrapped = las._wrapped()
+    results = []
+    for use_parallel in (False, True):
+        summary = DataSummary(ncurves, wrapped=wrapped)
+        state = reader.DataChunkState()
+        kwargs = dict(summary=summary, wrapped=wrapped, state=state)
+        if use_parallel:
+            chunks = parallel.iter_data_chunks(
+                path, las._data_section, ncurves, regexp_subs, las._null_subs(),
+                workers=2, chunk_bytes=chunk_bytes, **kwargs)
+        else:
+            chunks = reader.iter_data_chunks(
+                las._data_section, ncurves, regexp_subs, las._null_subs(),
+                rows=7, **kwargs)
+        chunks = list(chunks)
+        data = np.concatenate([block for line_no, block in chunks])
+        results.append((chunks[0][0], data, vars(summary), state.nrows))
+    return results
+
+
+def test_split_ranges_at_line_ends(tmp_path):
+    path = tmp_path / "lines.txt"
+    path.write_bytes(b"".join(b"x" * (i % 7) + b"\n" for i in range(100)))
+    content = path.read_bytes()
+    chunks = parallel.split_ranges(str(path), [(3, len(content), 5)], chunk_bytes=10)
+    assert chunks[0] == (3, chunks[0][1], 5)
+    assert all(line_no is None for start, end, line_no in chunks[1:])
+    assert [end for start, end, line_no in chunks[:-1]] == [start for start, end, line_no in chunks[1:]]
+    assert chunks[-1][1] == len(content)
+    assert all(content[end - 1:end] == b"\n" for start, end, line_no in chunks)
+
+
+@pytest.mark.parametrize("chunk_bytes", [1, 50, 333, 10 ** 7])
+@pytest.mark.parametrize("options", [
+    dict(),
+    dict(wrap=True),
+    dict(defects=["short_row", "non_ascii", "non_monotonic"]),
+    dict(wrap=True, defects=["short_row", "non_ascii", "non_monotonic"]),
+])
+def test_same_as_one_core(tmp_path, chunk_bytes, options):
+    path = str(tmp_path / "synthetic.las")
+    synthetic.write_las(path, curves=5, rows=300, **options)
+    one_core, two_cores = parse_both(path, chunk_bytes)
+    assert one_core[0] == two_cores[0]
+    assert np.array_equal(one_core[1], two_cores[1], equal_nan=True)
+    assert one_core[2:] == two_cores[2:]
+
+
+def test_blank_lines_and_comments(tmp_path):
+    path = tmp_path / "blank.las"
+    text = open(readfromexamples("blank_line_in_ascii_section.las")).read()
+    path.write_text(text + "# comment\n\n1669.500 1 2 3 4 5 6 7\n")
+    one_core, two_cores = parse_both(str(path), chunk_bytes=20)
+    assert np.array_equal(one_core[1], two_cores[1], equal_nan=True)
+    assert one_core[2:] == two_cores[2:]
+
+
+def test_read_with_data_workers(tmp_path, monkeypatch):
+    path = str(tmp_path / "synthetic.las")
+    synthetic.write_las(path, curves=4, rows=500, defects=["short_row", "non_monotonic"])
+    expected = lascheck.read(path, check_data=True)
+    monkeypatch.setattr(parallel, "CHUNK_BYTES", 1000)
+    las = lascheck.read(path, check_data=True, data_workers=2)
+    assert las._parse_in_parallel()
+    assert np.array_equal(las.data, expected.data, equal_nan=True)
+    assert las.get_non_conformities() == expected.get_non_conformities() != []
+    assert lascheck.validate(path, check_data=True, data_workers=2) == expected.get_non_conformities()
+
+
+def test_small_sections_read_on_one_core(tmp_path):
+    las = lascheck.read(readfromexamples("sample.las"), data_workers=4)
+    assert not las._parse_in_parallel()
+    assert las.data.shape == (3, 8)
+
+
+def test_shared_array(tmp_path):
+    values = np.array([1.5, np.nan, -3.0])
+    shared = parallel.SharedArray.from_array(str(tmp_path), values)
+    attached = shared.attach()
+    assert type(attached) is np.ndarray
+    assert np.array_equal(attached, values, equal_nan=True)
+    assert list(tmp_path.iterdir()) == []
+    attached[0] = 2.0
+    empty = parallel.SharedArray.from_array(str(tmp_path), np.empty(0, dtype=int))
+    assert empty.attach().dtype == int
+
+
+def test_blocks_are_views_of_shared_arrays(tmp_path, monkeypatch):
+    monkeypatch.setattr(parallel, "SHARED_DIR", str(tmp_path))
+    path = str(tmp_path / "synthetic.las")
+    synthetic.write_las(path, curves=4, rows=500)
+    las = lascheck.read(path, ignore_data=True)
+    chunks = parallel.iter_data_chunks(
+        path, las._data_section, 4, las._read_subs[0], las._null_subs(),
+        workers=2, chunk_bytes=2000)
+    line_no, block = next(chunks)
+    assert isinstance(block.base, np.ndarray) and not block.flags.owndata
+    assert len(os.listdir(str(tmp_path))) == 2
+    chunks.close()
+    assert os.listdir(str(tmp_path)) == ["synthetic.las"]
+    assert block.shape[1] == 4 and np.isfinite(block).all()
+
+
+def mapping(array):
+    """Return the np.memmap which **array** is a view of, or None."""
+    base = array.base
+    while isinstance(base, np.ndarray) and not isinstance(base, np.memmap):
+        base = base.base
+    return base if isinstance(base, np.memmap) else None
+
+
+def test_curve_data_is_mapped(tmp_path, monkeypatch):
+    monkeypatch.setattr(parallel, "SHARED_DIR", str(tmp_path))
+    monkeypatch.setattr(parallel, "CHUNK_BYTES", 1000)
+    path = str(tmp_path / "synthetic.las")
+    synthetic.write_las(path, curves=4, rows=500, defects=["short_row"])
+    expected = lascheck.read(path, check_data=True)
+    las = lascheck.read(path, check_data=True, data_workers=2)
+    data = las.curves[2].data
+    assert mapping(data) is not None
+    assert all(mapping(curve.data) is mapping(data) for curve in las.curves)
+    assert np.array_equal(las.data, expected.data, equal_nan=True)
+    assert vars(las.data_summary) == vars(expected.data_summary)
+    assert las.get_non_conformities() == expected.get_non_conformities() != []
+    assert os.listdir(str(tmp_path)) == ["synthetic.las"]
+    data[0] = -1.0
+    assert las.data[0, 2] == -1.0
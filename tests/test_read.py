@@ -0,0 +1,95 @@
+import os, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+import pickle
+
+import lascheck
+from lascheck import reader
+
+examples_dir = os.path.join(os.path.dirname(__file__), "examples")
+
+readfromexamples = lambda fn: os.path.join(examples_dir, fn)
+
+
+def read_from_string(fn):
+    with open(readfromexamples(fn), "r") as f:
+        return lascheck.read(f.read())
+
+
+def test_read_file_index_matches_read_file_contents():
+    for fn in sorted(os.listdir(examples_dir)):
+        las = lascheck.read(readfromexamples(fn))
+        from_string = read_from_string(fn)
+        assert list(las.sections.keys()) == list(from_string.sections.keys()), fn
+        assert las.json == from_string.json, fn
+        assert las.get_non_conformities() == from_string.get_non_conformities(), fn
+
+
+def test_read_file_index_line_nos():
+    contents = reader.read_file_index(readfromexamples("sample.las"), "ascii")
+    raw_sections = contents[0]
+    well = raw_sections["~WELL INFORMATION BLOCK"]
+    assert well["line_no"] == 4
+    assert well["line_nos"][0] == 7
+    assert well["lines"][0] == "STRT.M        1670.000000:"
+
+
+def test_read_file_index_unsupported_encoding():
+    assert reader.read_file_index(readfromexamples("sample.las"), "utf-16") is None
+
+
+def test_sections_parsed_on_first_access():
+    las = lascheck.read(readfromexamples("sample.las"))
+    assert not las.sections.is_loaded("Parameter")
+    assert not las.sections.is_loaded("Other")
+    assert las.v_section_first
+    assert "Parameter" in las.sections
+    assert not las.sections.is_loaded("Parameter")
+    assert las.params["BHT"].value == 35.5
+    assert las.sections.is_loaded("Parameter")
+
+
+def test_index_unit():
+    las = lascheck.read(readfromexamples("sample.las"))
+    assert las.index_unit == "M"
+    las = lascheck.read(readfromexamples("sample.las"), index_unit="ft")
+    assert las.index_unit == "ft"
+
+
+def test_pickle_lazy_sections():
+    las = lascheck.read(readfromexamples("sample.las"))
+    copy = pickle.loads(pickle.dumps(las))
+    assert copy.params["BHT"].value == 35.5
+    assert copy.get_non_conformities() == []
+
+
+def test_detect_encoding():
+    assert reader.detect_encoding(b"\xef\xbb\xbf~VERSION\n", encoding="latin-1") == "utf-8-sig"
+    assert reader.detect_encoding(b"~VERSION\n", encoding="cp1252") == "cp1252"
+    assert reader.detect_encoding(b"~V \x81\n", autodetect_encoding=False) == "latin-1"
+    assert reader.detect_encoding(b"~V \x80\n", autodetect_encoding=False) == "windows-1252"
+
+
+def test_utf8_bom(tmp_path):
+    path = tmp_path / "bom.las"
+    with open(readfromexamples("sample.las"), "rb") as f:
+        path.write_bytes(b"\xef\xbb\xbf" + f.read())
+    las = lascheck.read(str(path))
+    assert las.encoding == "utf-8-sig"
+    assert las.json == lascheck.read(readfromexamples("sample.las")).json
+
+
+def test_file_opened_once(monkeypatch):
+    import builtins
+
+    opened = []
+    builtin_open = builtins.open
+
+    def counting_open(*args, **kwargs):
+        opened.append(args[0])
+        return builtin_open(*args, **kwargs)
+
+    monkeypatch.setattr(builtins, "open", counting_open)
+    assert lascheck.validate(readfromexamples("sample.las")) == []
+    # Once to index the file, once to read the sections before ~A.
+    assert len(opened) == 2
@@ -0,0 +1,74 @@
+import os, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+import lascheck
+from lascheck import report, spec
+
+readfromexamples = lambda fn: os.path.join(os.path.dirname(__file__), "examples", fn)
+
+
+def test_report_results():
+    las = lascheck.read(readfromexamples("sample_duplicate_sections.las"))
+    conformity_report = las.get_conformity_report()
+    assert [result.rule for result in conformity_report] == spec.RULES
+    assert not conformity_report.conforming
+    assert conformity_report["DuplicateSections"].passed is False
+    assert conformity_report[spec.VSectionFirst].passed is True
+    assert conformity_report.non_conformities == las.get_non_conformities()
+    assert all(result.seconds >= 0 for result in conformity_report)
+
+
+def test_skipped_rule():
+    las = lascheck.read(readfromexamples("missing_curves_section.las"))
+    conformity_report = las.get_conformity_report()
+    assert conformity_report["ValidIndexMnemonic"].passed is None
+    assert conformity_report["ValidIndexMnemonic"].messages == []
+
+
+def test_rules_run_once(monkeypatch):
+    calls = []
+    check = spec.VSectionFirst.check
+    monkeypatch.setattr(
+        spec.VSectionFirst, "check", staticmethod(lambda las: calls.append(1) or check(las))
+    )
+    las = lascheck.read(readfromexamples("sample_duplicate_sections.las"))
+    first = las.get_non_conformities()
+    assert las.get_non_conformities() == first
+    assert not las.check_conformity()
+    assert len(first) == 5
+    assert len(calls) == 1
+
+
+def test_report_kept_after_other_files_change(monkeypatch):
+    calls = []
+    run_rules = report.run_rules
+    monkeypatch.setattr(report, "run_rules", lambda las, rules: calls.append(las) or run_rules(las, rules))
+    las = lascheck.read(readfromexamples("sample.las"))
+    las.get_non_conformities()
+    other = lascheck.read(readfromexamples("sample2.las"))
+    other.well["STRT"].value = 1.0
+    other.get_non_conformities()
+    lascheck.HeaderItem("FOO")
+    las.get_non_conformities()
+    assert [l for l in calls if l is las] == [las]
+
+
+def test_report_updated_after_modification():
+    las = lascheck.read(readfromexamples("sample.las"))
+    assert las.check_conformity()
+    las.well["STRT"].value = 1670.3
+    assert las.get_non_conformities() == ["STRT divided by step is not a whole number"]
+    las.well["STRT"] = 1670.0
+    assert las.check_conformity()
+    las.curves[0].mnemonic = "MD"
+    assert not las.check_conformity()
+    del las.sections["Version"]
+    assert "Missing mandatory sections: ['~V']" in las.get_non_conformities()
+
+
+def test_run_rules_subset():
+    las = lascheck.read(readfromexamples("sample_v_section_second.las"))
+    conformity_report = report.run_rules(las, rules=[spec.VSectionFirst])
+    assert len(conformity_report) == 1
+    assert conformity_report.non_conformities == ["~v section not first"]
@@ -0,0 +1,66 @@
+import os, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+import codecs
+
+from lascheck import reader, scanner
+
+examples_dir = os.path.join(os.path.dirname(__file__), "examples")
+
+readfromexamples = lambda fn: os.path.join(examples_dir, fn)
+
+
+def read_contents(fn):
+    with codecs.open(readfromexamples(fn), mode="r", encoding="ascii") as f:
+        return reader.read_file_contents(f, [], [])
+
+
+def test_scan_file_matches_read_file_contents():
+    for fn in sorted(os.listdir(examples_dir)):
+        (raw_sections, sections_after_a_section, v_section_first,
+         blank_line_in_section, sections_with_blank_line) = read_contents(fn)
+        index = scanner.scan_file(readfromexamples(fn))
+        assert index.sections_after_a_section == sections_after_a_section, fn
+        assert index.v_section_first == v_section_first, fn
+        assert index.blank_line_in_section == blank_line_in_section, fn
+        assert index.sections_with_blank_line == sections_with_blank_line, fn
+        for extent in index.sections:
+            title = extent.title.decode("ascii")
+            if title in raw_sections and raw_sections[title]["line_nos"]:
+                assert extent.nlines == raw_sections[title]["nlines"], (fn, title)
+                assert extent.line_no < raw_sections[title]["line_nos"][0]
+
+
+def test_scan_extents():
+    index = scanner.scan_file(readfromexamples("blank_line_in_ascii_section.las"))
+    with open(readfromexamples("blank_line_in_ascii_section.las"), "rb") as f:
+        contents = f.read()
+    titles = [extent.title[:2] for extent in index.sections]
+    assert titles == [b"~V", b"~W", b"~C", b"~P", b"~O", b"~A"]
+    ascii_section = index.sections[-1]
+    assert ascii_section.end == len(contents)
+    assert contents[ascii_section.start:].startswith(b"1670.000")
+    assert ascii_section.nlines == 3
+    assert ascii_section.blank_line_nos == [ascii_section.line_no + 2]
+    assert index.sections[1].comment_line_nos == [5, 6]
+
+
+def test_scan_crlf_and_trailing_whitespace():
+    index = scanner.scan(b"~V\r\nVERS. 2.0 :\r\n  \r\n~A\r\n1 2\r\n3 4\r\n   ")
+    assert [s.nlines for s in index.sections] == [1, 2]
+    assert [s.blank_line_nos for s in index.sections] == [[3], [7]]
+    assert index.sections_with_blank_line == ["~V", "~A"]
+
+
+def test_scan_empty():
+    index = scanner.scan(b"")
+    assert index.sections == []
+    assert not index.v_section_first
+    assert not index.sections_after_a_section
+
+
+def test_scan_utf8_bom():
+    index = scanner.scan(codecs.BOM_UTF8 + b"~V\nVERS. 2.0 :\n~A\n1 2\n")
+    assert index.start == 3
+    assert [s.title for s in index.sections] == [b"~V", b"~A"]
+    assert index.v_section_first
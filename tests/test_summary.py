@@ -0,0 +1,94 @@
+import os, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "benchmarks"))
+import pickle
+
+import pytest
+
+import lascheck
+from lascheck.summary import FLAGS, LASSummary
+
+import synthetic
+
+readfromexamples = lambda fn: os.path.join(os.path.dirname(__file__), "examples", fn)
+
+
+def test_summary_of_example():
+    las = lascheck.read(readfromexamples("sample_duplicate_sections.las"))
+    summary = pickle.loads(pickle.dumps(las.to_summary()))
+    assert isinstance(summary, LASSummary)
+    assert summary.path == readfromexamples("sample_duplicate_sections.las")
+    assert summary.conforming == las.check_conformity() is False
+    assert summary.get_non_conformities() == las.get_non_conformities()
+    assert summary.report["ValidIndexMnemonic"].passed
+    for name in FLAGS:
+        assert getattr(summary, name) == getattr(las, name)
+    assert list(summary.sections) == list(las.sections)
+    assert summary.well["STRT"].value == las.well["STRT"].value
+    assert [c.mnemonic for c in summary.curves] == [c.mnemonic for c in las.curves]
+    assert summary.sections["Ascii"] == ""
+
+
+def test_summary_curves_have_no_data():
+    las = lascheck.read(readfromexamples("sample.las"))
+    summary = las.to_summary()
+    assert all(len(curve.data) == 0 for curve in summary.curves)
+    assert len(las.curves[0].data) == 3
+    summary.well["WELL"].value = "CHANGED"
+    assert las.well["WELL"].value != "CHANGED"
+
+
+def test_summary_is_small(tmp_path):
+    path = str(tmp_path / "long.las")
+    synthetic.write_las(path, curves=10, rows=5000)
+    las = lascheck.read(path, check_data=True)
+    summary = pickle.loads(pickle.dumps(las.to_summary()))
+    assert len(pickle.dumps(summary)) < 10000 < os.path.getsize(path)
+    assert summary.data_summary.nrows == 5000
+    assert summary.non_conformities == []
+
+
+def test_summary_compact_items():
+    las = lascheck.read(readfromexamples("sample.las"), compact_items=True)
+    summary = pickle.loads(pickle.dumps(las.to_summary()))
+    assert type(summary.curves[0]) is lascheck.CompactCurveItem
+    assert summary.curves[0].mnemonic == "DEPT"
+
+
+def test_pickled_file_leaves_out_lines(tmp_path):
+    np = pytest.importorskip("numpy")
+    path = str(tmp_path / "long.las")
+    synthetic.write_las(path, curves=10, rows=5000)
+    for file_ref in (path, open(path).read()):
+        las = lascheck.read(file_ref, check_data=True)
+        expected = las.get_non_conformities()
+        data = pickle.dumps(las)
+        assert len(data) < las.data.nbytes + 10000
+        copy = pickle.loads(data)
+        assert np.array_equal(copy.data, las.data)
+        assert copy.get_non_conformities() == expected
+        assert copy.sections["Ascii"] == ""
+
+
+def test_pickled_file_reads_data_again(tmp_path):
+    np = pytest.importorskip("numpy")
+    path = str(tmp_path / "long.las")
+    synthetic.write_las(path, curves=4, rows=100)
+    las = lascheck.read(path)
+    copy = pickle.loads(pickle.dumps(las))
+    assert "lines" not in copy._data_section
+    blocks = [block for line_no, block in copy.iter_data_chunks()]
+    assert np.array_equal(np.concatenate(blocks), las.data)
+
+
+def test_pickled_file_refresh(tmp_path):
+    pytest.importorskip("numpy")
+    path = str(tmp_path / "live.las")
+    synthetic.write_las(path, curves=3, rows=50)
+    copy = pickle.loads(pickle.dumps(lascheck.read(path, check_data=True)))
+    with open(path, "a") as f:
+        f.write("9999 1 2\n")
+    copy.refresh()
+    assert copy.data.shape == (51, 3)
+    assert copy.data_summary.nrows == 51
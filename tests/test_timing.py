@@ -0,0 +1,105 @@
+import os, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+import shutil
+import time
+
+import pytest
+
+import lascheck
+from lascheck import reader, spec, timing
+
+readfromexamples = lambda fn: os.path.join(os.path.dirname(__file__), "examples", fn)
+
+
+def test_timings_off_by_default():
+    las = lascheck.read(readfromexamples("sample.las"))
+    las.get_non_conformities()
+    assert las.timings is None
+    assert not timing.enabled()
+    assert timing.start() is None
+
+
+def test_timings_of_file_on_disk():
+    las = lascheck.read(readfromexamples("sample.las"), timings=True)
+    assert list(las.timings) == ["open_with_codecs", "open_file", "read_file_index"]
+    assert las.timings["open_file"] >= las.timings["open_with_codecs"]
+    las.get_non_conformities()
+    assert "parse_section:Version" in las.timings
+    assert "parse_section:Curves" in las.timings
+    for rule in spec.RULES:
+        assert "rule:" + rule.__name__ in las.timings
+    assert all(seconds >= 0 for seconds in las.timings.values())
+    assert not timing.enabled()
+
+
+def test_timings_of_string():
+    with open(readfromexamples("sample.las")) as f:
+        las = lascheck.read(f.read(), timings=True)
+    assert "read_file_contents" in las.timings
+    assert "open_with_codecs" not in las.timings
+
+
+def test_timings_of_data():
+    pytest.importorskip("numpy")
+    las = lascheck.read(readfromexamples("sample.las"), timings=True)
+    las.curves
+    assert las.timings["parse_section:Curves"] >= las.timings["read_data"]
+
+
+def test_timings_of_refresh(tmp_path):
+    pytest.importorskip("numpy")
+    path = str(tmp_path / "sample.las")
+    shutil.copy(readfromexamples("sample.las"), path)
+    las = lascheck.read(path, timings=True)
+    las.data
+    las.refresh()
+    assert "refresh" in las.timings
+
+
+def test_hook():
+    calls = []
+
+    def hook(phase, seconds):
+        calls.append((phase, seconds))
+
+    timing.add_hook(hook)
+    try:
+        assert timing.enabled()
+        las = lascheck.read(readfromexamples("sample.las"))
+        las.get_non_conformities()
+    finally:
+        timing.remove_hook(hook)
+    assert las.timings is None
+    phases = [phase for phase, seconds in calls]
+    assert phases[:3] == ["open_with_codecs", "open_file", "read_file_index"]
+    assert "rule:ValidIndexMnemonic" in phases
+    del calls[:]
+    lascheck.read(readfromexamples("sample.las")).get_non_conformities()
+    assert calls == []
+
+
+def test_timings_added_up():
+    timings = {}
+    with timing.collect(timings):
+        timing.record("phase", 1.0)
+        timing.stop("phase", timing.start())
+    assert timings["phase"] >= 1.0
+    assert not timing.enabled()
+
+
+def test_rules_leave_out_parsing(monkeypatch):
+    parse_header_section = reader.parse_header_section
+
+    def slow_parse(*args, **kwargs):
+        time.sleep(0.05)
+        return parse_header_section(*args, **kwargs)
+
+    monkeypatch.setattr(reader, "parse_header_section", slow_parse)
+    las = lascheck.read(readfromexamples("sample.las"), timings=True)
+    report = las.get_conformity_report()
+    parsed = [phase for phase in las.timings if phase.startswith("parse_section:")]
+    assert len(parsed) >= 3
+    assert all(las.timings[phase] >= 0.05 for phase in parsed)
+    assert all(result.seconds < 0.05 for result in report)
+    assert all(las.timings["rule:" + result.rule.__name__] < 0.05 for result in report)